@@ -13,6 +13,9 @@ export const uploadPayload = async (payload: string, articleId: string | undefin
 };
 
 export const getPayload = async (article_id: string) => {
-  const response = await axios.get<string>(`${server_url}/api/payload/${article_id}`);
+  // The payload is served as stored, keep it as text rather than letting axios parse it
+  const response = await axios.get<string>(`${server_url}/api/payload/${article_id}`, {
+    responseType: 'text',
+  });
   return response.data ?? null;
 };
@@ -9,16 +9,44 @@ type UploadFileRequest = {
 type UploadFileResponse = {
   message: string;
   path: string;
+  sha256: string;
+};
+
+const getSha256 = async (file: File) => {
+  // SubtleCrypto only exists in secure contexts, the file is then always uploaded
+  if (!window.crypto?.subtle) {
+    return null;
+  }
+  const digest = await window.crypto.subtle.digest('SHA-256', await file.arrayBuffer());
+  return Array.from(new Uint8Array(digest), (byte) => byte.toString(16).padStart(2, '0')).join('');
 };
 
 const uploadImage = async ({ articleId, file }: UploadFileRequest) => {
+  const server_url = import.meta.env.VITE_SERVER_URL ? import.meta.env.VITE_SERVER_URL : '';
+
+  // Files already stored by any article are only linked, not uploaded again
+  const sha256 = await getSha256(file);
+  if (sha256) {
+    try {
+      const response = await axios.post<UploadFileResponse>(`${server_url}/api/link-asset`, {
+        article_id: articleId,
+        filename: file.name,
+        content_type: file.type,
+        sha256,
+      });
+      return response.data;
+    } catch (error) {
+      if (!axios.isAxiosError(error) || error.response?.status !== 404) {
+        throw error;
+      }
+    }
+  }
+
   const formData = new FormData();
 
   formData.append('article_id', articleId);
   formData.append('file', file);
 
-  const server_url = import.meta.env.VITE_SERVER_URL ? import.meta.env.VITE_SERVER_URL : '';
-
   const response = await axios.post<UploadFileResponse>(`${server_url}/api/upload-file`, formData, {
     headers: {
       'Content-Type': 'multipart/form-data',
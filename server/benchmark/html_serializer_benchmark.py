@@ -0,0 +1,76 @@
+"""Compare the HTML output modes against the previous BeautifulSoup prettify path.
+
+Usage: python -m server.benchmark.html_serializer_benchmark [--pages 80] [--frames 5] [--repeat 5]
+"""
+
+import argparse
+import time
+from typing import Callable
+from typing import List
+
+from bs4 import BeautifulSoup
+
+from server.benchmark.synthetic_article import generate_article
+from server.content_generator import generate_page_html
+from server.model.html_output_mode import HtmlOutputMode
+from server.model.ir.page_ir import PageIR
+from server.utilities.article_lowering import lower_article
+from server.utilities.html_serializer import serialize_html
+from server.utilities.template_environment import TEMPLATE_ENVIRONMENT
+
+
+def build_pages(page_count: int, frame_count: int) -> List[PageIR]:
+    article = generate_article(
+        pages=page_count,
+        frames=frame_count,
+        templates={"left-right": 1},
+        component_types={"text": 1, "image": 1},
+        pinnable_ratio=1,
+    )
+    return list(lower_article(article).pages)
+
+
+def render_document(pages: List[PageIR]) -> str:
+    body_fragments = [generate_page_html(page, "benchmark") + "\n" for page in pages]
+    return TEMPLATE_ENVIRONMENT.get_template("index.html").render(
+        title="Benchmark", scroll_trigger=True, body_fragments=body_fragments
+    )
+
+
+def prettify_with_beautiful_soup(html_content: str) -> str:
+    soup = BeautifulSoup(html_content, "html.parser", preserve_whitespace_tags=["a", "u", "p"])
+    return soup.prettify()
+
+
+def time_best_of(function: Callable[[], str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=80)
+    parser.add_argument("--frames", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    html_content = render_document(build_pages(args.pages, args.frames))
+    candidates = {
+        "beautifulsoup-prettify": lambda: prettify_with_beautiful_soup(html_content),
+        "serializer-pretty": lambda: serialize_html(html_content, HtmlOutputMode.PRETTY),
+        "serializer-minified": lambda: serialize_html(html_content, HtmlOutputMode.MINIFIED),
+    }
+    print(f"Input: {len(html_content.encode()):,} bytes ({args.pages} pages x {args.frames} frames)")
+    print(f"{'mode':<24}{'best of ' + str(args.repeat):>14}{'output bytes':>16}")
+    for name, function in candidates.items():
+        seconds = time_best_of(function, args.repeat)
+        output_size = len(function().encode())
+        print(f"{name:<24}{seconds * 1000:>12.1f}ms{output_size:>16,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Time every stage of website generation on a synthetic article and compare against a stored baseline.
+
+Runs entirely against LOCAL storage in a scratch directory, without any network access.
+
+Usage: python -m server.benchmark.pipeline_benchmark [--pages 100] [--frames 3] [--save-baseline]
+"""
+
+import os
+
+# Must be set before the server modules read their configuration
+os.environ["BUCKET"] = "LOCAL"
+
+import argparse  # noqa: E402
+import json  # noqa: E402
+import sys  # noqa: E402
+import tempfile  # noqa: E402
+import time  # noqa: E402
+import tracemalloc  # noqa: E402
+from pathlib import Path  # noqa: E402
+from typing import Callable  # noqa: E402
+from typing import Dict  # noqa: E402
+from typing import Union  # noqa: E402
+
+from server.benchmark.synthetic_article import DEFAULT_COMPONENT_TYPE_WEIGHTS  # noqa: E402
+from server.benchmark.synthetic_article import DEFAULT_TEMPLATE_WEIGHTS  # noqa: E402
+from server.benchmark.synthetic_article import generate_article_payload  # noqa: E402
+from server.benchmark.synthetic_article import parse_weights  # noqa: E402
+from server.content_generator import generate_css_fragments  # noqa: E402
+from server.content_generator import generate_html  # noqa: E402
+from server.content_generator import generate_page_css  # noqa: E402
+from server.content_generator import generate_page_html  # noqa: E402
+from server.model.script.script_generator import ScriptGenerator  # noqa: E402
+from server.parser import process_pages  # noqa: E402
+from server.storage.local_storage_backend import LocalStorageBackend  # noqa: E402
+from server.storage.storage_backend_factory import StorageBackendFactory  # noqa: E402
+from server.utilities.article_lowering import parse_article_json  # noqa: E402
+from server.utilities.page_fragment_cache import PAGE_FRAGMENT_CACHE  # noqa: E402
+
+DEFAULT_BASELINE_PATH = Path(__file__).parent / "baseline.json"
+# Relative change above which a stage is reported as a regression
+DEFAULT_TOLERANCE = 0.25
+# Timing differences below this are noise, whatever their relative size
+MIN_TIME_REGRESSION_SECONDS = 0.005
+
+
+def directory_size(directory: Path) -> int:
+    return sum(path.stat().st_size for path in directory.rglob("*") if path.is_file())
+
+
+def measure(stage: Callable[[], Union[str, int]], repeat: int) -> Dict[str, float]:
+    """Best wall time of ``repeat`` runs, then one traced run for the peak Python heap and output size."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        stage()
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    output = stage()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    output_bytes = output if isinstance(output, int) else len(output.encode())
+    return {"seconds": best, "peak_memory_bytes": peak_memory, "output_bytes": output_bytes}
+
+
+def run_benchmark(parameters: dict, repeat: int, scratch_dir: Path) -> Dict[str, Dict[str, float]]:
+    payload_json = json.dumps(generate_article_payload(**parameters))
+    article = parse_article_json(payload_json)
+    article_id = article.article_id
+    pages = article.pages
+    page_htmls = [generate_page_html(page, article_id) + "\n" for page in pages]
+    page_csss = [generate_page_css(page) for page in pages]
+
+    StorageBackendFactory.set_storage_backend(LocalStorageBackend(scratch_dir))
+
+    def process_pages_cold() -> int:
+        PAGE_FRAGMENT_CACHE.clear()
+        process_pages(article_id, pages, article.title)
+        return directory_size(scratch_dir / article_id)
+
+    def process_pages_warm() -> int:
+        process_pages(article_id, pages, article.title)
+        return directory_size(scratch_dir / article_id)
+
+    stages: Dict[str, Callable[[], Union[str, int]]] = {
+        "validate": lambda: parse_article_json(payload_json).digest,
+        "page_html": lambda: "".join(generate_page_html(page, article_id) + "\n" for page in pages),
+        "index_html": lambda: generate_html("".join(page_htmls), article.title),
+        "page_css": lambda: "".join(generate_page_css(page) for page in pages),
+        "styles_css": lambda: "".join(generate_css_fragments(page_csss, page_htmls)),
+        "script": lambda: ScriptGenerator(pages, article_id).generate(),
+        "process_pages_cold": process_pages_cold,
+        "process_pages_warm": process_pages_warm,
+    }
+    return {name: measure(stage, repeat) for name, stage in stages.items()}
+
+
+def format_change(current: float, baseline: float) -> str:
+    if not baseline:
+        return ""
+    return f"{(current - baseline) / baseline:+.0%}"
+
+
+def compare_with_baseline(results: Dict[str, Dict[str, float]], baseline: dict, tolerance: float) -> int:
+    """Print the results next to the baseline and return the number of regressions."""
+    baseline_stages = baseline.get("stages", {})
+    regressions = 0
+    print(f"{'stage':<20}{'time':>10}{'':>7}{'peak memory':>14}{'':>7}{'output':>12}{'':>7}")
+    for name, result in results.items():
+        previous = baseline_stages.get(name, {})
+        changes = []
+        for metric in ("seconds", "peak_memory_bytes", "output_bytes"):
+            change = format_change(result[metric], previous.get(metric, 0))
+            if metric == "seconds" and result[metric] - previous.get(metric, 0) < MIN_TIME_REGRESSION_SECONDS:
+                regressed = False
+            else:
+                regressed = bool(previous.get(metric)) and result[metric] > previous[metric] * (1 + tolerance)
+            if regressed:
+                regressions += 1
+                change += "!"
+            changes.append(change)
+        print(
+            f"{name:<20}{result['seconds'] * 1000:>8.1f}ms{changes[0]:>7}"
+            f"{result['peak_memory_bytes'] / 1024:>12,.0f}KB{changes[1]:>7}"
+            f"{result['output_bytes']:>12,}{changes[2]:>7}"
+        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--frames", type=int, default=3)
+    parser.add_argument("--components", type=int, default=2)
+    parser.add_argument(
+        "--templates", type=parse_weights, default=DEFAULT_TEMPLATE_WEIGHTS, help="e.g. left-right=2,single=1"
+    )
+    parser.add_argument(
+        "--component-types", type=parse_weights, default=DEFAULT_COMPONENT_TYPE_WEIGHTS, help="e.g. text=2,image=1"
+    )
+    parser.add_argument("--pinnable-ratio", type=float, default=0.8)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    args = parser.parse_args()
+
+    parameters = {
+        "seed": args.seed,
+        "pages": args.pages,
+        "frames": args.frames,
+        "components": args.components,
+        "templates": args.templates,
+        "component_types": args.component_types,
+        "pinnable_ratio": args.pinnable_ratio,
+    }
+    with tempfile.TemporaryDirectory() as scratch_dir:
+        results = run_benchmark(parameters, args.repeat, Path(scratch_dir))
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if baseline.get("parameters") != parameters:
+            print(f"Baseline {args.baseline} was recorded with other parameters, not comparing")
+            baseline = {}
+
+    print(f"{args.pages} pages x {args.frames} frames x {args.components} components, seed {args.seed}")
+    regressions = compare_with_baseline(results, baseline, args.tolerance)
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps({"parameters": parameters, "stages": results}, indent=2) + "\n")
+        print(f"Saved baseline to {args.baseline}")
+    elif regressions:
+        print(f"{regressions} metric(s) regressed by more than {args.tolerance:.0%} against {args.baseline}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
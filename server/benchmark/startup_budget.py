@@ -0,0 +1,119 @@
+"""Check that importing the server stays within its start up budget and has no side effects.
+
+Imports the server in fresh interpreters with ``python -X importtime`` for every storage backend, and fails when the
+best import time exceeds the budget, when a storage client library is imported before the first storage call, or
+when the import creates files or directories.
+
+Usage: python -m server.benchmark.startup_budget [--budget-ms 1000] [--repeat 5] [--top 10]
+"""
+
+import argparse
+import os
+import re
+import subprocess  # noqa: S404
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+DEFAULT_MODULE = "server.main"
+DEFAULT_BUDGET_MS = 1000.0
+DEFAULT_BUCKETS = ["LOCAL", "MINIO", "S3"]
+# Only imported when the first storage call constructs a client
+LAZY_MODULES = ["boto3", "botocore", "s3transfer", "minio"]
+REPOSITORY_DIR = Path(__file__).parent.parent.parent
+LOCAL_OUTPUT_DIR = REPOSITORY_DIR / "server" / "output"
+# Served by the MinIO and S3 deployments, relative to the working directory
+FRONTEND_DIR = Path("frontend") / "dist"
+IMPORT_TIME_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def import_module(module: str, bucket: str, scratch_dir: Path) -> Tuple[Dict[str, Tuple[int, int]], List[str]]:
+    """
+    Self and cumulative import time in microseconds of every module imported by ``module`` in a fresh interpreter,
+    and the lazy modules that were imported anyway.
+    """
+    env = {
+        **os.environ,
+        "BUCKET": bucket,
+        "PYTHONPATH": str(REPOSITORY_DIR),
+        # Anything written there at import time is a side effect
+        "TEMPLATE_BYTECODE_CACHE_DIR": str(scratch_dir / "jinja"),
+        "ASSET_DISK_CACHE_DIR": str(scratch_dir / "assets"),
+    }
+    check_lazy_modules = f"import sys; print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}; {check_lazy_modules}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=scratch_dir,
+        check=False,
+    )
+    if result.returncode:
+        raise RuntimeError(f"Importing {module} with BUCKET={bucket} failed:\n{result.stderr}")
+    import_times = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match:
+            import_times[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return import_times, [name for name in result.stdout.strip().split(",") if name]
+
+
+def check_bucket(module: str, bucket: str, repeat: int, budget_ms: float, top: int) -> int:
+    """Print the import time of ``module`` with the given storage backend and return the number of violations."""
+    violations = 0
+    best_ms = float("inf")
+    best_import_times: Dict[str, Tuple[int, int]] = {}
+    output_dir_existed = LOCAL_OUTPUT_DIR.exists()
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as scratch_dir:
+            (Path(scratch_dir) / FRONTEND_DIR).mkdir(parents=True)
+            import_times, lazy_modules = import_module(module, bucket, Path(scratch_dir))
+            side_effects = sorted(
+                path.name for path in Path(scratch_dir).iterdir() if path.name != FRONTEND_DIR.parts[0]
+            )
+        elapsed_ms = import_times[module][1] / 1000
+        if elapsed_ms < best_ms:
+            best_ms = elapsed_ms
+            best_import_times = import_times
+        if lazy_modules:
+            print(f"{bucket}: {', '.join(lazy_modules)} imported at start up")
+            violations += 1
+            break
+        if side_effects or (not output_dir_existed and LOCAL_OUTPUT_DIR.exists()):
+            print(f"{bucket}: importing {module} created {', '.join(side_effects) or LOCAL_OUTPUT_DIR}")
+            violations += 1
+            break
+
+    status = "ok" if best_ms <= budget_ms else "OVER BUDGET"
+    print(f"{bucket}: import {module} {best_ms:.0f}ms, budget {budget_ms:.0f}ms {status}")
+    if best_ms > budget_ms:
+        violations += 1
+    slowest = sorted(best_import_times.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    for name, (self_us, cumulative_us) in slowest:
+        print(f"    {name:<60}{self_us / 1000:>8.1f}ms self {cumulative_us / 1000:>8.1f}ms cumulative")
+    return violations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument("--buckets", type=lambda value: value.split(","), default=DEFAULT_BUCKETS)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest modules to list")
+    args = parser.parse_args()
+
+    violations = sum(
+        check_bucket(args.module, bucket, args.repeat, args.budget_ms, args.top) for bucket in args.buckets
+    )
+    if violations:
+        print(f"{violations} start up budget violation(s)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
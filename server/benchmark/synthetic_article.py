@@ -0,0 +1,111 @@
+"""Seeded generator of synthetic Article payloads for benchmarks."""
+
+import random
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from server.model.article import Article
+from server.model.script.animation.animation_script_registry import BUILT_IN_ANIMATIONS
+
+TEMPLATE_POSITIONS: Dict[str, List[str]] = {
+    "left-right": ["left", "right"],
+    "top-bottom": ["top", "bottom"],
+    "single": ["center"],
+}
+DEFAULT_TEMPLATE_WEIGHTS = {"left-right": 2.0, "top-bottom": 1.0, "single": 1.0}
+DEFAULT_COMPONENT_TYPE_WEIGHTS = {"text": 2.0, "image": 2.0, "html": 1.0}
+WORDS = (
+    "story scroll frame river city data map chart island people climate market ocean signal night morning light "
+    "street voice archive season harbour bridge forest election festival journey"
+).split()
+
+
+def parse_weights(value: str) -> Dict[str, float]:
+    """Parse ``name=weight,name=weight`` command line arguments."""
+    weights = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        weights[name.strip()] = float(weight or 1)
+    return weights
+
+
+def generate_text(rng: random.Random) -> str:
+    paragraphs = []
+    for _ in range(rng.randint(1, 3)):
+        words = rng.choices(WORDS, k=rng.randint(12, 60))
+        words[0] = f"<strong>{words[0].capitalize()}</strong>"
+        words[-1] = f"<a href='#'>{words[-1]}</a>"
+        paragraphs.append(f"<p>{' '.join(words)}.</p>")
+    return "".join(paragraphs)
+
+
+def generate_component(rng: random.Random, component_id: str, component_type: str, position: str) -> dict:
+    component = {
+        "id": component_id,
+        "type": component_type,
+        "position": position,
+        # Built-in animations only, so that installed plugins do not change the payload
+        "animation": rng.choice(list(BUILT_IN_ANIMATIONS)),
+    }
+    if component_type == "text":
+        component["contentHtml"] = generate_text(rng)
+    elif component_type == "image":
+        component["image"] = {
+            "data": f"{component_id}.png",
+            "caption": " ".join(rng.choices(WORDS, k=6)) if rng.random() < 0.5 else None,
+            "isDisplayFullscreen": rng.random() < 0.2,
+        }
+    else:
+        component["html"] = {"data": f"{component_id}.html"}
+    return component
+
+
+def generate_article_payload(
+    seed: int = 0,
+    pages: int = 20,
+    frames: int = 3,
+    components: int = 2,
+    templates: Optional[Dict[str, float]] = None,
+    component_types: Optional[Dict[str, float]] = None,
+    pinnable_ratio: float = 0.8,
+) -> dict:
+    """
+    Article payload with ``pages`` x ``frames`` x ``components``, layouts and component types drawn from the
+    given weights. The same arguments always produce the same payload.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    templates = templates or DEFAULT_TEMPLATE_WEIGHTS
+    component_types = component_types or DEFAULT_COMPONENT_TYPE_WEIGHTS
+
+    page_payloads = []
+    for page_index in range(1, pages + 1):
+        page_id = f"{page_index:03d}"
+        template = rng.choices(list(templates), weights=list(templates.values()))[0]
+        positions = TEMPLATE_POSITIONS[template]
+        frame_payloads = []
+        for frame_index in range(1, frames + 1):
+            frame_id = f"{page_id}-{frame_index}"
+            frame_payloads.append({
+                "id": frame_id,
+                "components": [
+                    generate_component(
+                        rng,
+                        f"{frame_id}-{component_index + 1}",
+                        rng.choices(list(component_types), weights=list(component_types.values()))[0],
+                        positions[component_index % len(positions)],
+                    )
+                    for component_index in range(components)
+                ],
+            })
+        page_payloads.append({
+            "id": page_id,
+            "pinnable": rng.random() < pinnable_ratio,
+            "layout": {"template": template},
+            "frames": frame_payloads,
+        })
+    return {"articleId": f"synthetic-{seed}", "title": f"Synthetic article {seed}", "pages": page_payloads}
+
+
+def generate_article(seed: int = 0, **parameters: object) -> Article:
+    return Article.model_validate(generate_article_payload(seed, **parameters))
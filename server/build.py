@@ -0,0 +1,235 @@
+"""Rebuild many articles offline, rendering them in a pool of worker processes.
+
+Sources are saved payload.json files, directories searched for them, or article ids whose payload.json is read from
+the configured storage. Every built article is recorded in the state file, so an interrupted run picks up where it
+stopped when started again with the same generator code and templates.
+
+Usage: python -m server.build [--all] [--workers 8] [--no-publish] [--state build-state.jsonl] [SOURCE ...]
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import multiprocessing
+import operator
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from server.model.html_output_mode import HtmlOutputMode
+from server.parser import process_pages
+from server.storage.storage_backend_factory import StorageBackendFactory
+from server.utilities.article_lowering import parse_article_json
+from server.utilities.constants import ANIMATION_SCRIPT_MODE
+from server.utilities.constants import BUCKET
+from server.utilities.constants import GENERATION_WORKERS
+from server.utilities.constants import HTML_OUTPUT_MODE
+from server.utilities.generator_version import get_generator_version
+from server.utilities.saved_payload import to_article_payload
+from server.utilities.utils import copy_files
+
+logger = logging.getLogger(__name__)
+
+PAYLOAD_NAME = "payload.json"
+DEFAULT_STATE_PATH = Path("build-state.jsonl")
+# Submitted ahead of the workers, so that they never wait for the next article
+QUEUED_PER_WORKER = 2
+
+
+def get_generator_fingerprint(output_mode: HtmlOutputMode, *, publish: bool) -> str:
+    # A state file recorded with other generator sources or options is not resumed
+    fingerprint = f"{get_generator_version()}|{ANIMATION_SCRIPT_MODE}|{BUCKET}|{output_mode.value}|{publish}"
+    return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+
+def resolve_sources(sources: List[str], *, all_articles: bool) -> List[str]:
+    """Payload file paths and article ids, in order and without duplicates."""
+    resolved = []
+    for source in sources:
+        path = Path(source)
+        if path.is_dir():
+            resolved.extend(str(payload_path) for payload_path in sorted(path.rglob(PAYLOAD_NAME)))
+        elif path.is_file() or source.endswith(".json"):
+            resolved.append(str(path))
+        else:
+            resolved.append(source)
+    if all_articles:
+        resolved.extend(
+            stored_object.key.split("/", 1)[0]
+            for stored_object in StorageBackendFactory.get_storage_backend().list_objects("")
+            if stored_object.key.count("/") == 1 and stored_object.key.endswith(f"/{PAYLOAD_NAME}")
+        )
+    return list(dict.fromkeys(resolved))
+
+
+def read_state(state_path: Path, fingerprint: str) -> Dict[str, str]:
+    """Article digest by source of the articles already built with the same generator."""
+    if not state_path.exists():
+        return {}
+    built = {}
+    with state_path.open(encoding="utf-8") as file:
+        lines = [line for line in file if line.strip()]
+    if not lines or json.loads(lines[0]).get("fingerprint") != fingerprint:
+        logger.info(f"{state_path} was recorded with other generator sources or options, rebuilding everything")
+        return {}
+    for line in lines[1:]:
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            # The last line may have been cut short by the interruption
+            continue
+        built[entry["source"]] = entry["digest"]
+    return built
+
+
+def start_state(state_path: Path, fingerprint: str, built: Dict[str, str]) -> None:
+    if built:
+        return
+    with state_path.open("w", encoding="utf-8") as file:
+        file.write(json.dumps({"fingerprint": fingerprint}) + "\n")
+
+
+def configure_worker(log_level: int) -> None:
+    logging.getLogger("server").setLevel(log_level)
+
+
+def load_payload(source: str) -> bytes:
+    if source.endswith(".json"):
+        return Path(source).read_bytes()
+    return StorageBackendFactory.get_storage_backend().get(f"{source}/{PAYLOAD_NAME}")
+
+
+def build_article(
+    source: str, built_digest: Optional[str], output_mode: HtmlOutputMode, *, publish: bool
+) -> Tuple[str, str, Dict[str, float], Optional[str]]:
+    """Build one article in a worker: its id, payload digest, seconds per step and URL, None when unchanged."""
+    timings = {}
+    started = time.perf_counter()
+    document = json.loads(load_payload(source))
+    article = parse_article_json(json.dumps(to_article_payload(document)))
+    timings["load"] = time.perf_counter() - started
+    if article.digest == built_digest:
+        return article.article_id, article.digest, timings, None
+
+    started = time.perf_counter()
+    url = process_pages(article.article_id, article.pages, article.title, output_mode)
+    timings["render"] = time.perf_counter() - started
+    if publish:
+        started = time.perf_counter()
+        url = copy_files(article.article_id)
+        timings["publish"] = time.perf_counter() - started
+    return article.article_id, article.digest, timings, url
+
+
+def format_timings(timings: Dict[str, float]) -> str:
+    return ", ".join(f"{step} {seconds * 1000:.0f}ms" for step, seconds in timings.items())
+
+
+def run_builds(
+    sources: List[str],
+    built: Dict[str, str],
+    state_path: Path,
+    workers: int,
+    output_mode: HtmlOutputMode,
+    *,
+    publish: bool,
+    log_level: int,
+) -> Tuple[Dict[str, float], Dict[str, str], int]:
+    """Seconds per built article and error per failed source, with the number of unchanged articles skipped."""
+    durations: Dict[str, float] = {}
+    failures: Dict[str, str] = {}
+    skipped = 0
+    pending = list(reversed(sources))
+    in_flight: Dict[Future, str] = {}
+    # Spawn rather than fork, the parent may already run storage threads
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=configure_worker,
+        initargs=(log_level,),
+    ) as executor, state_path.open("a", encoding="utf-8") as state_file:
+        try:
+            while pending or in_flight:
+                while pending and len(in_flight) < workers * QUEUED_PER_WORKER:
+                    source = pending.pop()
+                    future = executor.submit(build_article, source, built.get(source), output_mode, publish=publish)
+                    in_flight[future] = source
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    source = in_flight.pop(future)
+                    try:
+                        article_id, digest, timings, url = future.result()
+                    except Exception as e:  # noqa: BLE001
+                        failures[source] = f"{type(e).__name__}: {e}"
+                        print(f"FAILED  {source}: {failures[source]}")
+                        continue
+                    if url is None:
+                        skipped += 1
+                        continue
+                    durations[article_id] = sum(timings.values())
+                    print(f"built   {article_id} in {durations[article_id] * 1000:.0f}ms ({format_timings(timings)})")
+                    state_file.write(json.dumps({"source": source, "article_id": article_id, "digest": digest}) + "\n")
+                    state_file.flush()
+        except KeyboardInterrupt:
+            executor.shutdown(wait=True, cancel_futures=True)
+            print(f"Interrupted with {len(pending) + len(in_flight)} article(s) left, run again to resume")
+            raise
+    return durations, failures, skipped
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sources", nargs="*", help="payload.json files, directories containing them or article ids")
+    parser.add_argument("--all", action="store_true", help="Every article with a payload.json in storage")
+    parser.add_argument("--workers", type=int, default=GENERATION_WORKERS)
+    parser.add_argument("--output-mode", type=HtmlOutputMode, default=HtmlOutputMode(HTML_OUTPUT_MODE))
+    parser.add_argument("--no-publish", dest="publish", action="store_false", help="Only build the private copy")
+    parser.add_argument("--state", type=Path, default=DEFAULT_STATE_PATH, help="Progress file used to resume")
+    parser.add_argument("--restart", action="store_true", help="Rebuild articles already recorded in --state")
+    parser.add_argument("--top", type=int, default=5, help="Number of slowest articles to list")
+    parser.add_argument("--verbose", action="store_true", help="Log from the workers at INFO level")
+    args = parser.parse_args()
+
+    sources = resolve_sources(args.sources, all_articles=args.all)
+    if not sources:
+        parser.error("no payload files or article ids to build")
+
+    fingerprint = get_generator_fingerprint(args.output_mode, publish=args.publish)
+    built = {} if args.restart else read_state(args.state, fingerprint)
+    start_state(args.state, fingerprint, built)
+    workers = max(1, min(args.workers, len(sources)))
+    print(f"Building {len(sources)} article(s) with {workers} worker(s), {len(built)} already built")
+
+    started = time.perf_counter()
+    try:
+        durations, failures, skipped = run_builds(
+            sources,
+            built,
+            args.state,
+            workers,
+            args.output_mode,
+            publish=args.publish,
+            log_level=logging.INFO if args.verbose else logging.WARNING,
+        )
+    except KeyboardInterrupt:
+        sys.exit(130)
+    elapsed = time.perf_counter() - started
+
+    print(f"Built {len(durations)}, unchanged {skipped}, failed {len(failures)} in {elapsed:.1f}s")
+    for article_id, seconds in sorted(durations.items(), key=operator.itemgetter(1), reverse=True)[: args.top]:
+        print(f"    {article_id:<60}{seconds * 1000:>10.0f}ms")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
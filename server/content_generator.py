@@ -1,127 +1,130 @@
-import io
 import re
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable
+from typing import Iterator
 from typing import List
-
-from bs4 import BeautifulSoup
-from jinja2 import Template
-
-from server.model.component import Component
-from server.model.frame import Frame
-from server.model.layout import Layout
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+from urllib.parse import quote
+
+from server.model.article_assets import ArticleAssets
+from server.model.html_output_mode import HtmlOutputMode
+from server.model.image_variants import ImageVariants
+from server.model.ir.component_ir import ComponentIR
+from server.model.ir.layout_ir import LayoutIR
+from server.model.ir.page_ir import PageIR
+from server.utilities.asset_store import get_asset_key
+from server.utilities.asset_store import get_asset_name
 from server.utilities.constants import BUCKET
-from server.utilities.constants import CDN_URL
-from server.utilities.constants import LOCAL_OUTPUT_DIR
-from server.utilities.constants import MINIO_CLIENT
+from server.utilities.constants import HTML_OUTPUT_MODE
 from server.utilities.constants import MINIO_PREVIEW_ENDPOINT
 from server.utilities.constants import MINIO_PRIVATE_ARTICLE_BUCKET
 from server.utilities.constants import MINIO_SCHEME
-from server.utilities.constants import S3_BUCKET
-from server.utilities.constants import S3_CLIENT
+from server.utilities.css_optimizer import CssRule
+from server.utilities.css_optimizer import collect_dom_selector_tokens
+from server.utilities.css_optimizer import intern_css_rules
+from server.utilities.css_optimizer import parse_css_rules
+from server.utilities.css_optimizer import prune_css_rules
+from server.utilities.css_optimizer import serialize_css_rules
+from server.utilities.html_serializer import serialize_html_fragments
+from server.utilities.image_optimizer import VARIANTS_FOLDER
+from server.utilities.metrics import time_stage
+from server.utilities.template_environment import TEMPLATE_ENVIRONMENT
 
 #################################################################################################################
 ################################################ HTML ###########################################################
 #################################################################################################################
 
 
-def generate_component_html(component, position_class_name, article_id, frame_index):
-    """Helper function to generate the HTML for components."""
-    if component.type == "text":
-        return generate_text_component_as_html(component, position_class_name)
-    elif component.type == "image":
-        return generate_image_component_as_html(component, position_class_name, article_id, frame_index)
-    elif component.type == "html":
-        return generate_html_component_as_html(component, position_class_name, article_id)
-    return ""
+def get_shared_asset_url(key: str) -> str:
+    """URL of an object stored by content, shared by every article, as referenced from index.html."""
+    if BUCKET == "S3":
+        return f"../{key}"
+    return f"{MINIO_SCHEME}://{MINIO_PREVIEW_ENDPOINT}/{MINIO_PRIVATE_ARTICLE_BUCKET}/{key}"
 
 
-# Wrap each component with class <page>-<position>-component so that it is identifiable by JS
-def generate_text_component_as_html(component: Component, class_name: str):
-    div_wrapper = f'<div class="{class_name}" id="comp-{component.id}">'
+def get_asset_url(article_id: str, folder: str, filename: str, assets: Optional[ArticleAssets] = None) -> str:
+    """URL of an uploaded image/html asset as referenced from the generated index.html."""
+    asset_ref = assets.refs.get(get_asset_name(folder, filename)) if assets is not None else None
+    if asset_ref is not None:
+        return get_shared_asset_url(get_asset_key(asset_ref.sha256))
+    # Uploaded before files were stored by content
+    if BUCKET == "S3":
+        return f"{folder}/{filename}"
+    return f"{MINIO_SCHEME}://{MINIO_PREVIEW_ENDPOINT}/{MINIO_PRIVATE_ARTICLE_BUCKET}/{article_id}/{folder}/{filename}"
 
-    # Contains inline stylings provided by Rich Text Editor
-    content_html = component.contentHtml
-    text_component_html = f"{div_wrapper}{content_html}</div>"
-    return text_component_html
 
+def get_image_content_types(image_variants: ImageVariants) -> List[str]:
+    """Content types of the variants in order of preference, the JPEG/PNG fallback last."""
+    return list(dict.fromkeys(variant.content_type for variant in image_variants.variants))
 
-# Wrap each component with class <page>-<position>-component so that it is identifiable by JS
-def generate_image_component_as_html(component: Component, class_name: str, article_id: str, frame_index: int) -> str:
-    # Indicate in class if image is in first frame with "first-image"
-    additional_class = "first-image" if frame_index == 0 else ""
-    div_wrapper = f'<figure class="{class_name} {additional_class}" id="comp-{component.id}" >'
-    if BUCKET == "S3":
-        minio_url = f"images/{component.image.data}"
-    else:
-        minio_url = f"{MINIO_SCHEME}://{MINIO_PREVIEW_ENDPOINT}/{MINIO_PRIVATE_ARTICLE_BUCKET}/{article_id}/images/{component.image.data}"
-    div_wrapper += f'<img src="{minio_url}" alt="Image" />'
-    if component.image.caption:
-        div_wrapper += f"<figcaption>{component.image.caption}</figcaption>"
-    div_wrapper += "</figure>"
 
-    return div_wrapper
+def get_image_variant_url(filename: str) -> str:
+    # Escaped, as srcset candidates are separated by whitespace and commas
+    return get_shared_asset_url(f"{VARIANTS_FOLDER}/{quote(filename)}")
 
 
-# Wrap each component with class <page>-<position>-component so that it is identifiable by JS
-def generate_html_component_as_html(component: Component, class_name: str, article_id: str):
-    if BUCKET == "S3":
-        minio_url = f"html/{component.html.data}"
-    else:
-        minio_url = f"{MINIO_SCHEME}://{MINIO_PREVIEW_ENDPOINT}/{MINIO_PRIVATE_ARTICLE_BUCKET}/{article_id}/html/{component.html.data}"
+def get_image_srcset(image_variants: ImageVariants, content_type: str) -> str:
+    return ", ".join(
+        f"{get_image_variant_url(variant.filename)} {variant.width}w"
+        for variant in image_variants.variants
+        if variant.content_type == content_type
+    )
+
+
+def get_image_src(image_variants: ImageVariants) -> str:
+    """The largest fallback variant, for browsers without srcset support."""
+    return get_image_variant_url(image_variants.variants[-1].filename)
+
+
+def get_image_sizes(component: ComponentIR, layout: LayoutIR) -> str:
+    """Rendered width of an image relative to the viewport, matching the layout CSS."""
+    if component.is_display_fullscreen:
+        return "100vw"
+    # Pages are at most 60% of the viewport wide, and left-right sections take their share of that
+    page_width = 60
+    if component.position in {"left", "right"}:
+        section_width = layout.width_left if component.position == "left" else layout.width_right
+        share = 50.0
+        # Widths in other units cannot be expressed relative to the viewport, so assume an even split for those
+        if section_width and re.fullmatch(r"\s*\d+(\.\d+)?%\s*", section_width):
+            share = float(section_width.strip()[:-1])
+        return f"{page_width * share / 100:g}vw"
+    return f"{page_width}vw"
 
-    return f'<iframe class="{class_name}" id="comp-{component.id}" src="{minio_url}" frameborder="0"></iframe>'
 
+TEMPLATE_ENVIRONMENT.globals["asset_url"] = get_asset_url
+TEMPLATE_ENVIRONMENT.globals["image_content_types"] = get_image_content_types
+TEMPLATE_ENVIRONMENT.globals["image_srcset"] = get_image_srcset
+TEMPLATE_ENVIRONMENT.globals["image_src"] = get_image_src
+TEMPLATE_ENVIRONMENT.globals["image_sizes"] = get_image_sizes
 
-# def prettify_except(soup_obj: BeautifulSoup, tag_name: str) -> str:
-#     regex_string = f"<{tag_name}>.*?</{tag_name}>"
-#     regex = re.compile(regex_string, re.DOTALL)
-#     prettified_text = soup_obj.prettify()
-#     to_replace = re.findall(regex, prettified_text)
-#     for txt in to_replace:
-#         prettified_text = re.sub(
-#             txt,
-#             f"<{tag_name}>{txt.replace(f'<{tag_name}>', '').replace(f'</{tag_name}>', '').strip()}</{tag_name}>",
-#             prettified_text,
-#         )
-#     return prettified_text
 
+def generate_page_html(page: PageIR, article_id: str, assets: Optional[ArticleAssets] = None) -> str:
+    """Render the <section> of a page with its components through the precompiled page macros."""
+    return TEMPLATE_ENVIRONMENT.get_template("page.html").render(
+        page=page, article_id=article_id, assets=assets or ArticleAssets()
+    )
 
-def generate_html(article_id: str, body_content: str, title: str) -> str:
-    # Load HTML template
-    with Path.open(Path(__file__).parent / "templates" / "index.html", encoding="utf-8") as file:
-        html_template = file.read()
-        if CDN_URL:
-            html_template = html_template.replace("https://cdn.jsdelivr.net", f"{CDN_URL}/cdn.jsdelivr.net")
-            html_template = html_template.replace("https://cdnjs.cloudflare.com", f"{CDN_URL}/cdnjs.cloudflare.com")
 
+def generate_html_fragments(
+    body_fragments: Iterable[str], title: str, output_mode: HtmlOutputMode = HTML_OUTPUT_MODE
+) -> Iterator[str]:
+    """Stream index.html, pulling page sections from ``body_fragments`` only as the output is consumed."""
     # Render HTML template with provided data
-    html_content = Template(html_template).render(title=title, scroll_trigger=True, body_content=body_content)
-
-    # Use BeautifulSoup to pretty-print the HTML content
-    soup = BeautifulSoup(html_content, "html.parser", preserve_whitespace_tags=["a", "u", "p"])
-    formatted_html_content = soup.prettify()
-
-    if BUCKET == "LOCAL":
-        Path.mkdir(LOCAL_OUTPUT_DIR / article_id, parents=True, exist_ok=True)
-        Path(LOCAL_OUTPUT_DIR / article_id / "index.html").write_bytes(formatted_html_content.encode())
-        return str(Path(LOCAL_OUTPUT_DIR / article_id / "index.html"))
-    if BUCKET == "MINIO":
-        MINIO_CLIENT.put_object(
-            MINIO_PRIVATE_ARTICLE_BUCKET,
-            f"{article_id}/index.html",
-            io.BytesIO(formatted_html_content.encode()),
-            length=len(formatted_html_content.encode()),
-            content_type="text/html",
-        )
-        return f"{MINIO_SCHEME}://{MINIO_PREVIEW_ENDPOINT}/{MINIO_PRIVATE_ARTICLE_BUCKET}/{article_id}/index.html"
-    S3_CLIENT.put_object(
-        Body=io.BytesIO(formatted_html_content.encode()),
-        Bucket=S3_BUCKET,
-        ServerSideEncryption="AES256",
-        Key=f"private-articles/{article_id}/index.html",
-        ContentType="text/html",
+    html_fragments = TEMPLATE_ENVIRONMENT.get_template("index.html").generate(
+        title=title, scroll_trigger=True, body_fragments=body_fragments
     )
-    return None
+
+    # Minify for published builds, pretty-print only when debugging
+    return serialize_html_fragments(html_fragments, output_mode)
+
+
+def generate_html(body_content: str, title: str, output_mode: HtmlOutputMode = HTML_OUTPUT_MODE) -> str:
+    return "".join(generate_html_fragments([body_content], title, output_mode))
 
 
 #################################################################################################################
@@ -147,10 +150,10 @@ def generate_css_class_block(tag_id: str, rules: dict) -> str:
     return css
 
 
-def generate_left_right_css(tag_id: str, layout: Layout) -> str:
+def generate_left_right_css(tag_id: str, layout: LayoutIR) -> str:
     """Generate CSS for left-right template."""
-    left_width = layout.widthLeft if layout.widthLeft else "50%"
-    right_width = layout.widthRight if layout.widthRight else "50%"
+    left_width = layout.width_left if layout.width_left else "50%"
+    right_width = layout.width_right if layout.width_right else "50%"
     css = ""
 
     # Parent container
@@ -203,10 +206,10 @@ def generate_left_right_css(tag_id: str, layout: Layout) -> str:
     return css
 
 
-def generate_top_bottom_css(page_id: str, layout: Layout) -> str:
+def generate_top_bottom_css(page_id: str, layout: LayoutIR) -> str:
     """Generate CSS for top-bottom template."""
-    top_height = layout.heightTop if layout.heightTop else "20%"
-    bottom_height = layout.heightBottom if layout.heightBottom else "80%"
+    top_height = layout.height_top if layout.height_top else "20%"
+    bottom_height = layout.height_bottom if layout.height_bottom else "80%"
     css = ""
 
     # Parent container
@@ -272,7 +275,7 @@ def generate_single_css(page_id: str) -> str:
     )
 
 
-def inject_pinned_page_css(layout: Layout, page_id: str) -> str:
+def inject_pinned_page_css(layout: LayoutIR, page_id: str) -> str:
     """Main function to generate CSS based on layout template."""
     template = layout.template
 
@@ -286,7 +289,7 @@ def inject_pinned_page_css(layout: Layout, page_id: str) -> str:
         return ""
 
 
-def inject_page_css(layout: Layout, page_id: str) -> str:
+def inject_page_css(layout: LayoutIR, page_id: str) -> str:
     """Main function to generate CSS based on layout template."""
     template = layout.template
 
@@ -300,7 +303,7 @@ def inject_page_css(layout: Layout, page_id: str) -> str:
         return ""
 
 
-def generate_left_right_component_css(page_id: str, first_frame_components: List[Component]):
+def generate_left_right_component_css(page_id: str, first_frame_components: Sequence[ComponentIR]):
     css = ""
 
     # Assume there is always a pair of text and image in opposing sides
@@ -341,7 +344,7 @@ def generate_left_right_component_css(page_id: str, first_frame_components: List
     return css
 
 
-def generate_top_bottom_component_css(page_id: str, first_frame_components: List[Component]):
+def generate_top_bottom_component_css(page_id: str, first_frame_components: Sequence[ComponentIR]):
     css = ""
 
     # Assume there is always a pair of text and image in opposing sides
@@ -379,14 +382,14 @@ def generate_top_bottom_component_css(page_id: str, first_frame_components: List
     return css
 
 
-def generate_center_component_css(page_id: str, first_frame_components: List[Component], pinnable: bool):
+def generate_center_component_css(page_id: str, first_frame_components: Sequence[ComponentIR], pinnable: bool):
     css = ""
 
     # Assume there is only one image per frame for each page, hard code width to 60%
     for component in first_frame_components:
         if component.type == "image":
             if pinnable:
-                if component.image.isDisplayFullscreen:
+                if component.is_display_fullscreen:
                     # Set max width/height to image
                     css += generate_css_class_block(
                         f"page-{page_id}-center-component img",
@@ -424,7 +427,7 @@ def generate_center_component_css(page_id: str, first_frame_components: List[Com
                             "max-height": "100vh",
                         },
                     )
-            elif component.image.isDisplayFullscreen:
+            elif component.is_display_fullscreen:
                 css += generate_css_id_block(
                     f"page-{page_id}",
                     {"max-width": "100%", "height": "100%", "padding": "0px"},
@@ -478,11 +481,10 @@ def generate_center_component_css(page_id: str, first_frame_components: List[Com
 
 
 # Assumes in left-right / top-bottom template, there will always be one image and one text in either section for each frame
-def inject_component_css(layout: Layout, frames: List[Frame], page_id: str, pinnable: bool):
+def inject_component_css(layout: LayoutIR, first_frame_components: Sequence[ComponentIR], page_id: str, pinnable: bool):
     template = layout.template
 
     # Check first frame to identify which position is image and text
-    first_frame_components = frames[0].components
     if template == "left-right":
         return generate_left_right_component_css(page_id, first_frame_components)
 
@@ -494,31 +496,62 @@ def inject_component_css(layout: Layout, frames: List[Frame], page_id: str, pinn
         return ""
 
 
-def generate_css(article_id: str, styling_content: str) -> None:
+def generate_page_css(page: PageIR) -> str:
+    """Layout and component CSS of a page, before it is optimised together with the other pages."""
+    pinnable = page.pinnable
+    if pinnable:
+        css_page = inject_pinned_page_css(page.layout, page.id) + "\n"
+        css_page += inject_component_css(page.layout, page.first_frame_components, page.id, pinnable) + "\n"
+    else:
+        css_page = inject_component_css(page.layout, page.first_frame_components, page.id, pinnable) + "\n"
+    return css_page
+
+
+@lru_cache(maxsize=None)
+def load_template_css_rules() -> Tuple[CssRule, ...]:
     # Load existing CSS content from the template file
     css_template_path = Path(__file__).parent / "templates" / "css" / "styles.css"
     with css_template_path.open(encoding="utf-8") as file:
-        template_css_content = file.read()
-
-    # Concatenate the template CSS content with the provided styling content
-    combined_css_content = f"{template_css_content.strip()}\n\n{styling_content.strip()}"
-
-    if BUCKET == "LOCAL":
-        Path.mkdir(LOCAL_OUTPUT_DIR / article_id / "css", parents=True, exist_ok=True)
-        Path(LOCAL_OUTPUT_DIR / article_id / "css" / "styles.css").write_bytes(combined_css_content.encode())
-    elif BUCKET == "MINIO":
-        MINIO_CLIENT.put_object(
-            MINIO_PRIVATE_ARTICLE_BUCKET,
-            f"{article_id}/css/styles.css",
-            io.BytesIO(combined_css_content.encode()),
-            length=len(combined_css_content.encode()),
-            content_type="text/css",
-        )
+        return tuple(parse_css_rules(file.read()))
+
+
+def generate_css_fragments(
+    styling_fragments: Iterable[str],
+    html_fragments: Optional[Iterable[str]] = None,
+    output_mode: HtmlOutputMode = HTML_OUTPUT_MODE,
+) -> Iterator[str]:
+    """
+    Stream styles.css: the template rules followed by the page rules, with identical page declaration blocks
+    grouped under one selector list. When the page ``html_fragments`` are given, rules whose selectors
+    reference ids or classes that are not in the generated DOM are dropped.
+
+    Nothing is read until the first fragment is pulled, and the pages are only read then, in a single pass.
+    """
+    template_rules = list(load_template_css_rules())
+    styling_parts: List[str] = []
+    dom_tokens: Optional[Set[str]] = None
+    if html_fragments is None:
+        styling_parts.extend(styling_fragments)
     else:
-        S3_CLIENT.put_object(
-            Body=io.BytesIO(combined_css_content.encode()),
-            Bucket=S3_BUCKET,
-            ServerSideEncryption="AES256",
-            Key=f"private-articles/{article_id}/css/styles.css",
-            ContentType="text/css",
+        index_html = TEMPLATE_ENVIRONMENT.get_template("index.html").render(
+            title="", scroll_trigger=True, body_fragments=[]
         )
+        dom_tokens = set(collect_dom_selector_tokens([index_html]))
+        # Read in step with the page CSS, so that neither stream holds rendered pages back for the other
+        for styling_fragment, html_fragment in zip(styling_fragments, html_fragments):
+            styling_parts.append(styling_fragment)
+            dom_tokens.update(collect_dom_selector_tokens([html_fragment]))
+
+    with time_stage("css_optimization"):
+        page_rules = parse_css_rules("".join(styling_parts))
+        if dom_tokens is not None:
+            template_rules = prune_css_rules(template_rules, frozenset(dom_tokens))
+            page_rules = prune_css_rules(page_rules, frozenset(dom_tokens))
+
+        # Only the page rules are interned, template rules may match the same elements with different selectors
+        rules = template_rules + intern_css_rules(page_rules)
+    yield from serialize_css_rules(rules, output_mode)
+
+
+def generate_css(styling_content: str, output_mode: HtmlOutputMode = HTML_OUTPUT_MODE) -> str:
+    return "".join(generate_css_fragments([styling_content], output_mode=output_mode))
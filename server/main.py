@@ -1,48 +1,194 @@
-import io
+import asyncio
+import contextlib
+import json
 import logging
-from pathlib import Path
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Annotated
+from typing import Any
+from typing import Awaitable
+from typing import BinaryIO
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import uvicorn
+from fastapi import BackgroundTasks
+from fastapi import Depends
 from fastapi import FastAPI
 from fastapi import Form
+from fastapi import HTTPException
+from fastapi import Header
+from fastapi import Path
+from fastapi import Request
 from fastapi import UploadFile
 from fastapi import status
+from fastapi.exceptions import RequestValidationError
 from fastapi.openapi.docs import get_swagger_ui_html
-from fastapi.responses import FileResponse
+from fastapi.openapi.utils import get_openapi
 from fastapi.responses import HTMLResponse
 from fastapi.responses import JSONResponse
+from fastapi.responses import PlainTextResponse
 from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+from starlette.routing import Match
 
 from server.model.article import Article
+from server.model.asset_link_request import AssetLinkRequest
+from server.model.asset_ref import AssetRef
+from server.model.build_job import BuildJob
+from server.model.cached_payload import CachedPayload
+from server.model.html_output_mode import HtmlOutputMode
+from server.model.ir.article_ir import ArticleIR
+from server.model.json_patch_operation import JsonPatchOperation
 from server.model.payload import Payload
+from server.model.payload_version import PayloadVersion
 from server.model.response_error import ErrorResponse
 from server.model.response_successful import SuccessfulResponse
 from server.model.script.animation.animation_script_factory import AnimationScriptFactory
-from server.parser import process_pages
+from server.model.stored_object import StoredObject
+from server.storage.storage_backend import StorageBackend
+from server.storage.storage_backend_factory import StorageBackendFactory
+from server.utilities.article_lowering import parse_article_json
+from server.utilities.asset_disk_cache import ASSET_DISK_CACHE
+from server.utilities.asset_disk_cache import iter_open_file
+from server.utilities.asset_store import add_asset_ref
+from server.utilities.asset_store import get_asset_key
+from server.utilities.asset_store import get_asset_name
+from server.utilities.asset_store import get_stored_asset
+from server.utilities.asset_store import is_shared_key
+from server.utilities.asset_store import read_asset_head
+from server.utilities.build_job_queue import BUILD_JOB_QUEUE
+from server.utilities.byte_range import parse_byte_range
+from server.utilities.conditional_request import is_not_modified
+from server.utilities.constants import ASSET_CACHE_CONTROL
 from server.utilities.constants import BUCKET
 from server.utilities.constants import CDN_URL
-from server.utilities.constants import LOCAL_OUTPUT_DIR
-from server.utilities.constants import MINIO_CLIENT
-from server.utilities.constants import MINIO_PRIVATE_ARTICLE_BUCKET
-from server.utilities.constants import S3_BUCKET
-from server.utilities.constants import S3_CLIENT
-from server.utilities.utils import copy_files
+from server.utilities.constants import HTML_OUTPUT_MODE
+from server.utilities.constants import UPLOAD_MAX_BYTES
+from server.utilities.content_sniffer import SNIFF_LENGTH
+from server.utilities.content_sniffer import get_upload_file_type
+from server.utilities.content_sniffer import sniff_content_type
+from server.utilities.event_loop_monitor import EVENT_LOOP_MONITOR
+from server.utilities.generation_executor import GenerationExecutor
+from server.utilities.image_optimizer import generate_image_variants
+from server.utilities.json_patch import apply_json_patch
+from server.utilities.metrics import ASSET_DISK_CACHE_EVENTS
+from server.utilities.metrics import EVENT_LOOP_LAG
+from server.utilities.metrics import HTTP_REQUESTS
+from server.utilities.metrics import HTTP_REQUESTS_IN_FLIGHT
+from server.utilities.metrics import HTTP_REQUEST_DURATION
+from server.utilities.metrics import METRICS
+from server.utilities.metrics import PAGE_FRAGMENT_CACHE_EVENTS
+from server.utilities.metrics import PAYLOAD_CACHE_EVENTS
+from server.utilities.metrics import time_stage
+from server.utilities.page_fragment_cache import PAGE_FRAGMENT_CACHE
+from server.utilities.payload_cache import PAYLOAD_CACHE
+from server.utilities.precompression import PRECOMPRESSED_SUFFIXES
+from server.utilities.precompression import get_accepted_encodings
+from server.utilities.precompression import get_precompressed_key
+from server.utilities.request_size_limit_middleware import RequestSizeLimitMiddleware
 from server.utilities.utils import download_files
 from server.utilities.utils import stage_file
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Create buckets / output directories once instead of checking on every upload
+    storage_backend = StorageBackendFactory.get_storage_backend()
+    await run_in_threadpool(storage_backend.bootstrap)
+    event_loop_monitor_task = asyncio.create_task(EVENT_LOOP_MONITOR.run())
+    GenerationExecutor.start()
+    await BUILD_JOB_QUEUE.start()
+    yield
+    await BUILD_JOB_QUEUE.stop()
+    event_loop_monitor_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await event_loop_monitor_task
+    GenerationExecutor.shutdown()
+    ASSET_DISK_CACHE.close()
+    storage_backend.close()
+
+
 app = FastAPI(
     title="ScrollyTelling server",
     version="0.0.1",
     docs_url=None,  # disable so that our override (below) will work
     redoc_url=None,  # disable
     root_path="/api",
+    lifespan=lifespan,
 )
 
+# The article is validated by parse_article, so it has to be added to the OpenAPI schema by hand
+ARTICLE_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Article"}}},
+    }
+}
+
+
+def custom_openapi() -> Dict[str, Any]:
+    if app.openapi_schema is None:
+        openapi_schema = get_openapi(title=app.title, version=app.version, routes=app.routes)
+        article_schema = Article.model_json_schema(ref_template="#/components/schemas/{model}")
+        schemas = openapi_schema.setdefault("components", {}).setdefault("schemas", {})
+        schemas.update(article_schema.pop("$defs", {}))
+        schemas["Article"] = article_schema
+        app.openapi_schema = openapi_schema
+    return app.openapi_schema
+
+
+app.openapi = custom_openapi
+app.add_middleware(RequestSizeLimitMiddleware, max_bytes=UPLOAD_MAX_BYTES, paths=["/upload-file"])
+
+
+def get_endpoint(request: Request) -> str:
+    """Path template of the route handling the request, so that metric labels stay bounded."""
+    for route in app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return getattr(route, "path", "") or "/"
+    return "unmatched"
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+    endpoint = get_endpoint(request)
+    HTTP_REQUESTS_IN_FLIGHT.inc(endpoint=endpoint)
+    started = time.perf_counter()
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        HTTP_REQUESTS_IN_FLIGHT.dec(endpoint=endpoint)
+        HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, method=request.method, endpoint=endpoint)
+        HTTP_REQUESTS.inc(method=request.method, endpoint=endpoint, status=str(status_code))
+
+
+async def parse_article(request: Request) -> ArticleIR:
+    """Validate the request body straight from JSON into the article IR, timing it as the validation stage."""
+    body = await request.body()
+    try:
+        with time_stage("validation"):
+            return parse_article_json(body)
+    except ValidationError as e:
+        errors = [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        raise RequestValidationError(errors) from e
+    except ValueError as e:
+        raise RequestValidationError([{"type": "value_error", "loc": ("body",), "msg": str(e), "input": None}]) from e
+
 
 @app.get("/docs", include_in_schema=False)
 async def custom_docs() -> HTMLResponse:
@@ -71,30 +217,23 @@ async def custom_docs() -> HTMLResponse:
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ErrorResponse},
     },
 )
-async def upload_file(file: UploadFile, article_id: Annotated[str, Form()]) -> JSONResponse:
-    valid_types = {
-        "image": ["image/jpeg", "image/png", "image/gif"],
-        "html": ["text/html"],
-        "css": ["text/css"]
-    }
-    if file.content_type in valid_types["image"]:
-        file_type = "images"
-    elif file.content_type == "text/html":
-        file_type = "html"
-    elif file.content_type == "text/css":
-        file_type = "css"
-    else:
+async def upload_file(
+    file: UploadFile, article_id: Annotated[str, Form()], background_tasks: BackgroundTasks
+) -> JSONResponse:
+    upload_file_type = get_upload_file_type(file.content_type, sniff_content_type(await file.read(SNIFF_LENGTH)))
+    await file.seek(0)
+    if upload_file_type is None:
         raise HTTPException(
             status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
             detail="Unsupported file type"
         )
+    file_type, content_type = upload_file_type
     try:
-        path = stage_file(article_id, file.file, file.filename, file.size, file.content_type, file_type)
-        logger.info({"message": f"{file.filename} uploaded successfully", "path": path})
-        return JSONResponse(
-            content={"message": f"{file.filename} uploaded successfully", "path": path},
-            status_code=status.HTTP_201_CREATED,
+        # Starlette has spooled the upload to a temporary file, which is hashed and streamed to storage from there
+        asset_ref = await run_in_threadpool(
+            stage_file, article_id, file.file, file.filename, content_type, file_type
         )
+        return get_staged_file_response(file.filename, file_type, asset_ref, background_tasks)
     except FileExistsError as fee:
         logger.exception("File exists")
         return JSONResponse(content={"error": f"File exists: {fee}"}, status_code=status.HTTP_400_BAD_REQUEST)
@@ -106,6 +245,64 @@ async def upload_file(file: UploadFile, article_id: Annotated[str, Form()]) -> J
         )
 
 
+@app.head(
+    "/assets/{sha256}",
+    responses={status.HTTP_404_NOT_FOUND: {"description": "No file with this content has been uploaded yet"}},
+)
+async def has_asset(sha256: Annotated[str, Path(pattern=r"^[0-9a-f]{64}$")]) -> Response:
+    """Whether a file with this SHA-256 is already stored, so that clients can link it instead of uploading it."""
+    storage_backend = StorageBackendFactory.get_storage_backend()
+    stored_object = await run_in_threadpool(get_stored_asset, storage_backend, sha256)
+    if stored_object is None:
+        return Response(status_code=status.HTTP_404_NOT_FOUND)
+    return Response(headers={"Content-Length": str(stored_object.size)}, status_code=status.HTTP_200_OK)
+
+
+@app.post(
+    "/link-asset",
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_201_CREATED: {"model": SuccessfulResponse},
+        status.HTTP_404_NOT_FOUND: {"model": ErrorResponse},
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {"model": ErrorResponse},
+    },
+)
+async def link_asset(request_body: AssetLinkRequest, background_tasks: BackgroundTasks) -> JSONResponse:
+    """Refer to an already stored file from an article under a filename, as if it had just been uploaded."""
+    storage_backend = StorageBackendFactory.get_storage_backend()
+    stored_object = await run_in_threadpool(get_stored_asset, storage_backend, request_body.sha256)
+    if stored_object is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No file with this content, upload it")
+    head = await run_in_threadpool(read_asset_head, storage_backend, request_body.sha256, SNIFF_LENGTH)
+    upload_file_type = get_upload_file_type(request_body.content_type, sniff_content_type(head))
+    if upload_file_type is None:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail="Unsupported file type")
+    file_type, content_type = upload_file_type
+    asset_ref = AssetRef(sha256=request_body.sha256, content_type=content_type, size=stored_object.size)
+    await run_in_threadpool(
+        add_asset_ref,
+        storage_backend,
+        request_body.article_id,
+        get_asset_name(file_type, request_body.filename),
+        asset_ref,
+    )
+    return get_staged_file_response(request_body.filename, file_type, asset_ref, background_tasks)
+
+
+def get_staged_file_response(
+    filename: str, file_type: str, asset_ref: AssetRef, background_tasks: BackgroundTasks
+) -> JSONResponse:
+    path = StorageBackendFactory.get_storage_backend().get_url(get_asset_key(asset_ref.sha256))
+    logger.info({"message": f"{filename} uploaded successfully", "path": path})
+    if file_type == "images":
+        # Resized variants are picked up by the next website generation once they are ready
+        background_tasks.add_task(generate_image_variants, asset_ref.sha256)
+    return JSONResponse(
+        content={"message": f"{filename} uploaded successfully", "path": path, "sha256": asset_ref.sha256},
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
 @app.get("/animation-options")
 async def get_animation_options() -> str:
     return JSONResponse(
@@ -124,22 +321,33 @@ async def get_animation_options() -> str:
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ErrorResponse},
     },
     response_model=None,
+    openapi_extra=ARTICLE_REQUEST_BODY,
 )
-async def generate_website(request_body: Article, is_download: bool) -> Union[FileResponse, JSONResponse]:  # noqa: FBT001
+async def generate_website(
+    request_body: Annotated[ArticleIR, Depends(parse_article)],
+    is_download: bool,  # noqa: FBT001
+    output_mode: HtmlOutputMode = HTML_OUTPUT_MODE,
+) -> Union[StreamingResponse, JSONResponse]:
     try:
-        # Extract the values from the request body
-        title = request_body.title if request_body.title is not None else "My Animated Website"
-        pages = request_body.pages
-        article_id = request_body.articleId
-
-        process_pages(article_id, pages, title)
+        article_id = request_body.article_id
+        # Identical concurrent requests share a single build
+        job = BUILD_JOB_QUEUE.submit(request_body, output_mode, publish=not is_download, endpoint="/generate-website")
+        # A download holds the article, so that later builds do not change it while the archive reads it
+        job = await BUILD_JOB_QUEUE.wait(job.job_id, hold=is_download)
 
         if is_download:
-            zip_path = download_files(article_id)
-            return FileResponse(path=zip_path, filename=Path(zip_path).name, media_type="application/zip")
+            try:
+                zip_chunks = await run_in_threadpool(download_files, article_id)
+            except BaseException:
+                BUILD_JOB_QUEUE.release(article_id)
+                raise
+            return StreamingResponse(
+                BUILD_JOB_QUEUE.iter_held(article_id, zip_chunks),
+                media_type="application/zip",
+                headers={"Content-Disposition": f'attachment; filename="{article_id}.zip"'},
+            )
 
-        # # Copy from private bucket to public bucket
-        path = copy_files(article_id)
+        path = job.url
         return JSONResponse(
             content={
                 "message": f"Website generated successfully. The article can be found in {path}",
@@ -165,15 +373,67 @@ async def generate_website(request_body: Article, is_download: bool) -> Union[Fi
         )
 
 
-@app.get("/payload/{article_id}")
-def get_payload(article_id: str) -> str:
-    if BUCKET == "S3":
-        response = S3_CLIENT.get_object(Bucket=S3_BUCKET, Key=f"private-articles/{article_id}/payload.json")
-        return response["Body"].read()
-    if BUCKET == "MINIO":
-        response = MINIO_CLIENT.get_object(MINIO_PRIVATE_ARTICLE_BUCKET, f"{article_id}/payload.json")
-        return response.data
-    return Path(LOCAL_OUTPUT_DIR / article_id / "payload.json").read_text(encoding="utf-8")
+@app.post(
+    "/builds",
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={status.HTTP_202_ACCEPTED: {"model": BuildJob}},
+    openapi_extra=ARTICLE_REQUEST_BODY,
+)
+async def create_build(
+    request_body: Annotated[ArticleIR, Depends(parse_article)],
+    publish: bool = True,  # noqa: FBT001, FBT002
+    output_mode: HtmlOutputMode = HTML_OUTPUT_MODE,
+) -> BuildJob:
+    return BUILD_JOB_QUEUE.submit(request_body, output_mode, publish=publish, endpoint="/builds")
+
+
+@app.get(
+    "/builds/{job_id}",
+    responses={status.HTTP_200_OK: {"model": BuildJob}, status.HTTP_404_NOT_FOUND: {"model": ErrorResponse}},
+    response_model=None,
+)
+async def get_build(job_id: str) -> Union[BuildJob, JSONResponse]:
+    job = BUILD_JOB_QUEUE.get(job_id)
+    if job is None:
+        return JSONResponse(content={"error": f"Build {job_id} not found"}, status_code=status.HTTP_404_NOT_FOUND)
+    return job
+
+
+@app.get("/health")
+async def get_health() -> JSONResponse:
+    return JSONResponse(content={"status": "ok", **EVENT_LOOP_MONITOR.get_stats()})
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    # Not get_stats, which resets the maximum lag reported by /health
+    EVENT_LOOP_LAG.set(EVENT_LOOP_MONITOR.lag_seconds)
+    cache_stats = PAGE_FRAGMENT_CACHE.get_stats()
+    for stat in ("entries", "hits", "misses", "evictions"):
+        PAGE_FRAGMENT_CACHE_EVENTS.set(cache_stats[stat], stat=stat)
+    for stat, value in PAYLOAD_CACHE.get_stats().items():
+        PAYLOAD_CACHE_EVENTS.set(value, stat=stat)
+    for stat, value in ASSET_DISK_CACHE.get_stats().items():
+        ASSET_DISK_CACHE_EVENTS.set(value, stat=stat)
+    return PlainTextResponse(METRICS.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.get(
+    "/payload/{article_id}",
+    response_class=Response,
+    responses={
+        status.HTTP_200_OK: {"content": {"application/json": {}}, "description": "The stored payload"},
+        status.HTTP_304_NOT_MODIFIED: {"description": "The payload matches If-None-Match"},
+    },
+)
+def get_payload(article_id: str, if_none_match: Annotated[Optional[str], Header()] = None) -> Response:
+    payload = load_payload(article_id)
+    # Browsers keep the payload but revalidate it on every load, which costs a 304 when it has not changed
+    headers = {"ETag": payload.etag, "Cache-Control": "no-cache"}
+    if is_not_modified(if_none_match, payload.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    # The stored JSON is sent as is, without decoding and re-encoding it
+    return Response(content=payload.data, media_type="application/json", headers=headers)
 
 
 @app.post(
@@ -185,35 +445,164 @@ def get_payload(article_id: str) -> str:
     },
     response_model=None,
 )
-def save_payload(request_body: Payload) -> None:
-    if BUCKET == "S3":
-        S3_CLIENT.put_object(
-            Body=io.BytesIO(request_body.payload.encode()),
-            Bucket=S3_BUCKET,
-            ServerSideEncryption="AES256",
-            Key=f"private-articles/{request_body.article_id}/payload.json",
-            ContentType="application/json",
-        )
-    elif BUCKET == "MINIO":
-        MINIO_CLIENT.put_object(
-            MINIO_PRIVATE_ARTICLE_BUCKET,
-            f"{request_body.article_id}/payload.json",
-            io.BytesIO(request_body.payload.encode()),
-            length=len(request_body.payload.encode()),
-            content_type="application/json",
+def save_payload(request_body: Payload, response: Response) -> None:
+    data = request_body.payload.encode()
+    with PAYLOAD_CACHE.get_article_lock(request_body.article_id):
+        StorageBackendFactory.get_storage_backend().put(
+            f"{request_body.article_id}/payload.json", data, "application/json"
         )
-    else:
-        Path.mkdir(LOCAL_OUTPUT_DIR / request_body.article_id, parents=True, exist_ok=True)
-        Path(LOCAL_OUTPUT_DIR / request_body.article_id / "payload.json").write_text(
-            request_body.payload, encoding="utf-8"
+        PAYLOAD_CACHE.invalidate(request_body.article_id)
+    # The version to send as If-Match with the next PATCH
+    response.headers["ETag"] = PAYLOAD_CACHE.get_etag(data)
+
+
+@app.patch(
+    "/payload/{article_id}",
+    responses={
+        status.HTTP_200_OK: {"model": PayloadVersion},
+        status.HTTP_412_PRECONDITION_FAILED: {"model": ErrorResponse},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": ErrorResponse},
+        status.HTTP_428_PRECONDITION_REQUIRED: {"model": ErrorResponse},
+    },
+    response_model=None,
+)
+def patch_payload(
+    article_id: str,
+    operations: List[JsonPatchOperation],
+    if_match: Annotated[Optional[str], Header(description="ETag of the payload the patch was made against")] = None,
+) -> JSONResponse:
+    """Apply an RFC 6902 JSON Patch to the saved payload, if it is still at the If-Match version."""
+    if not if_match:
+        return JSONResponse(
+            content={"error": "If-Match with the payload version is required"},
+            status_code=status.HTTP_428_PRECONDITION_REQUIRED,
         )
 
+    with PAYLOAD_CACHE.get_article_lock(article_id):
+        payload = load_payload(article_id)
+        if if_match.strip() != payload.etag:
+            return JSONResponse(
+                content={"error": f"Payload has changed, the current version is {payload.etag}"},
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                headers={"ETag": payload.etag},
+            )
+        try:
+            document = apply_json_patch(json.loads(payload.data), operations)
+        except ValueError as ve:
+            return JSONResponse(
+                content={"error": f"Cannot apply patch: {ve}"}, status_code=status.HTTP_422_UNPROCESSABLE_ENTITY
+            )
+
+        # Same compact form as the editor's JSON.stringify
+        data = json.dumps(document, ensure_ascii=False, separators=(",", ":")).encode()
+        StorageBackendFactory.get_storage_backend().put(f"{article_id}/payload.json", data, "application/json")
+        PAYLOAD_CACHE.invalidate(article_id)
+        payload = PAYLOAD_CACHE.put(article_id, data, PAYLOAD_CACHE.get_generation(article_id))
+
+    return JSONResponse(
+        content=PayloadVersion(article_id=article_id, version=payload.etag).model_dump(),
+        headers={"ETag": payload.etag},
+    )
+
+
+def load_payload(article_id: str) -> CachedPayload:
+    payload = PAYLOAD_CACHE.get(article_id)
+    if payload is None:
+        generation = PAYLOAD_CACHE.get_generation(article_id)
+        data = StorageBackendFactory.get_storage_backend().get(f"{article_id}/payload.json")
+        payload = PAYLOAD_CACHE.put(article_id, data, generation)
+    return payload
+
+
+def lookup_asset(
+    storage_backend: StorageBackend, path: str, accept_encoding: Optional[str]
+) -> Tuple[str, Optional[str], Optional[Tuple[StoredObject, Optional[BinaryIO]]]]:
+    """The key served for ``path``, its content encoding and the cache lookup, trying precompressed copies first."""
+    # Generated text files are sent as their precompressed copies to clients that accept one
+    encodings = get_accepted_encodings(accept_encoding) if path.endswith(PRECOMPRESSED_SUFFIXES) else []
+    for encoding in encodings:
+        key = get_precompressed_key(path, encoding)
+        found = ASSET_DISK_CACHE.lookup(storage_backend, key)
+        if found is not None:
+            return key, encoding, found
+    return path, None, ASSET_DISK_CACHE.lookup(storage_backend, path)
+
+
+def get_encoding_headers(path: str, content_encoding: Optional[str]) -> Dict[str, str]:
+    if not path.endswith(PRECOMPRESSED_SUFFIXES):
+        return {}
+    headers = {"Vary": "Accept-Encoding"}
+    if content_encoding is not None:
+        headers["Content-Encoding"] = content_encoding
+    return headers
+
+
+@app.get(
+    "/s3-assets/{path:path}",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_206_PARTIAL_CONTENT: {"description": "The requested byte range"},
+        status.HTTP_304_NOT_MODIFIED: {"description": "The object matches If-None-Match"},
+        status.HTTP_404_NOT_FOUND: {"model": ErrorResponse},
+        status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE: {"description": "The range is past the end of the object"},
+    },
+)
+async def get_s3_assets(
+    path: str,
+    range_header: Annotated[Optional[str], Header(alias="Range")] = None,
+    if_range: Annotated[Optional[str], Header()] = None,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+    accept_encoding: Annotated[Optional[str], Header()] = None,
+) -> Response:
+    """Stream an object of the private article store, from the local disk cache when it holds the current version."""
+    storage_backend = StorageBackendFactory.get_storage_backend()
+    key, content_encoding, found = await run_in_threadpool(lookup_asset, storage_backend, path, accept_encoding)
+    if found is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{path} not found")
+    stored_object, file = found
+    etag = f'"{stored_object.etag}"'
+    headers = {
+        "ETag": etag,
+        # Everything but the hash-named assets changes when the article is generated again
+        "Cache-Control": ASSET_CACHE_CONTROL if is_shared_key(path) else "no-cache",
+        "Accept-Ranges": "bytes",
+        **get_encoding_headers(path, content_encoding),
+    }
+    if is_not_modified(if_none_match, etag):
+        if file is not None:
+            file.close()
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    # A range of another version of the object does not apply, the whole current version is sent instead
+    if if_range is not None and if_range.strip() != etag:
+        range_header = None
+    try:
+        byte_range = parse_byte_range(range_header, stored_object.size)
+    except ValueError:
+        if file is not None:
+            file.close()
+        headers["Content-Range"] = f"bytes */{stored_object.size}"
+        return Response(status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE, headers=headers)
 
-@app.get("/s3-assets/{path:path}")
-def get_s3_assets(path: str) -> Response:
-    response = S3_CLIENT.get_object(Bucket=S3_BUCKET, Key=f"private-articles/{path}")
-    return Response(
-        content=response["Body"].read(), media_type=response["ContentType"], status_code=status.HTTP_201_CREATED
+    media_type = stored_object.content_type or "application/octet-stream"
+    if file is None and byte_range is not None and ASSET_DISK_CACHE.is_cacheable(stored_object):
+        # Cached whole first, so that the ranges that usually follow are served from disk
+        file = await run_in_threadpool(ASSET_DISK_CACHE.fill, stored_object, storage_backend.iter_chunks(key))
+    if file is None:
+        # Ranges of objects too large to cache are answered with the whole object, as RFC 9110 allows
+        headers["Content-Length"] = str(stored_object.size)
+        chunks = ASSET_DISK_CACHE.write_through(stored_object, storage_backend.iter_chunks(key))
+        return StreamingResponse(chunks, media_type=media_type, headers=headers)
+    if byte_range is None:
+        headers["Content-Length"] = str(stored_object.size)
+        return StreamingResponse(iter_open_file(file, 0, stored_object.size), media_type=media_type, headers=headers)
+    start, end = byte_range
+    headers["Content-Length"] = str(end - start + 1)
+    headers["Content-Range"] = f"bytes {start}-{end}/{stored_object.size}"
+    return StreamingResponse(
+        iter_open_file(file, start, end - start + 1),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=media_type,
+        headers=headers,
     )
 
 
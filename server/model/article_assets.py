@@ -0,0 +1,13 @@
+from typing import Dict
+
+from pydantic import BaseModel
+
+from server.model.asset_ref import AssetRef
+from server.model.image_variants import ImageVariants
+
+
+class ArticleAssets(BaseModel):
+    """The uploaded files of an article and the variants of its images, both by name, as needed to render it."""
+
+    refs: Dict[str, AssetRef] = {}
+    image_variants: Dict[str, ImageVariants] = {}
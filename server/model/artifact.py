@@ -0,0 +1,13 @@
+from typing import Iterable
+from typing import Optional
+
+from pydantic import BaseModel
+from pydantic import SkipValidation
+
+
+class Artifact(BaseModel):
+    key: str
+    content_type: str
+    data: bytes = b""
+    # Streamed instead of ``data`` when set; consumed once, as the upload progresses
+    fragments: Optional[SkipValidation[Iterable[bytes]]] = None
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+from pydantic import Field
+
+
+class AssetLinkRequest(BaseModel):
+    """Reference an already stored file from an article without uploading it again."""
+
+    article_id: str
+    filename: str
+    content_type: str
+    sha256: str = Field(pattern=r"^[0-9a-f]{64}$")
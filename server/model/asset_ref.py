@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class AssetRef(BaseModel):
+    """Content of an uploaded file, stored once under its SHA-256 whatever its name and article."""
+
+    sha256: str
+    content_type: str
+    size: int
@@ -0,0 +1,10 @@
+from typing import Dict
+
+from pydantic import BaseModel
+
+from server.model.asset_ref import AssetRef
+
+
+class AssetRefs(BaseModel):
+    # "<file type>/<filename>" as referenced by the components -> content of the file
+    assets: Dict[str, AssetRef] = {}
@@ -0,0 +1,18 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from server.model.build_job_status import BuildJobStatus
+
+
+class BuildJob(BaseModel):
+    job_id: str
+    article_id: str
+    payload_hash: str
+    publish: bool
+    status: BuildJobStatus = BuildJobStatus.QUEUED
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    url: Optional[str] = None
+    error: Optional[str] = None
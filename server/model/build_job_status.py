@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class BuildJobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+
+class CachedPayload(BaseModel):
+    data: bytes
+    etag: str
@@ -14,19 +14,3 @@ class Component(BaseModel):
     contentHtml: Optional[str] = None
     image: Optional[Image] = None
     html: Optional[Html] = None
-
-
-component_data = {
-    "id": "comp-1",
-    "contentHtml": "This is a component with an animation",
-    "position": "left",
-    "animation": "fade",
-    "type": "text",
-    "image": None,
-}
-
-# Creating an instance of the Component model
-component_instance = Component(**component_data)
-
-# Printing the component instance
-# print(component_instance)
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class HtmlOutputMode(str, Enum):
+    MINIFIED = "minified"
+    PRETTY = "pretty"
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class ImageVariant(BaseModel):
+    filename: str
+    content_type: str
+    width: int
+    height: int
+    size: int
@@ -0,0 +1,13 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from server.model.image_variant import ImageVariant
+
+
+class ImageVariants(BaseModel):
+    """Intrinsic dimensions of an uploaded image and its resized, re-encoded variants."""
+
+    width: int
+    height: int
+    variants: List[ImageVariant] = []
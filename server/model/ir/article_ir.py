@@ -0,0 +1,11 @@
+from typing import Tuple
+
+from server.model.ir.ir_node import IRNode
+from server.model.ir.page_ir import PageIR
+
+
+class ArticleIR(IRNode):
+    __slots__ = ("article_id", "digest", "pages", "title")
+
+    def __init__(self, *, article_id: str, title: str, pages: Tuple[PageIR, ...], digest: str) -> None:
+        super().__init__(article_id=article_id, title=title, pages=pages, digest=digest)
@@ -0,0 +1,69 @@
+from typing import Optional
+
+from server.model.ir.ir_node import IRNode
+
+
+class ComponentIR(IRNode):
+    """
+    A component with its ids already split, its place in the group of its position (start and end of its scroll
+    trigger) and whether it belongs to the first frame of its page, or starts visible as part of the first frame of
+    the article.
+    """
+
+    __slots__ = (
+        "animation",
+        "content_html",
+        "end_length",
+        "frame_id",
+        "frame_index",
+        "group_index",
+        "html_data",
+        "id",
+        "image_caption",
+        "image_data",
+        "is_display_fullscreen",
+        "is_first_frame",
+        "page_id",
+        "position",
+        "starts_visible",
+        "type",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,  # noqa: A002
+        type: str,  # noqa: A002
+        position: str,
+        animation: Optional[str],
+        content_html: Optional[str],
+        image_data: Optional[str],
+        image_caption: Optional[str],
+        is_display_fullscreen: bool,
+        html_data: Optional[str],
+        page_id: Optional[str],
+        frame_id: Optional[str],
+        frame_index: int,
+        is_first_frame: bool,
+        starts_visible: bool,
+        group_index: int,
+        end_length: int,
+    ) -> None:
+        super().__init__(
+            id=id,
+            type=type,
+            position=position,
+            animation=animation,
+            content_html=content_html,
+            image_data=image_data,
+            image_caption=image_caption,
+            is_display_fullscreen=is_display_fullscreen,
+            html_data=html_data,
+            page_id=page_id,
+            frame_id=frame_id,
+            frame_index=frame_index,
+            is_first_frame=is_first_frame,
+            starts_visible=starts_visible,
+            group_index=group_index,
+            end_length=end_length,
+        )
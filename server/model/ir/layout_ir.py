@@ -0,0 +1,24 @@
+from typing import Optional
+
+from server.model.ir.ir_node import IRNode
+
+
+class LayoutIR(IRNode):
+    __slots__ = ("height_bottom", "height_top", "template", "width_left", "width_right")
+
+    def __init__(
+        self,
+        *,
+        template: str,
+        height_top: Optional[str],
+        width_left: Optional[str],
+        height_bottom: Optional[str],
+        width_right: Optional[str],
+    ) -> None:
+        super().__init__(
+            template=template,
+            height_top=height_top,
+            width_left=width_left,
+            height_bottom=height_bottom,
+            width_right=width_right,
+        )
@@ -0,0 +1,55 @@
+from typing import Tuple
+
+from server.model.ir.component_ir import ComponentIR
+from server.model.ir.ir_node import IRNode
+from server.model.ir.layout_ir import LayoutIR
+
+
+class PageIR(IRNode):
+    """
+    A page with its components in frame order, grouped by position in order of first appearance, the components of
+    its first frame, the assets it references and a digest of its content.
+    """
+
+    __slots__ = (
+        "asset_names",
+        "components",
+        "digest",
+        "first_frame_components",
+        "groups",
+        "id",
+        "layout",
+        "pin_length",
+        "pinnable",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,  # noqa: A002
+        pinnable: bool,
+        layout: LayoutIR,
+        components: Tuple[ComponentIR, ...],
+        groups: Tuple[Tuple[str, Tuple[ComponentIR, ...]], ...],
+        first_frame_components: Tuple[ComponentIR, ...],
+        pin_length: int,
+        asset_names: Tuple[str, ...],
+        digest: str,
+    ) -> None:
+        super().__init__(
+            id=id,
+            pinnable=pinnable,
+            layout=layout,
+            components=components,
+            groups=groups,
+            first_frame_components=first_frame_components,
+            pin_length=pin_length,
+            asset_names=asset_names,
+            digest=digest,
+        )
+
+    def get_group(self, position: str) -> Tuple[ComponentIR, ...]:
+        for group_position, components in self.groups:
+            if group_position == position:
+                return components
+        return ()
@@ -0,0 +1,15 @@
+from typing import Any
+from typing import Literal
+from typing import Optional
+
+from pydantic import BaseModel
+from pydantic import Field
+
+
+class JsonPatchOperation(BaseModel):
+    """One RFC 6902 operation, ``value`` only counting as given when it is in model_fields_set."""
+
+    op: Literal["add", "remove", "replace", "move", "copy", "test"]
+    path: str
+    value: Any = None
+    from_: Optional[str] = Field(default=None, alias="from")
@@ -0,0 +1,8 @@
+from typing import Dict
+
+from pydantic import BaseModel
+
+
+class Manifest(BaseModel):
+    # Object key -> ETag of the object in the private article store
+    objects: Dict[str, str] = {}
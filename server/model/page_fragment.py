@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class PageFragment(BaseModel):
+    html: str
+    css: str
+    js: str
@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+
+class PayloadVersion(BaseModel):
+    article_id: str
+    version: str
@@ -0,0 +1,115 @@
+import json
+import logging
+from functools import lru_cache
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from server.model.script.animation.animation_script_factory import AnimationScriptFactory
+from server.model.script.animation.util.component_selector_rewriter import ComponentSelectorRewriter
+from server.model.script.animation.util.component_selector_rewriter import SELECTOR_PARAMETER
+
+logger = logging.getLogger(__name__)
+
+
+class AnimationRuntimeBuilder:
+    @staticmethod
+    def __to_function(template: str) -> Optional[str]:
+        body = ComponentSelectorRewriter.rewrite(template)
+        return None if body is None else f"function ({SELECTOR_PARAMETER}) {{ {body} }}"
+
+    @staticmethod
+    def __build_animation_js(animation_name: str) -> Optional[str]:
+        visible = AnimationScriptFactory.construct_animation_script(
+            animation_name, start_as_visible=True
+        ).get_templates()
+        hidden = AnimationScriptFactory.construct_animation_script(
+            animation_name, start_as_visible=False
+        ).get_templates()
+        functions = {
+            "visible": visible.init,
+            "hidden": hidden.init,
+            "enter": visible.enter,
+            "exit": visible.exit,
+            "enterBack": visible.enter_back,
+            "exitBack": visible.exit_back,
+        }
+        for name, template in functions.items():
+            function = AnimationRuntimeBuilder.__to_function(template)
+            if function is None:
+                return None
+            functions[name] = function
+        entries = "".join(f"\n        {name}: {function}," for name, function in functions.items())
+        return f"""{json.dumps(animation_name)}: {{{entries}
+    }}"""
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __get_animations_js() -> Dict[str, str]:
+        animations_js = {}
+        for animation_name in AnimationScriptFactory.get_animation_name_list():
+            animation_js = AnimationRuntimeBuilder.__build_animation_js(animation_name)
+            if animation_js is None:
+                logger.warning(
+                    f"Animation '{animation_name}' uses the component id outside of a string literal, pages using it "
+                    "get inline scripts instead of the compact runtime"
+                )
+                continue
+            animations_js[animation_name] = animation_js
+        return animations_js
+
+    @staticmethod
+    def supports(animation_name: str) -> bool:
+        """Whether the runtime has the animation, otherwise pages using it must be emitted as inline scripts."""
+        return animation_name in AnimationRuntimeBuilder.__get_animations_js()
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def build_runtime_js(scroll_speed: int = 50) -> str:
+        """Shared runtime registering the scroll triggers described by the per-page animation tables."""
+        animations_js = ",\n    ".join(AnimationRuntimeBuilder.__get_animations_js().values())
+        return f"""
+const scrollyAnimations = {{
+    {animations_js}
+}};
+function registerScrollyPage(page) {{
+    const trigger = "#page-" + page.id;
+    page.components.forEach(function (row) {{
+        const selector = "#comp-" + row[0];
+        const animation = scrollyAnimations[row[1]];
+        const startLength = row[2];
+        const endLength = row[3];
+        (row[4] ? animation.visible : animation.hidden)(selector);
+        gsap.timeline({{
+            scrollTrigger: {{
+                trigger: trigger,
+                start: () => startLength === 0 ? "top+=0% bottom" : "top+=" + startLength * {scroll_speed} + "% top",
+                end: () => startLength === 0 ? "+={100 + scroll_speed}%" : "+=" + {scroll_speed} * endLength + "%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => animation.enter(selector),
+                onLeave: () => animation.exit(selector),
+                onEnterBack: () => animation.enterBack(selector),
+                onLeaveBack: () => animation.exitBack(selector),
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }}
+        }});
+    }});
+    ScrollTrigger.create({{
+        trigger: trigger,
+        start: "top top",
+        end: () => "+=" + {scroll_speed} * page.pin + "%",
+        pin: true,
+        pinSpacing: true,
+        scrub: true,
+        scroller: ".scroller",
+    }});
+}}
+"""
+
+    @staticmethod
+    def build_page_js(page_id: str, rows: List[list], pin_length: int) -> str:
+        """Compact table of a pinned page, rows as built by ``AnimationScriptProcessor.build_animation_rows``."""
+        table = json.dumps({"id": page_id, "pin": pin_length, "components": rows}, separators=(",", ":"))
+        return f"registerScrollyPage({table});\n"
@@ -1,43 +1,56 @@
 from typing import List
+from typing import Tuple
 
-from server.model.component import Component
+from server.model.ir.component_ir import ComponentIR
+from server.model.ir.page_ir import PageIR
 from server.model.script.animation.animation_script_factory import AnimationScriptFactory
 from server.model.script.animation.animation_scripts.animation_script import AnimationScript
 from server.model.script.animation.animation_scroll_trigger import AnimationScrollTrigger
-from server.model.script.animation.util.component_groups import ComponentGroups
-from server.model.script.animation.util.component_id_parser import ComponentIdParser
 
 
 class AnimationScriptProcessor:
     @staticmethod
-    def process_animation_scripts(component_groups: ComponentGroups, string_builder: List[str]) -> None:
-        for components in component_groups.groups.values():
-            AnimationScriptProcessor.__build_components_scripts(components, component_groups, string_builder)
+    def process_animation_scripts(page: PageIR, string_builder: List[str]) -> None:
+        for _, components in page.groups:
+            AnimationScriptProcessor.__build_components_scripts(components, string_builder)
 
     @staticmethod
-    def __build_components_scripts(
-        components: dict, component_groups: ComponentGroups, string_builder: List[str]
-    ) -> None:
-        for index, component in enumerate(components):
-            should_start_as_visible = AnimationScriptProcessor.get_should_start_as_visible(component.id)
+    def build_animation_rows(page: PageIR) -> List[list]:
+        """Rows of [component id, animation name, start length, end length, initial visibility] for the runtime."""
+        rows = []
+        for _, components in page.groups:
+            for component in components:
+                # Components without animation have nothing to register
+                if component.animation is None:
+                    continue
+                # Fail on unknown animations the same way as the inline scripts do
+                AnimationScriptFactory.construct_animation_script(component.animation, component.starts_visible)
+                rows.append([
+                    component.id,
+                    component.animation,
+                    component.group_index,
+                    component.end_length,
+                    int(component.starts_visible),
+                ])
+        return rows
+
+    @staticmethod
+    def __build_components_scripts(components: Tuple[ComponentIR, ...], string_builder: List[str]) -> None:
+        for component in components:
             animation_script = AnimationScriptFactory.construct_animation_script(
-                component.animation, should_start_as_visible
-            )
-            scroll_trigger = AnimationScriptProcessor.__build_component_scroll_trigger(
-                index, component, component_groups, animation_script
+                component.animation, component.starts_visible
             )
+            scroll_trigger = AnimationScriptProcessor.__build_component_scroll_trigger(component, animation_script)
             string_builder.append(scroll_trigger.get_trigger_js())
 
-    @staticmethod
-    def get_should_start_as_visible(component_id: str) -> bool:
-        page_id, frame_id, component_id = ComponentIdParser.parse(component_id)
-        return page_id == "001" and frame_id == "1"
-
     @staticmethod
     def __build_component_scroll_trigger(
-        index: int, component: Component, component_groups: ComponentGroups, animation_script: AnimationScript
+        component: ComponentIR, animation_script: AnimationScript
     ) -> AnimationScrollTrigger:
-        page_id, frame_id, component_id = ComponentIdParser.parse(component.id)
-        start_length = index
-        end_length = component_groups.get_component_end_length(component_id)
-        return AnimationScrollTrigger(component.id, start_length, end_length, animation_script)
+        return AnimationScrollTrigger(
+            component.id,
+            component.group_index,
+            component.end_length,
+            animation_script,
+            parsed_id=(component.page_id, component.frame_id, component.id),
+        )
@@ -0,0 +1,98 @@
+import logging
+import threading
+from importlib.metadata import entry_points
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+from server.model.script.animation.animation_scripts.animation_script import AnimationScript
+from server.model.script.animation.animation_scripts.fade_animation_script import FadeAnimationScript
+from server.model.script.animation.animation_scripts.fly_in_bottom_animation_script import FlyInBottomAnimationScript
+from server.model.script.animation.animation_scripts.fly_in_left_animation_script import FlyInLeftAnimationScript
+from server.model.script.animation.animation_scripts.fly_in_right_animation_script import FlyInRightAnimationScript
+from server.model.script.animation.animation_scripts.overlap_animation_script import OverlapAnimationScript
+from server.model.script.animation.animation_scripts.zoom_animation_script import ZoomAnimationScript
+
+logger = logging.getLogger(__name__)
+
+# Third-party packages register AnimationScript subclasses under this entry point group, keyed by animation name.
+# The registry builds one instance per initial visibility with ``script_class(start_as_visible=...)`` and freezes it,
+# as it is shared by every component using the animation: set attributes in ``__init__`` only.
+ANIMATION_ENTRY_POINT_GROUP = "scrolly_telling.animations"
+
+BUILT_IN_ANIMATIONS: Dict[str, Type[AnimationScript]] = {
+    "fade": FadeAnimationScript,
+    "zoom": ZoomAnimationScript,
+    "fly-in-bottom": FlyInBottomAnimationScript,
+    "fly-in-left": FlyInLeftAnimationScript,
+    "fly-in-right": FlyInRightAnimationScript,
+    "overlap": OverlapAnimationScript,
+}
+
+
+class AnimationScriptRegistry:
+    """Animation name to script class table, built once, handing out one shared script per visibility."""
+
+    def __init__(self) -> None:
+        self.__animations: Optional[Dict[str, Type[AnimationScript]]] = None
+        self.__animation_names: Tuple[str, ...] = ()
+        self.__scripts: Dict[Tuple[Optional[str], bool], AnimationScript] = {}
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def __load_entry_points() -> Dict[str, Type[AnimationScript]]:
+        try:
+            discovered = entry_points(group=ANIMATION_ENTRY_POINT_GROUP)
+        except TypeError:
+            # Python < 3.10 only supports the dict interface
+            discovered = entry_points().get(ANIMATION_ENTRY_POINT_GROUP, [])
+
+        animations = {}
+        for entry_point in discovered:
+            if entry_point.name in BUILT_IN_ANIMATIONS:
+                logger.warning(f"Ignoring animation plugin {entry_point.value}: '{entry_point.name}' is built in")
+                continue
+            try:
+                script_class = entry_point.load()
+            except Exception:
+                logger.exception(f"Failed to load animation plugin {entry_point.value}")
+                continue
+            if not isinstance(script_class, type) or not issubclass(script_class, AnimationScript):
+                logger.warning(f"Ignoring animation plugin {entry_point.value}: not an AnimationScript subclass")
+                continue
+            animations[entry_point.name] = script_class
+            logger.info(f"Loaded animation plugin '{entry_point.name}' from {entry_point.value}")
+        return animations
+
+    def __get_animations(self) -> Dict[str, Type[AnimationScript]]:
+        if self.__animations is None:
+            with self.__lock:
+                if self.__animations is None:
+                    animations = {**BUILT_IN_ANIMATIONS, **AnimationScriptRegistry.__load_entry_points()}
+                    self.__animation_names = tuple(animations)
+                    self.__animations = animations
+        return self.__animations
+
+    def get_animation_names(self) -> List[str]:
+        self.__get_animations()
+        return list(self.__animation_names)
+
+    def get_script(self, animation_name: Optional[str], *, start_as_visible: bool) -> AnimationScript:
+        """Shared script instance of an animation, ``None`` being the animation that does nothing."""
+        key = (animation_name, start_as_visible)
+        script = self.__scripts.get(key)
+        if script is None:
+            if animation_name is None:
+                script = AnimationScript(start_as_visible=True)
+            else:
+                script = self.__get_animations()[animation_name](start_as_visible=start_as_visible)
+            script.freeze()
+            # Render the JS templates up front so that generation only substitutes component ids
+            script.get_templates()
+            script = self.__scripts.setdefault(key, script)
+        return script
+
+
+ANIMATION_SCRIPT_REGISTRY = AnimationScriptRegistry()
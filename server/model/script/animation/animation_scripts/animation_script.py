@@ -1,6 +1,44 @@
+from typing import Optional
+
+from server.model.script.animation.animation_scripts.animation_script_templates import AnimationScriptTemplates
+from server.model.script.animation.animation_scripts.animation_script_templates import COMPONENT_ID_PLACEHOLDER
+
+
 class AnimationScript:
+    """
+    Scripts are shared between components by the registry, so they cannot be changed once built.
+
+    Subclasses, including plugins, take ``start_as_visible`` and pass it on to this ``__init__``. They may set their
+    own attributes in ``__init__``; the registry freezes every script it builds, after which setting one raises.
+    """
+
     def __init__(self, start_as_visible: bool):
         self.start_as_visible = start_as_visible
+        self._templates = None
+        self._frozen = False
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"{type(self).__name__} is immutable")
+        object.__setattr__(self, name, value)
+
+    def freeze(self) -> None:
+        """Reject any further change, once the script is about to be shared."""
+        self._frozen = True
+
+    def get_templates(self) -> AnimationScriptTemplates:
+        """Enter/exit/init JS rendered once with a placeholder id, to be filled in per component."""
+        templates: Optional[AnimationScriptTemplates] = self._templates
+        if templates is None:
+            templates = AnimationScriptTemplates(
+                init=self.get_init_js(COMPONENT_ID_PLACEHOLDER),
+                enter=self.get_enter_js(COMPONENT_ID_PLACEHOLDER),
+                exit=self.get_exit_js(COMPONENT_ID_PLACEHOLDER),
+                enter_back=self.get_enter_back_js(COMPONENT_ID_PLACEHOLDER),
+                exit_back=self.get_exit_back_js(COMPONENT_ID_PLACEHOLDER),
+            )
+            object.__setattr__(self, "_templates", templates)  # noqa: PLC2801
+        return templates
 
     def get_enter_js(self, component_id):
         return ""
@@ -16,18 +54,3 @@ class AnimationScript:
 
     def get_init_js(self, component_id):
         return ""
-
-    @staticmethod
-    def builder():
-        return AnimationScript.Builder()
-
-    class Builder:
-        def __init__(self):
-            self._start_as_visible = True
-
-        def set_initial_visibility(self, initial_visibility: bool):
-            self._start_as_visible = initial_visibility
-            return self
-
-        def build(self):
-            return AnimationScript(self._start_as_visible)
@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from pydantic import ConfigDict
+
+# Stand-in component id the templates are rendered with, replaced by the real id for each component
+COMPONENT_ID_PLACEHOLDER = "__component__"
+
+
+class AnimationScriptTemplates(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    init: str
+    enter: str
+    exit: str
+    enter_back: str
+    exit_back: str
+
+    @staticmethod
+    def render(template: str, component_id: str) -> str:
+        return template.replace(COMPONENT_ID_PLACEHOLDER, component_id)
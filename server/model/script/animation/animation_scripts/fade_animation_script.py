@@ -12,18 +12,3 @@ class FadeAnimationScript(AnimationScript):
         if self.start_as_visible:
             return f"""gsap.set("#{component_id}", {{opacity: 1}});"""
         return f"""gsap.set("#{component_id}", {{opacity: 0}});"""
-
-    @staticmethod
-    def builder():
-        return FadeAnimationScript.Builder()
-
-    class Builder:
-        def __init__(self) -> None:
-            self._start_as_visible = True
-
-        def set_initial_visibility(self, initial_visibility: bool):
-            self._start_as_visible = initial_visibility
-            return self
-
-        def build(self):
-            return FadeAnimationScript(self._start_as_visible)
@@ -12,18 +12,3 @@ class FlyInRightAnimationScript(AnimationScript):
             return f"""gsap.set("#{component_id}", {{opacity: 1, x: 0}});"""
         else:
             return f"""gsap.set("#{component_id}", {{opacity: 0, x: 500}});"""
-
-    @staticmethod
-    def builder():
-        return FlyInRightAnimationScript.Builder()
-
-    class Builder:
-        def __init__(self):
-            self._start_as_visible = True
-
-        def set_initial_visibility(self, initial_visibility: bool):
-            self._start_as_visible = initial_visibility
-            return self
-
-        def build(self):
-            return FlyInRightAnimationScript(self._start_as_visible)
@@ -16,18 +16,3 @@ class OverlapAnimationScript(AnimationScript):
             return f"""gsap.set("#{component_id}", {{opacity: 1}});"""
         else:
             return f"""gsap.set("#{component_id}", {{opacity: 0}});"""
-
-    @staticmethod
-    def builder():
-        return OverlapAnimationScript.Builder()
-
-    class Builder:
-        def __init__(self):
-            self._start_as_visible = True
-
-        def set_initial_visibility(self, initial_visibility: bool):
-            self._start_as_visible = initial_visibility
-            return self
-
-        def build(self):
-            return OverlapAnimationScript(self._start_as_visible)
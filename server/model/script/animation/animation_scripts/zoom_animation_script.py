@@ -12,18 +12,3 @@ class ZoomAnimationScript(AnimationScript):
             return f"""gsap.set("#{component_id}", {{scale: 1}});"""
         else:
             return f"""gsap.set("#{component_id}", {{scale: 0}});"""
-
-    @staticmethod
-    def builder():
-        return ZoomAnimationScript.Builder()
-
-    class Builder:
-        def __init__(self):
-            self._start_as_visible = True
-
-        def set_initial_visibility(self, initial_visibility: bool):
-            self._start_as_visible = initial_visibility
-            return self
-
-        def build(self):
-            return ZoomAnimationScript(self._start_as_visible)
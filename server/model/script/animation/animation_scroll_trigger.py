@@ -1,3 +1,6 @@
+from typing import Optional
+from typing import Tuple
+
 from server.model.script.animation.animation_scripts.animation_script import AnimationScript
 from server.model.script.animation.util.component_id_parser import ComponentIdParser
 
@@ -10,8 +13,9 @@ class AnimationScrollTrigger:
         end_length: int,
         animation_script: AnimationScript,
         scroll_speed: int = 50,
+        parsed_id: Optional[Tuple[str, str, str]] = None,
     ) -> None:
-        self.page_id, self.frame_id, self.component_id = ComponentIdParser.parse(component_id)
+        self.page_id, self.frame_id, self.component_id = parsed_id or ComponentIdParser.parse(component_id)
         self.start_length = start_length
         self.end_left = end_length
         self.scroll_speed = scroll_speed
@@ -28,8 +32,10 @@ class AnimationScrollTrigger:
         return f"+={self.scroll_speed * self.end_left}%"
 
     def get_trigger_js(self) -> str:
+        templates = self.animation_script.get_templates()
+        element_id = "comp-" + self.component_id
         return f"""
-        {self.animation_script.get_init_js("comp-" + self.component_id)}
+        {templates.render(templates.init, element_id)}
         gsap.timeline({{
             scrollTrigger: {{
                 trigger: "#page-{self.page_id}",
@@ -39,19 +45,19 @@ class AnimationScrollTrigger:
                 scroller: ".scroller",
                 onEnter: () => {{
                     console.log("Entering {self.page_id}-{self.frame_id}");
-                    {self.animation_script.get_enter_js("comp-" + self.component_id)}
+                    {templates.render(templates.enter, element_id)}
                 }},
                 onLeave: () => {{
                     console.log("Leaving {self.page_id}-{self.frame_id}");
-                    {self.animation_script.get_exit_js("comp-" + self.component_id)}
+                    {templates.render(templates.exit, element_id)}
                 }},
                 onEnterBack: () => {{
                     console.log("Entering back {self.page_id}-{self.frame_id}");
-                    {self.animation_script.get_enter_back_js("comp-" + self.component_id)}
+                    {templates.render(templates.enter_back, element_id)}
                 }},
                 onLeaveBack: () => {{
                     console.log("Leaving back {self.page_id}-{self.frame_id}");
-                    {self.animation_script.get_exit_back_js("comp-" + self.component_id)}
+                    {templates.render(templates.exit_back, element_id)}
                 }},
                 toggleActions: "play none reverse none",
                 invalidateOnRefresh: true,
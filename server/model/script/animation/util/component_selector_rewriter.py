@@ -0,0 +1,85 @@
+from typing import List
+from typing import Optional
+
+from server.model.script.animation.animation_scripts.animation_script_templates import COMPONENT_ID_PLACEHOLDER
+
+# Name of the parameter holding the "#<element id>" selector in the functions of the compact runtime
+SELECTOR_PARAMETER = "selector"
+QUOTES = "'\"`"
+
+
+class ComponentSelectorRewriter:
+    """
+    Rewrites animation JS rendered with the placeholder id into code reading the id from ``selector``, wherever the
+    placeholder appears in a string literal: alone, after a "#", among other text or in a template literal.
+    """
+
+    @staticmethod
+    def rewrite(js: str) -> Optional[str]:
+        """The rewritten JS, or None if the placeholder is used outside of a string literal that can be rewritten."""
+        output: List[str] = []
+        code_start = 0
+        index = 0
+        while index < len(js):
+            if js.startswith("//", index):
+                end = js.find("\n", index)
+                index = len(js) if end == -1 else end
+            elif js.startswith("/*", index):
+                end = js.find("*/", index + 2)
+                if end == -1:
+                    return None
+                index = end + 2
+            elif js[index] in QUOTES:
+                end = ComponentSelectorRewriter.__find_closing_quote(js, index)
+                literal = (
+                    None if end is None else ComponentSelectorRewriter.__rewrite_literal(js[index], js[index + 1 : end])
+                )
+                if literal is None or COMPONENT_ID_PLACEHOLDER in js[code_start:index]:
+                    return None
+                output.extend((js[code_start:index], literal))
+                index = code_start = end + 1
+            else:
+                index += 1
+        if COMPONENT_ID_PLACEHOLDER in js[code_start:]:
+            return None
+        output.append(js[code_start:])
+        return "".join(output)
+
+    @staticmethod
+    def __find_closing_quote(js: str, start: int) -> Optional[int]:
+        index = start + 1
+        while index < len(js):
+            if js[index] == "\\":
+                index += 2
+            elif js[index] == js[start]:
+                return index
+            else:
+                index += 1
+        return None
+
+    @staticmethod
+    def __rewrite_literal(quote: str, content: str) -> Optional[str]:
+        if COMPONENT_ID_PLACEHOLDER not in content:
+            return f"{quote}{content}{quote}"
+        if quote == "`":
+            # The placeholder could be inside an embedded expression, where it is code rather than text
+            if "${" in content:
+                return None
+            return f"`{content.replace(COMPONENT_ID_PLACEHOLDER, '${' + SELECTOR_PARAMETER + '.slice(1)}')}`"
+
+        parts = content.split(COMPONENT_ID_PLACEHOLDER)
+        pieces = []
+        for index, part in enumerate(parts):
+            text, expression = part, None
+            if index < len(parts) - 1:
+                expression = f"{SELECTOR_PARAMETER}.slice(1)"
+                if text.endswith("#"):
+                    text, expression = text[:-1], SELECTOR_PARAMETER
+            # A trailing backslash would escape the closing quote
+            if (len(text) - len(text.rstrip("\\"))) % 2:
+                return None
+            if text:
+                pieces.append(f"{quote}{text}{quote}")
+            if expression is not None:
+                pieces.append(expression)
+        return pieces[0] if len(pieces) == 1 else f"({' + '.join(pieces)})"
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class AnimationScriptMode(str, Enum):
+    COMPACT = "compact"
+    INLINE = "inline"
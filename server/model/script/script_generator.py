@@ -1,46 +1,43 @@
-import io
-from pathlib import Path
+from typing import Sequence
 
-from server.model.page import Page
+from server.model.ir.page_ir import PageIR
+from server.model.script.animation.animation_runtime_builder import AnimationRuntimeBuilder
+from server.model.script.animation_script_mode import AnimationScriptMode
 from server.model.script.script_constants import gsap_init_js
 from server.model.script.script_processor import ScriptProcessor
-from server.utilities.constants import BUCKET
-from server.utilities.constants import LOCAL_OUTPUT_DIR
-from server.utilities.constants import MINIO_CLIENT
-from server.utilities.constants import MINIO_PRIVATE_ARTICLE_BUCKET
-from server.utilities.constants import S3_BUCKET
-from server.utilities.constants import S3_CLIENT
+from server.storage.storage_backend_factory import StorageBackendFactory
+from server.utilities.constants import ANIMATION_SCRIPT_MODE
 
 
 class ScriptGenerator:
-    def __init__(self, pages: list[Page], article_id: str) -> None:
+    def __init__(
+        self, pages: Sequence[PageIR], article_id: str, mode: AnimationScriptMode = ANIMATION_SCRIPT_MODE
+    ) -> None:
         self.article_id = article_id
         self.pages = pages
+        self.mode = mode
 
     def generate(self) -> str:
-        string_builder = [gsap_init_js]
-        script_processor = ScriptProcessor(string_builder)
+        string_builder = [ScriptGenerator.generate_init(self.mode)]
+        script_processor = ScriptProcessor(string_builder, self.mode)
         script_processor.process_pages(self.pages)
         return "".join(string_builder)
 
+    @staticmethod
+    def generate_init(mode: AnimationScriptMode = ANIMATION_SCRIPT_MODE) -> str:
+        """Shared GSAP initialisation, followed by the animation runtime when pages are emitted as tables."""
+        if mode == AnimationScriptMode.COMPACT:
+            return gsap_init_js + AnimationRuntimeBuilder.build_runtime_js()
+        return gsap_init_js
+
+    @staticmethod
+    def generate_page(page: PageIR, mode: AnimationScriptMode = ANIMATION_SCRIPT_MODE) -> str:
+        """Generate the animation script of a single page, without the shared GSAP initialisation."""
+        string_builder = []
+        ScriptProcessor(string_builder, mode).process_page(page)
+        return "".join(string_builder)
+
     def generate_and_export(self) -> None:
-        scripts = self.generate()
-        if BUCKET == "LOCAL":
-            Path.mkdir(LOCAL_OUTPUT_DIR / self.article_id / "js", parents=True, exist_ok=True)
-            Path(LOCAL_OUTPUT_DIR / self.article_id / "js" / "animation.js").write_bytes(scripts.encode())
-        elif BUCKET == "MINIO":
-            MINIO_CLIENT.put_object(
-                MINIO_PRIVATE_ARTICLE_BUCKET,
-                f"{self.article_id}/js/animation.js",
-                io.BytesIO(scripts.encode()),
-                length=len(scripts.encode()),
-                content_type="text/javascript",
-            )
-        else:
-            S3_CLIENT.put_object(
-                Body=io.BytesIO(scripts.encode()),
-                Bucket=S3_BUCKET,
-                ServerSideEncryption="AES256",
-                Key=f"private-articles/{self.article_id}/js/animation.js",
-                ContentType="text/javascript",
-            )
+        StorageBackendFactory.get_storage_backend().put(
+            f"{self.article_id}/js/animation.js", self.generate().encode(), "text/javascript"
+        )
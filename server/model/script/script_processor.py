@@ -1,33 +1,40 @@
 from typing import List
+from typing import Sequence
 
-from server.model.frame import Frame
-from server.model.page import Page
+from server.model.ir.page_ir import PageIR
+from server.model.script.animation.animation_runtime_builder import AnimationRuntimeBuilder
 from server.model.script.animation.animation_script_processor import AnimationScriptProcessor
-from server.model.script.animation.util.component_groups import ComponentGroups
+from server.model.script.animation_script_mode import AnimationScriptMode
 from server.model.script.pin_script_builder import PinScriptBuilder
 
 
 class ScriptProcessor:
-    def __init__(self, string_builder: List[str]) -> None:
+    def __init__(self, string_builder: List[str], mode: AnimationScriptMode = AnimationScriptMode.INLINE) -> None:
         self.string_builder = string_builder
+        self.mode = mode
 
-    def process_pages(self, pages: list[Page]) -> None:
+    def process_pages(self, pages: Sequence[PageIR]) -> None:
         for page in pages:
-            if page.pinnable:
-                frames = page.frames
-                component_groups = ComponentGroups()
-                self.__process_frames(frames, component_groups)
-                self.__append_animation_scripts(component_groups)
-                self.__append_page_pinning_script(page, component_groups)
-
-    def __append_page_pinning_script(self, page: Page, component_groups: ComponentGroups) -> None:
-        pin_js = PinScriptBuilder.build_pin_js(page.id, component_groups.get_biggest_group_size())
-        self.string_builder.append(pin_js)
+            self.process_page(page)
+
+    def process_page(self, page: PageIR) -> None:
+        if page.pinnable:
+            if self.mode == AnimationScriptMode.COMPACT:
+                rows = AnimationScriptProcessor.build_animation_rows(page)
+                # Animations missing from the runtime fall back to inline scripts for the whole page
+                if all(AnimationRuntimeBuilder.supports(row[1]) for row in rows):
+                    self.__append_animation_table(page, rows)
+                    return
+            self.__append_animation_scripts(page)
+            self.__append_page_pinning_script(page)
 
-    def __append_animation_scripts(self, component_groups: ComponentGroups) -> None:
-        AnimationScriptProcessor.process_animation_scripts(component_groups, self.string_builder)
+    def __append_animation_table(self, page: PageIR, rows: List[list]) -> None:
+        page_js = AnimationRuntimeBuilder.build_page_js(page.id, rows, page.pin_length)
+        self.string_builder.append(page_js)
+
+    def __append_page_pinning_script(self, page: PageIR) -> None:
+        pin_js = PinScriptBuilder.build_pin_js(page.id, page.pin_length)
+        self.string_builder.append(pin_js)
 
-    def __process_frames(self, frames: list[Frame], component_groups: ComponentGroups) -> None:
-        for frame in frames:
-            for component in frame.components:
-                component_groups.add_component(component)
+    def __append_animation_scripts(self, page: PageIR) -> None:
+        AnimationScriptProcessor.process_animation_scripts(page, self.string_builder)
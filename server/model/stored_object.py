@@ -0,0 +1,10 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class StoredObject(BaseModel):
+    key: str
+    size: int
+    etag: Optional[str] = None
+    content_type: Optional[str] = None
@@ -1,89 +1,97 @@
-from typing import List
-from typing import Tuple
-
-from server.content_generator import generate_component_html
-from server.content_generator import generate_css
-from server.content_generator import generate_html
-from server.content_generator import inject_component_css
-from server.content_generator import inject_pinned_page_css
-from server.model.component import Component
-from server.model.page import Page
+import itertools
+import logging
+from typing import Optional
+from typing import Sequence
+
+from server.content_generator import generate_css_fragments
+from server.content_generator import generate_html_fragments
+from server.content_generator import generate_page_css
+from server.content_generator import generate_page_html
+from server.model.article_assets import ArticleAssets
+from server.model.artifact import Artifact
+from server.model.html_output_mode import HtmlOutputMode
+from server.model.ir.page_ir import PageIR
+from server.model.page_fragment import PageFragment
 from server.model.script.script_generator import ScriptGenerator
-
-
-def process_pages(article_id: str, pages: list[Page], title: str) -> str:
-    html_output = ""
-    css_output = ""
-
-    for page in pages:
-        pinnable = page.pinnable
-        if pinnable:
-            html_page = parse_pinned_page_to_html(page, article_id)
-            html_output += html_page + "\n"
-            css_output += inject_pinned_page_css(page.layout, page.id) + "\n"
-            css_output += inject_component_css(page.layout, page.frames, page.id, pinnable) + "\n"
-
-        else:
-            html_page = parse_page_to_html(page, article_id)
-            html_output += html_page + "\n"
-            css_output += inject_component_css(page.layout, page.frames, page.id, pinnable) + "\n"
-
-    message = generate_html(article_id, html_output, title)
-    generate_css(article_id, css_output)
-    script_generator = ScriptGenerator(pages, article_id)
-    script_generator.generate_and_export()
-    return message
-
-
-def parse_pinned_page_to_html(page: Page, article_id: str) -> str:
-    # left-right, top-bottom, single
-    layout_template = page.layout.template
-    components_by_position = {"left": [], "right": [], "top": [], "bottom": [], "center": []}
-
-    # Map components by their position
-    for frame_index, frame in enumerate(page.frames):
-        for component in frame.components:
-            if component.position in components_by_position:
-                components_by_position[component.position].append((component, frame_index))
-
-    # Helper function to build div HTML for left-right and top-bottom templates
-    def build_section_html(position: str, position_components: List[Tuple[Component, int]]) -> str:
-        div_wrapper = f'<div id="page-{page.id}-{position}">'
-        component_class_name = "page-" + page.id + "-" + position + "-component"
-        for component, frame_index in position_components:
-            div_wrapper += generate_component_html(component, component_class_name, article_id, frame_index)
-        div_wrapper += "</div>"
-        return div_wrapper
-
-    if layout_template == "left-right":
-        pinned_section_wrapper = f'<section id="page-{page.id}">'
-        # Build left and right sections
-        pinned_section_wrapper += build_section_html("left", components_by_position["left"])
-        pinned_section_wrapper += build_section_html("right", components_by_position["right"])
-
-    elif layout_template == "top-bottom":
-        pinned_section_wrapper = f'<section id="page-{page.id}" class="page-center">'
-        # Build top and bottom sections
-        pinned_section_wrapper += build_section_html("top", components_by_position["top"])
-        pinned_section_wrapper += build_section_html("bottom", components_by_position["bottom"])
-
-    elif layout_template == "single":
-        pinned_section_wrapper = f'<section id="page-{page.id}" class="page-center">'
-        position_components = components_by_position["center"]
-        component_class_name = "page-" + page.id + "-center-component"
-        for component, frame_index in position_components:
-            pinned_section_wrapper += generate_component_html(component, component_class_name, article_id, frame_index)
-
-    pinned_section_wrapper += "</section>"
-    return pinned_section_wrapper
-
-
-def parse_page_to_html(page: Page, article_id: str) -> str:
-    section_wrapper = f'<section id="page-{page.id}" class="page-center">'
-
-    for frame_index, frame in enumerate(page.frames):
-        component_class_name = "page-" + page.id + "-center-component"
-        for component in frame.components:
-            section_wrapper += generate_component_html(component, component_class_name, article_id, frame_index)
-    section_wrapper += "</section>"
-    return section_wrapper
+from server.storage.storage_backend_factory import StorageBackendFactory
+from server.utilities.article_assets import get_assets_version
+from server.utilities.article_assets import load_article_assets
+from server.utilities.constants import HTML_OUTPUT_MODE
+from server.utilities.fragments import encode_fragments
+from server.utilities.lazy_sequence import LazySequence
+from server.utilities.manifest import build_manifest
+from server.utilities.manifest import write_manifest
+from server.utilities.metrics import time_stage
+from server.utilities.page_fragment_cache import PAGE_FRAGMENT_CACHE
+from server.utilities.precompression import Precompressor
+from server.utilities.precompression import get_precompressed_keys
+
+logger = logging.getLogger(__name__)
+
+
+def process_pages(
+    article_id: str, pages: Sequence[PageIR], title: str, output_mode: HtmlOutputMode = HTML_OUTPUT_MODE
+) -> str:
+    storage_backend = StorageBackendFactory.get_storage_backend()
+    assets = load_article_assets(storage_backend, article_id)
+    # Pages are rendered lazily, once, as the first of the streams below reaches them, and released once all have
+    # read them
+    html_pages, css_pages, dom_pages, js_pages = LazySequence(
+        render_page(page, article_id, assets) for page in pages
+    ).split(4)
+    html_fragments = generate_html_fragments((fragment.html for fragment in html_pages), title, output_mode)
+    css_fragments = generate_css_fragments(
+        (fragment.css for fragment in css_pages), (fragment.html for fragment in dom_pages), output_mode
+    )
+    js_fragments = itertools.chain([ScriptGenerator.generate_init()], (fragment.js for fragment in js_pages))
+
+    precompressors = [
+        Precompressor(f"{article_id}/index.html", "text/html"),
+        Precompressor(f"{article_id}/css/styles.css", "text/css"),
+        Precompressor(f"{article_id}/js/animation.js", "text/javascript"),
+    ]
+    # Remove the compressed copies of the previous build first, so that they are never served next to the new
+    # originals. Until the new copies are written below, clients are sent the uncompressed originals instead.
+    stale_keys = [key for precompressor in precompressors for key in get_precompressed_keys(precompressor.key)]
+    list(storage_backend.get_executor().map(storage_backend.delete, stale_keys))
+    # Stream index.html, styles.css and animation.js to storage concurrently while they are generated
+    storage_backend.put_many([
+        Artifact(
+            key=precompressor.key,
+            content_type=precompressor.content_type,
+            fragments=precompressor.wrap(encode_fragments(fragments)),
+        )
+        for precompressor, fragments in zip(precompressors, [html_fragments, css_fragments, js_fragments])
+    ])
+    logger.info(f"Page fragment cache for {article_id}: {PAGE_FRAGMENT_CACHE.get_stats()}")
+    # Compressed once per build, next to the originals, for servers that serve precompressed files
+    with time_stage("precompression"):
+        storage_backend.put_many([
+            artifact for precompressor in precompressors for artifact in precompressor.get_artifacts()
+        ])
+    ratios = "; ".join(precompressor.describe() for precompressor in precompressors)
+    logger.info(f"Precompressed {article_id}: {ratios}")
+
+    # Record every artifact with its ETag so publishing only copies what changed
+    write_manifest(storage_backend, article_id, build_manifest(storage_backend, article_id, assets))
+    return storage_backend.get_url(f"{article_id}/index.html")
+
+
+def render_page(page: PageIR, article_id: str, assets: Optional[ArticleAssets] = None) -> PageFragment:
+    """Render the HTML section, CSS and animation script of a page, reusing the cached fragment if unchanged."""
+    assets = assets or ArticleAssets()
+    assets_version = get_assets_version(assets, page.asset_names)
+    fingerprint = PAGE_FRAGMENT_CACHE.fingerprint(page, article_id, assets_version)
+    fragment = PAGE_FRAGMENT_CACHE.get(fingerprint)
+    if fragment is not None:
+        return fragment
+
+    with time_stage("html_render"):
+        html_page = generate_page_html(page, article_id, assets)
+    with time_stage("css_generation"):
+        css_page = generate_page_css(page)
+    with time_stage("script_generation"):
+        js_page = ScriptGenerator.generate_page(page)
+    fragment = PageFragment(html=html_page + "\n", css=css_page, js=js_page)
+    PAGE_FRAGMENT_CACHE.put(fingerprint, fragment)
+    return fragment
@@ -0,0 +1,25 @@
+import io
+from typing import Iterable
+
+
+class FragmentReader(io.RawIOBase):
+    """Read-only file object over an iterable of byte fragments, for clients that upload from a stream."""
+
+    def __init__(self, fragments: Iterable[bytes]) -> None:
+        super().__init__()
+        self._fragments = iter(fragments)
+        self._current = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray) -> int:
+        while not self._current:
+            fragment = next(self._fragments, None)
+            if fragment is None:
+                return 0
+            self._current = memoryview(fragment)
+        size = min(len(buffer), len(self._current))
+        buffer[:size] = self._current[:size]
+        self._current = self._current[size:]
+        return size
@@ -0,0 +1,119 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import BinaryIO
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from server.model.stored_object import StoredObject
+from server.storage.storage_backend import StorageBackend
+from server.utilities.constants import STREAM_CHUNK_SIZE
+from server.utilities.metrics import BYTES_WRITTEN
+from server.utilities.metrics import STORAGE_OPERATION_DURATION
+from server.utilities.metrics import get_artifact_type
+
+
+class InstrumentedStorageBackend(StorageBackend):
+    """Records the duration of every storage call and the bytes written, labeled with the wrapped backend."""
+
+    def __init__(self, backend: StorageBackend) -> None:
+        super().__init__(pool_size=backend.pool_size)
+        self.backend = backend
+        self.name = backend.name
+
+    def __getattr__(self, name: str) -> Any:
+        # Backend specific helpers such as LocalStorageBackend.get_path
+        if name == "backend":
+            raise AttributeError(name)
+        return getattr(self.backend, name)
+
+    def __time(self, operation: str) -> Any:
+        return STORAGE_OPERATION_DURATION.time(operation=operation, backend=self.name)
+
+    def __count_bytes(self, key: str, size: int) -> None:
+        BYTES_WRITTEN.inc(size, artifact_type=get_artifact_type(key), backend=self.name)
+
+    def bootstrap(self) -> None:
+        self.backend.bootstrap()
+
+    def put(self, key: str, data: bytes, content_type: str) -> None:
+        with self.__time("put"):
+            self.backend.put(key, data, content_type)
+        self.__count_bytes(key, len(data))
+
+    def put_stream(self, key: str, stream: BinaryIO, length: int, content_type: str) -> None:
+        with self.__time("put"):
+            self.backend.put_stream(key, stream, length, content_type)
+        if length is not None and length >= 0:
+            self.__count_bytes(key, length)
+
+    def put_fragments(self, key: str, fragments: Iterable[bytes], content_type: str) -> None:
+        size = 0
+
+        def count(fragments: Iterable[bytes]) -> Iterator[bytes]:
+            nonlocal size
+            for fragment in fragments:
+                size += len(fragment)
+                yield fragment
+
+        # Includes the time spent rendering the fragments, as they are produced while they are uploaded
+        with self.__time("put_fragments"):
+            self.backend.put_fragments(key, count(fragments), content_type)
+        self.__count_bytes(key, size)
+
+    def get(self, key: str) -> bytes:
+        with self.__time("get"):
+            return self.backend.get(key)
+
+    def exists(self, key: str) -> bool:
+        with self.__time("exists"):
+            return self.backend.exists(key)
+
+    def delete(self, key: str) -> None:
+        with self.__time("delete"):
+            self.backend.delete(key)
+
+    def stat(self, key: str) -> Optional[StoredObject]:
+        with self.__time("stat"):
+            return self.backend.stat(key)
+
+    def copy_to(
+        self, key: str, destination: StorageBackend, content_type: str, cache_control: Optional[str] = None
+    ) -> None:
+        # Unwrap, so that backends still recognise their own kind for server-side copies
+        inner_destination = destination.backend if isinstance(destination, InstrumentedStorageBackend) else destination
+        with self.__time("copy"):
+            self.backend.copy_to(key, inner_destination, content_type, cache_control)
+
+    def iter_chunks(self, key: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        # Only the time spent fetching chunks, not the time the consumer spends between them
+        elapsed = 0.0
+        chunks = self.backend.iter_chunks(key, chunk_size)
+        try:
+            while True:
+                started = time.perf_counter()
+                chunk = next(chunks, None)
+                elapsed += time.perf_counter() - started
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+            STORAGE_OPERATION_DURATION.observe(elapsed, operation="get_stream", backend=self.name)
+
+    def list_objects(self, prefix: str) -> List[StoredObject]:
+        with self.__time("list"):
+            return self.backend.list_objects(prefix)
+
+    def get_url(self, key: str) -> str:
+        return self.backend.get_url(key)
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        return self.backend.get_executor()
+
+    def close(self) -> None:
+        self.backend.close()
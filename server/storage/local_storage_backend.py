@@ -0,0 +1,173 @@
+import io
+import mimetypes
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from server.model.stored_object import StoredObject
+from server.storage.storage_backend import StorageBackend
+from server.utilities.constants import LOCAL_OUTPUT_DIR
+from server.utilities.constants import STREAM_CHUNK_SIZE
+
+# Suffix of the file next to an object holding its content type, when it cannot be guessed from the name
+CONTENT_TYPE_SUFFIX = ".content-type"
+
+
+class LocalStorageBackend(StorageBackend):
+    name = "LOCAL"
+
+    def __init__(self, root_dir: Path = LOCAL_OUTPUT_DIR, **kwargs: int) -> None:
+        super().__init__(**kwargs)
+        self.root_dir = root_dir
+
+    def bootstrap(self) -> None:
+        Path.mkdir(self.root_dir, parents=True, exist_ok=True)
+
+    def put(self, key: str, data: bytes, content_type: str) -> None:
+        path = self.get_path(key)
+        Path.mkdir(path.parent, parents=True, exist_ok=True)
+        LocalStorageBackend.__write_content_type(path, content_type)
+        path.write_bytes(data)
+
+    def put_stream(self, key: str, stream: BinaryIO, length: int, content_type: str) -> None:  # noqa: ARG002
+        with self.__open_partial(key, content_type) as file:
+            if not LocalStorageBackend.__send_file(stream, file):
+                shutil.copyfileobj(stream, file, STREAM_CHUNK_SIZE)
+
+    def put_fragments(self, key: str, fragments: Iterable[bytes], content_type: str) -> None:
+        with self.__open_partial(key, content_type) as file:
+            for fragment in fragments:
+                file.write(fragment)
+
+    def get(self, key: str) -> bytes:
+        return self.get_path(key).read_bytes()
+
+    def exists(self, key: str) -> bool:
+        return self.get_path(key).is_file()
+
+    def delete(self, key: str) -> None:
+        path = self.get_path(key)
+        path.unlink(missing_ok=True)
+        LocalStorageBackend.__get_content_type_path(path).unlink(missing_ok=True)
+
+    def stat(self, key: str) -> Optional[StoredObject]:
+        path = self.get_path(key)
+        if not path.is_file():
+            return None
+        stat = path.stat()
+        return StoredObject(
+            key=key,
+            size=stat.st_size,
+            etag=LocalStorageBackend.__get_etag(stat),
+            content_type=LocalStorageBackend.__read_content_type(path),
+        )
+
+    def iter_chunks(self, key: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        with self.get_path(key).open("rb") as file:
+            while chunk := file.read(chunk_size):
+                yield chunk
+
+    def list_objects(self, prefix: str) -> List[StoredObject]:
+        directory, _, name_prefix = prefix.rpartition("/")
+        base_dir = self.root_dir / directory
+        if not base_dir.is_dir():
+            return []
+        stored_objects = []
+        for path in sorted(base_dir.rglob("*")):
+            if (
+                path.is_file()
+                and not path.name.endswith((".partial", CONTENT_TYPE_SUFFIX))
+                and path.relative_to(base_dir).as_posix().startswith(name_prefix)
+            ):
+                stat = path.stat()
+                stored_objects.append(
+                    StoredObject(
+                        key=path.relative_to(self.root_dir).as_posix(),
+                        size=stat.st_size,
+                        etag=LocalStorageBackend.__get_etag(stat),
+                    )
+                )
+        return stored_objects
+
+    def get_url(self, key: str) -> str:
+        return str(self.get_path(key))
+
+    def get_path(self, key: str) -> Path:
+        return self.root_dir / key
+
+    @contextmanager
+    def __open_partial(self, key: str, content_type: str) -> Iterator[BinaryIO]:
+        """
+        Open a file next to the target, renamed over it once written, so readers never see a half-written file.
+        Every write has its own file, so concurrent writes of the same key do not truncate each other.
+        """
+        path = self.get_path(key)
+        Path.mkdir(path.parent, parents=True, exist_ok=True)
+        file_descriptor, partial_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".partial")
+        partial_path = Path(partial_name)
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                yield file
+            # Readable like the files written by put, rather than only by the owner as mkstemp creates them
+            partial_path.chmod(0o644)
+            LocalStorageBackend.__write_content_type(path, content_type)
+            partial_path.replace(path)
+        finally:
+            partial_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def __get_content_type_path(path: Path) -> Path:
+        return path.with_name(f".{path.name}{CONTENT_TYPE_SUFFIX}")
+
+    @staticmethod
+    def __write_content_type(path: Path, content_type: str) -> None:
+        """Keep the content type of objects named without an extension, e.g. shared assets named by hash."""
+        content_type_path = LocalStorageBackend.__get_content_type_path(path)
+        if mimetypes.guess_type(path.name)[0] == content_type:
+            content_type_path.unlink(missing_ok=True)
+        else:
+            # Written before the object, so that it is never served without it
+            content_type_path.write_text(content_type, encoding="utf-8")
+
+    @staticmethod
+    def __read_content_type(path: Path) -> Optional[str]:
+        try:
+            content_type = LocalStorageBackend.__get_content_type_path(path).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            content_type = ""
+        return content_type or mimetypes.guess_type(path.name)[0]
+
+    @staticmethod
+    def __get_etag(stat: os.stat_result) -> str:
+        # Files are never copied anywhere, so size and mtime are enough to detect changes
+        return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+    @staticmethod
+    def __send_file(stream: BinaryIO, file: BinaryIO) -> bool:
+        """Copy a file-backed stream in the kernel with sendfile, returning False when it cannot be used."""
+        if not hasattr(os, "sendfile"):
+            return False
+        try:
+            source_fd = stream.fileno()
+            offset = stream.tell()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return False
+        file.flush()
+        while True:
+            try:
+                sent = os.sendfile(file.fileno(), source_fd, offset, STREAM_CHUNK_SIZE)
+            except OSError:
+                # Not supported between these file types, fall back to copying if nothing was sent yet
+                if offset == stream.tell():
+                    return False
+                raise
+            if sent == 0:
+                return True
+            offset += sent
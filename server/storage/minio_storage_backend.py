@@ -0,0 +1,125 @@
+import io
+from typing import BinaryIO
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from minio import Minio
+from minio.commonconfig import CopySource
+from minio.commonconfig import REPLACE
+from minio.error import S3Error
+
+from server.model.stored_object import StoredObject
+from server.storage.fragment_reader import FragmentReader
+from server.storage.storage_backend import StorageBackend
+from server.utilities.constants import MINIO_PREVIEW_ENDPOINT
+from server.utilities.constants import MINIO_PRIVATE_ARTICLE_BUCKET
+from server.utilities.constants import MINIO_PUBLIC_ARTICLE_BUCKET
+from server.utilities.constants import MINIO_SCHEME
+from server.utilities.constants import MULTIPART_PART_SIZE
+from server.utilities.constants import STREAM_CHUNK_SIZE
+
+
+class MinioStorageBackend(StorageBackend):
+    name = "MINIO"
+
+    def __init__(self, client: Minio, bucket: str = MINIO_PRIVATE_ARTICLE_BUCKET, **kwargs: int) -> None:
+        super().__init__(**kwargs)
+        self.client = client
+        self.bucket = bucket
+
+    def bootstrap(self) -> None:
+        for bucket in (MINIO_PRIVATE_ARTICLE_BUCKET, MINIO_PUBLIC_ARTICLE_BUCKET):
+            if not self.client.bucket_exists(bucket):
+                self.client.make_bucket(bucket)
+
+    def put_stream(self, key: str, stream: BinaryIO, length: int, content_type: str) -> None:
+        # Large objects are uploaded as multipart parts, several at a time
+        self.client.put_object(
+            self.bucket,
+            key,
+            stream,
+            length=length,
+            part_size=MULTIPART_PART_SIZE,
+            num_parallel_uploads=self.pool_size,
+            content_type=content_type,
+        )
+
+    def put_fragments(self, key: str, fragments: Iterable[bytes], content_type: str) -> None:
+        # With an unknown length the client uploads each part as soon as it has been read from the stream
+        self.client.put_object(
+            self.bucket,
+            key,
+            io.BufferedReader(FragmentReader(fragments)),
+            length=-1,
+            part_size=MULTIPART_PART_SIZE,
+            content_type=content_type,
+        )
+
+    def get(self, key: str) -> bytes:
+        response = self.client.get_object(self.bucket, key)
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.client.stat_object(self.bucket, key)
+        except S3Error as error:
+            if error.code in {"NoSuchKey", "NoSuchObject"}:
+                return False
+            raise
+        return True
+
+    def delete(self, key: str) -> None:
+        self.client.remove_object(self.bucket, key)
+
+    def stat(self, key: str) -> Optional[StoredObject]:
+        try:
+            stat = self.client.stat_object(self.bucket, key)
+        except S3Error as error:
+            if error.code in {"NoSuchKey", "NoSuchObject"}:
+                return None
+            raise
+        return StoredObject(
+            key=key, size=stat.size, etag=stat.etag.strip('"') if stat.etag else None, content_type=stat.content_type
+        )
+
+    def copy_to(
+        self, key: str, destination: StorageBackend, content_type: str, cache_control: Optional[str] = None
+    ) -> None:
+        if isinstance(destination, MinioStorageBackend):
+            if cache_control is None:
+                destination.client.copy_object(destination.bucket, key, CopySource(self.bucket, key))
+                return
+            # Replacing the metadata would drop the content type, so it is carried over from the source
+            stat = self.client.stat_object(self.bucket, key)
+            destination.client.copy_object(
+                destination.bucket,
+                key,
+                CopySource(self.bucket, key),
+                metadata={"Content-Type": stat.content_type, "Cache-Control": cache_control},
+                metadata_directive=REPLACE,
+            )
+            return
+        super().copy_to(key, destination, content_type, cache_control)
+
+    def iter_chunks(self, key: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        response = self.client.get_object(self.bucket, key)
+        try:
+            yield from response.stream(chunk_size)
+        finally:
+            response.close()
+            response.release_conn()
+
+    def list_objects(self, prefix: str) -> List[StoredObject]:
+        return [
+            StoredObject(key=obj.object_name, size=obj.size, etag=obj.etag.strip('"') if obj.etag else None)
+            for obj in self.client.list_objects(self.bucket, prefix, recursive=True)
+        ]
+
+    def get_url(self, key: str) -> str:
+        return f"{MINIO_SCHEME}://{MINIO_PREVIEW_ENDPOINT}/{self.bucket}/{key}"
@@ -0,0 +1,133 @@
+import io
+from typing import Any
+from typing import BinaryIO
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from boto3.s3.transfer import TransferConfig
+
+from server.model.stored_object import StoredObject
+from server.storage.fragment_reader import FragmentReader
+from server.storage.storage_backend import StorageBackend
+from server.utilities.constants import MINIO_PREVIEW_ENDPOINT
+from server.utilities.constants import MINIO_SCHEME
+from server.utilities.constants import MULTIPART_PART_SIZE
+from server.utilities.constants import S3_BUCKET
+from server.utilities.constants import STREAM_CHUNK_SIZE
+
+
+class S3StorageBackend(StorageBackend):
+    name = "S3"
+
+    def __init__(self, client: Any, bucket: str = S3_BUCKET, prefix: str = "private-articles", **kwargs: int) -> None:
+        super().__init__(**kwargs)
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def put_stream(self, key: str, stream: BinaryIO, length: int, content_type: str) -> None:  # noqa: ARG002
+        # Objects above one part are uploaded as multipart parts, several at a time
+        self.client.upload_fileobj(
+            stream,
+            self.bucket,
+            self.get_object_key(key),
+            ExtraArgs={"ServerSideEncryption": "AES256", "ContentType": content_type},
+            Config=self.__get_transfer_config(),
+        )
+
+    def put_fragments(self, key: str, fragments: Iterable[bytes], content_type: str) -> None:
+        # Parts are uploaded while later fragments are still being rendered
+        self.client.upload_fileobj(
+            io.BufferedReader(FragmentReader(fragments)),
+            self.bucket,
+            self.get_object_key(key),
+            ExtraArgs={"ServerSideEncryption": "AES256", "ContentType": content_type},
+            Config=self.__get_transfer_config(),
+        )
+
+    def __get_transfer_config(self) -> TransferConfig:
+        return TransferConfig(
+            multipart_threshold=MULTIPART_PART_SIZE,
+            multipart_chunksize=MULTIPART_PART_SIZE,
+            max_concurrency=self.pool_size,
+        )
+
+    def get(self, key: str) -> bytes:
+        response = self.client.get_object(Bucket=self.bucket, Key=self.get_object_key(key))
+        return response["Body"].read()
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self.get_object_key(key))
+        except self.client.exceptions.ClientError as error:
+            if error.response["Error"]["Code"] in {"404", "NoSuchKey"}:
+                return False
+            raise
+        return True
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self.get_object_key(key))
+
+    def stat(self, key: str) -> Optional[StoredObject]:
+        try:
+            response = self.client.head_object(Bucket=self.bucket, Key=self.get_object_key(key))
+        except self.client.exceptions.ClientError as error:
+            if error.response["Error"]["Code"] in {"404", "NoSuchKey"}:
+                return None
+            raise
+        return StoredObject(
+            key=key,
+            size=response["ContentLength"],
+            etag=response["ETag"].strip('"'),
+            content_type=response.get("ContentType"),
+        )
+
+    def copy_to(
+        self, key: str, destination: StorageBackend, content_type: str, cache_control: Optional[str] = None
+    ) -> None:
+        if isinstance(destination, S3StorageBackend):
+            metadata = {}
+            if cache_control is not None:
+                # Replacing the metadata would drop the content type, so it is carried over from the source
+                response = self.client.head_object(Bucket=self.bucket, Key=self.get_object_key(key))
+                metadata = {
+                    "CacheControl": cache_control,
+                    "ContentType": response["ContentType"],
+                    "MetadataDirective": "REPLACE",
+                }
+            destination.client.copy_object(
+                Bucket=destination.bucket,
+                Key=destination.get_object_key(key),
+                CopySource={"Bucket": self.bucket, "Key": self.get_object_key(key)},
+                ServerSideEncryption="AES256",
+                **metadata,
+            )
+            return
+        super().copy_to(key, destination, content_type, cache_control)
+
+    def iter_chunks(self, key: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        response = self.client.get_object(Bucket=self.bucket, Key=self.get_object_key(key))
+        try:
+            yield from response["Body"].iter_chunks(chunk_size)
+        finally:
+            response["Body"].close()
+
+    def list_objects(self, prefix: str) -> List[StoredObject]:
+        stored_objects = []
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.get_object_key(prefix)):
+            stored_objects.extend(
+                StoredObject(
+                    key=obj["Key"].removeprefix(f"{self.prefix}/"), size=obj["Size"], etag=obj["ETag"].strip('"')
+                )
+                for obj in page.get("Contents", [])
+            )
+        return stored_objects
+
+    def get_url(self, key: str) -> str:
+        return f"{MINIO_SCHEME}://{MINIO_PREVIEW_ENDPOINT}/{key}"
+
+    def get_object_key(self, key: str) -> str:
+        return f"{self.prefix}/{key}"
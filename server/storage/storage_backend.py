@@ -0,0 +1,101 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from server.model.artifact import Artifact
+from server.model.stored_object import StoredObject
+from server.utilities.constants import STORAGE_POOL_SIZE
+from server.utilities.constants import STREAM_CHUNK_SIZE
+
+
+class StorageBackend:
+    """Common interface over the LOCAL, MinIO and S3 article stores.
+
+    Keys are always relative to the private article store, e.g. ``<article_id>/css/styles.css``.
+    """
+
+    name = ""
+
+    def __init__(self, pool_size: int = STORAGE_POOL_SIZE) -> None:
+        self.pool_size = pool_size
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def bootstrap(self) -> None:
+        """Prepare the store (directories, buckets) once at startup."""
+
+    def put(self, key: str, data: bytes, content_type: str) -> None:
+        self.put_stream(key, io.BytesIO(data), len(data), content_type)
+
+    def put_stream(self, key: str, stream: BinaryIO, length: int, content_type: str) -> None:
+        raise NotImplementedError
+
+    def put_fragments(self, key: str, fragments: Iterable[bytes], content_type: str) -> None:
+        """Upload an object of unknown length while it is still being produced."""
+        self.put(key, b"".join(fragments), content_type)
+
+    def put_artifact(self, artifact: Artifact) -> None:
+        if artifact.fragments is not None:
+            self.put_fragments(artifact.key, artifact.fragments, artifact.content_type)
+        else:
+            self.put(artifact.key, artifact.data, artifact.content_type)
+
+    def put_many(self, artifacts: List[Artifact]) -> None:
+        """Upload several artifacts concurrently, re-raising the first failure."""
+        if len(artifacts) <= 1:
+            for artifact in artifacts:
+                self.put_artifact(artifact)
+            return
+        futures = [self.get_executor().submit(self.put_artifact, artifact) for artifact in artifacts]
+        for future in futures:
+            future.result()
+
+    def get(self, key: str) -> bytes:
+        raise NotImplementedError
+
+    def exists(self, key: str) -> bool:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def stat(self, key: str) -> Optional[StoredObject]:
+        """Size, ETag and content type of an object without reading it, None if it does not exist."""
+        raise NotImplementedError
+
+    def copy_to(
+        self,
+        key: str,
+        destination: "StorageBackend",
+        content_type: str,
+        cache_control: Optional[str] = None,  # noqa: ARG002
+    ) -> None:
+        """
+        Copy an object to the same key in another store; backends override this with server-side copies, which
+        also set ``cache_control`` on the copy when given.
+        """
+        destination.put(key, self.get(key), content_type)
+
+    def iter_chunks(self, key: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield the object in chunks of at most ``chunk_size`` bytes without buffering it whole."""
+        raise NotImplementedError
+
+    def list_objects(self, prefix: str) -> List[StoredObject]:
+        """List every object whose key starts with ``prefix``, recursively."""
+        raise NotImplementedError
+
+    def get_url(self, key: str) -> str:
+        raise NotImplementedError
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix=f"{self.name}-storage")
+        return self._executor
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
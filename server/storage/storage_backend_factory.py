@@ -0,0 +1,53 @@
+from typing import Optional
+
+from server.storage.instrumented_storage_backend import InstrumentedStorageBackend
+from server.storage.local_storage_backend import LocalStorageBackend
+from server.storage.storage_backend import StorageBackend
+from server.storage.storage_client_factory import StorageClientFactory
+from server.utilities.constants import BUCKET
+from server.utilities.constants import MINIO_PUBLIC_ARTICLE_BUCKET
+
+
+class StorageBackendFactory:
+    __storage_backend: Optional[StorageBackend] = None
+    __public_storage_backend: Optional[StorageBackend] = None
+
+    @staticmethod
+    def construct_storage_backend(bucket: str = BUCKET) -> StorageBackend:
+        # The MinIO and S3 backends import their client libraries, which only the configured one needs
+        if bucket == "LOCAL":
+            return LocalStorageBackend()
+        if bucket == "MINIO":
+            from server.storage.minio_storage_backend import MinioStorageBackend  # noqa: PLC0415
+
+            return MinioStorageBackend(StorageClientFactory.get_minio_client())
+        from server.storage.s3_storage_backend import S3StorageBackend  # noqa: PLC0415
+
+        return S3StorageBackend(StorageClientFactory.get_s3_client())
+
+    @staticmethod
+    def get_storage_backend() -> StorageBackend:
+        """Return the process-wide backend for the configured ``BUCKET``."""
+        if StorageBackendFactory.__storage_backend is None:
+            StorageBackendFactory.__storage_backend = InstrumentedStorageBackend(
+                StorageBackendFactory.construct_storage_backend()
+            )
+        return StorageBackendFactory.__storage_backend
+
+    @staticmethod
+    def set_storage_backend(storage_backend: StorageBackend) -> None:
+        """Replace the process-wide backend, e.g. to build into a scratch directory."""
+        StorageBackendFactory.__storage_backend = storage_backend
+
+    @staticmethod
+    def get_public_storage_backend() -> Optional[StorageBackend]:
+        """Return the store articles are published to, or None if articles are served from where they are built."""
+        if BUCKET != "MINIO":
+            return None
+        if StorageBackendFactory.__public_storage_backend is None:
+            from server.storage.minio_storage_backend import MinioStorageBackend  # noqa: PLC0415
+
+            StorageBackendFactory.__public_storage_backend = InstrumentedStorageBackend(
+                MinioStorageBackend(StorageClientFactory.get_minio_client(), bucket=MINIO_PUBLIC_ARTICLE_BUCKET)
+            )
+        return StorageBackendFactory.__public_storage_backend
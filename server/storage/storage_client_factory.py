@@ -0,0 +1,75 @@
+import os
+import threading
+from typing import Any
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from server.utilities.constants import MINIO_ACCESS_KEY
+from server.utilities.constants import MINIO_API_ENDPOINT
+from server.utilities.constants import MINIO_SECRET_KEY
+from server.utilities.constants import MINIO_SECURE
+from server.utilities.constants import STORAGE_POOL_SIZE
+from server.utilities.constants import STORAGE_TIMEOUT_SECONDS
+
+if TYPE_CHECKING:
+    from minio import Minio
+
+
+class StorageClientFactory:
+    """
+    Process-wide MinIO and S3 clients, created on first use. The client libraries are only imported then too, as
+    boto3 alone takes a noticeable part of the server start up.
+    """
+
+    __minio_client: Optional["Minio"] = None
+    __s3_client: Optional[Any] = None
+    __lock = threading.Lock()
+
+    @staticmethod
+    def get_minio_client() -> "Minio":
+        with StorageClientFactory.__lock:
+            if StorageClientFactory.__minio_client is None:
+                StorageClientFactory.__minio_client = StorageClientFactory.construct_minio_client()
+            return StorageClientFactory.__minio_client
+
+    @staticmethod
+    def get_s3_client() -> Any:
+        with StorageClientFactory.__lock:
+            if StorageClientFactory.__s3_client is None:
+                StorageClientFactory.__s3_client = StorageClientFactory.construct_s3_client()
+            return StorageClientFactory.__s3_client
+
+    @staticmethod
+    def construct_minio_client() -> "Minio":
+        import certifi  # noqa: PLC0415
+        import urllib3  # noqa: PLC0415
+        from minio import Minio  # noqa: PLC0415
+
+        return Minio(
+            endpoint=MINIO_API_ENDPOINT,
+            access_key=MINIO_ACCESS_KEY,
+            secret_key=MINIO_SECRET_KEY,
+            secure=MINIO_SECURE,
+            http_client=urllib3.PoolManager(
+                timeout=urllib3.Timeout(connect=STORAGE_TIMEOUT_SECONDS, read=STORAGE_TIMEOUT_SECONDS),
+                maxsize=STORAGE_POOL_SIZE,
+                block=True,
+                cert_reqs="CERT_REQUIRED",
+                ca_certs=os.getenv("SSL_CERT_FILE") or certifi.where(),
+                retries=urllib3.Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+            ),
+        )
+
+    @staticmethod
+    def construct_s3_client() -> Any:
+        import boto3  # noqa: PLC0415
+        from botocore.config import Config  # noqa: PLC0415
+
+        return boto3.client(
+            "s3",
+            config=Config(
+                max_pool_connections=STORAGE_POOL_SIZE,
+                connect_timeout=STORAGE_TIMEOUT_SECONDS,
+                read_timeout=STORAGE_TIMEOUT_SECONDS,
+            ),
+        )
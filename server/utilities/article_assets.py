@@ -0,0 +1,50 @@
+import hashlib
+from typing import Iterable
+from typing import List
+
+from server.model.article_assets import ArticleAssets
+from server.model.stored_object import StoredObject
+from server.storage.storage_backend import StorageBackend
+from server.utilities.asset_store import get_asset_key
+from server.utilities.asset_store import load_asset_refs
+from server.utilities.image_optimizer import VARIANTS_FOLDER
+from server.utilities.image_optimizer import load_image_variants
+
+
+def load_article_assets(storage_backend: StorageBackend, article_id: str) -> ArticleAssets:
+    asset_refs = load_asset_refs(storage_backend, article_id)
+    return ArticleAssets(refs=asset_refs.assets, image_variants=load_image_variants(storage_backend, asset_refs.assets))
+
+
+def get_asset_objects(assets: ArticleAssets) -> List[StoredObject]:
+    """The shared objects an article refers to: its uploaded files and the variants of its images."""
+    stored_objects = {}
+    for asset_ref in assets.refs.values():
+        key = get_asset_key(asset_ref.sha256)
+        stored_objects[key] = StoredObject(
+            key=key, size=asset_ref.size, etag=asset_ref.sha256, content_type=asset_ref.content_type
+        )
+    for image_variants in assets.image_variants.values():
+        for variant in image_variants.variants:
+            key = f"{VARIANTS_FOLDER}/{variant.filename}"
+            # Named after the content of their image, so the name identifies the content as well as a hash
+            stored_objects[key] = StoredObject(
+                key=key, size=variant.size, etag=variant.filename, content_type=variant.content_type
+            )
+    return list(stored_objects.values())
+
+
+def get_assets_version(assets: ArticleAssets, names: Iterable[str]) -> str:
+    """Digest of what the given ``<file type>/<filename>`` names refer to, empty when none is stored by hash."""
+    digest = hashlib.sha256()
+    found = False
+    for name in sorted(set(names)):
+        asset_ref = assets.refs.get(name)
+        if asset_ref is None:
+            continue
+        digest.update(f"{name}|{asset_ref.sha256}|".encode())
+        image_variants = assets.image_variants.get(name.split("/", 1)[1]) if name.startswith("images/") else None
+        if image_variants is not None:
+            digest.update(f"{image_variants.model_dump_json()}|".encode())
+        found = True
+    return digest.hexdigest() if found else ""
@@ -0,0 +1,128 @@
+import hashlib
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from server.model.article import Article
+from server.model.component import Component
+from server.model.ir.article_ir import ArticleIR
+from server.model.ir.component_ir import ComponentIR
+from server.model.ir.layout_ir import LayoutIR
+from server.model.ir.page_ir import PageIR
+from server.model.page import Page
+from server.model.script.animation.util.component_id_parser import ComponentIdParser
+from server.utilities.asset_store import get_asset_name
+
+# Components of the first frame of the first page are visible before the reader scrolls
+FIRST_PAGE_ID = "001"
+FIRST_FRAME_ID = "1"
+
+
+def parse_article_json(data: Union[str, bytes]) -> ArticleIR:
+    """Validate an article request body in a single pass and lower it into the IR read by every generator."""
+    return lower_article(Article.model_validate_json(data))
+
+
+def lower_article(article: Article) -> ArticleIR:
+    pages = tuple(lower_page(page) for page in article.pages)
+    digest = hashlib.sha256(f"{article.articleId}|{article.title}|".encode())
+    for page in pages:
+        digest.update(f"{page.digest}|".encode())
+    return ArticleIR(article_id=article.articleId, title=article.title, pages=pages, digest=digest.hexdigest())
+
+
+def is_first_article_frame(page_id: Optional[str], frame_id: Optional[str]) -> bool:
+    return page_id == FIRST_PAGE_ID and frame_id == FIRST_FRAME_ID
+
+
+def get_end_length(index: int, group_size: int, pin_length: int) -> int:
+    """Scroll length of a component's trigger: one step, or until the page unpins for the last of its group."""
+    if index != group_size - 1:
+        return 1
+    return 1 if index == pin_length - 1 else pin_length - index
+
+
+def lower_page(page: Page) -> PageIR:
+    placed = [(index, component) for index, frame in enumerate(page.frames) for component in frame.components]
+    group_ids: Dict[str, List[str]] = {}
+    for _, component in placed:
+        group_ids.setdefault(component.position, []).append(component.id)
+    pin_length = max((len(ids) for ids in group_ids.values()), default=0)
+    # Duplicated ids share the place found first searching the groups in order of their first appearance, as the
+    # scripts look components up by id
+    places: Dict[str, Tuple[str, int]] = {}
+    for position, ids in group_ids.items():
+        for index, component_id in enumerate(ids):
+            places.setdefault(component_id, (position, index))
+
+    components = []
+    groups: Dict[str, List[ComponentIR]] = {}
+    for frame_index, component in placed:
+        group = groups.setdefault(component.position, [])
+        position, index = places[component.id]
+        end_length = get_end_length(index, len(group_ids[position]), pin_length)
+        lowered = lower_component(component, frame_index, len(group), end_length, pinnable=page.pinnable)
+        group.append(lowered)
+        components.append(lowered)
+
+    return PageIR(
+        id=page.id,
+        pinnable=page.pinnable,
+        layout=LayoutIR(
+            template=page.layout.template,
+            height_top=page.layout.heightTop,
+            width_left=page.layout.widthLeft,
+            height_bottom=page.layout.heightBottom,
+            width_right=page.layout.widthRight,
+        ),
+        components=tuple(components),
+        groups=tuple((position, tuple(group)) for position, group in groups.items()),
+        first_frame_components=tuple(component for component in components if component.is_first_frame),
+        pin_length=pin_length,
+        asset_names=get_asset_names(components),
+        digest=hashlib.sha256(page.model_dump_json().encode()).hexdigest(),
+    )
+
+
+def lower_component(
+    component: Component, frame_index: int, group_index: int, end_length: int, *, pinnable: bool
+) -> ComponentIR:
+    try:
+        page_id, frame_id, _ = ComponentIdParser.parse(component.id)
+    except IndexError:
+        # Only the scroll triggers of pinned pages need the ids, as <page id>-<frame id>-...
+        if pinnable:
+            raise ValueError(f"Component id '{component.id}' is not of the form <page id>-<frame id>-...") from None
+        page_id, frame_id = None, None
+    image = component.image
+    return ComponentIR(
+        id=component.id,
+        type=component.type,
+        position=component.position,
+        animation=component.animation,
+        content_html=component.contentHtml,
+        image_data=image.data if image is not None else None,
+        image_caption=image.caption if image is not None else None,
+        is_display_fullscreen=bool(image.isDisplayFullscreen) if image is not None else False,
+        html_data=component.html.data if component.html is not None else None,
+        page_id=page_id,
+        frame_id=frame_id,
+        frame_index=frame_index,
+        is_first_frame=frame_index == 0,
+        starts_visible=is_first_article_frame(page_id, frame_id),
+        group_index=group_index,
+        end_length=end_length,
+    )
+
+
+def get_asset_names(components: List[ComponentIR]) -> Tuple[str, ...]:
+    """The ``<file type>/<filename>`` names of the uploads a page refers to."""
+    asset_names = set()
+    for component in components:
+        if component.type == "image" and component.image_data:
+            asset_names.add(get_asset_name("images", component.image_data))
+        elif component.type == "html" and component.html_data:
+            asset_names.add(get_asset_name("html", component.html_data))
+    return tuple(sorted(asset_names))
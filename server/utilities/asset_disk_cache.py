@@ -0,0 +1,169 @@
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import BinaryIO
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+
+from server.model.stored_object import StoredObject
+from server.storage.storage_backend import StorageBackend
+from server.utilities.asset_store import is_shared_key
+from server.utilities.constants import ASSET_DISK_CACHE_DIR
+from server.utilities.constants import ASSET_DISK_CACHE_MAX_BYTES
+from server.utilities.constants import STREAM_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+def iter_open_file(file: BinaryIO, start: int, length: int, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield ``length`` bytes of an open file from ``start`` on, closing it afterwards."""
+    try:
+        file.seek(start)
+        while length > 0 and (chunk := file.read(min(chunk_size, length))):
+            length -= len(chunk)
+            yield chunk
+    finally:
+        file.close()
+
+
+class AssetDiskCache:
+    """
+    Thread-safe LRU cache of stored objects as files on local disk, bounded by their total size in bytes. An object
+    is only served from the cache for the ETag it was cached with.
+    """
+
+    def __init__(self, directory: Path = ASSET_DISK_CACHE_DIR, max_bytes: int = ASSET_DISK_CACHE_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        # So that a single large object cannot flush everything else, larger ones are always streamed from storage
+        self.max_entry_bytes = max_bytes // 8
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, StoredObject] = OrderedDict()
+        self._lock = threading.Lock()
+        # Created on first use, one per process since the index of the cached files is kept in memory
+        self._process_directory: Optional[Path] = None
+
+    def is_cacheable(self, stored_object: StoredObject) -> bool:
+        return stored_object.etag is not None and 0 < stored_object.size <= self.max_entry_bytes
+
+    def lookup(self, storage_backend: StorageBackend, key: str) -> Optional[Tuple[StoredObject, Optional[BinaryIO]]]:
+        """
+        The stored object, with its cached file opened for reading if it is cached, or None if it does not exist.
+        Shared assets never change, so they are served from the cache without asking the storage.
+        """
+        if is_shared_key(key):
+            cached = self.open(key)
+            if cached is not None:
+                return cached
+            stored_object = storage_backend.stat(key)
+        else:
+            stored_object = storage_backend.stat(key)
+            if stored_object is None:
+                return None
+            cached = self.open(key, stored_object.etag)
+            if cached is not None:
+                return cached
+        return None if stored_object is None else (stored_object, None)
+
+    def open(self, key: str, etag: Optional[str] = None) -> Optional[Tuple[StoredObject, BinaryIO]]:
+        """The cached object and its file opened for reading, if cached with ``etag`` or with any ETag when None."""
+        with self._lock:
+            stored_object = self._entries.get(key)
+            if stored_object is None or (etag is not None and stored_object.etag != etag):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            # Opened while locked, as the file may be evicted right after
+            return stored_object, self.__get_path(stored_object).open("rb")
+
+    def write_through(self, stored_object: StoredObject, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        """Yield the chunks of an object while writing them to disk, caching it once all of them have been read."""
+        if not self.is_cacheable(stored_object):
+            yield from chunks
+            return
+
+        with self._lock:
+            path = self.__get_path(stored_object)
+        file_descriptor, partial_name = tempfile.mkstemp(dir=path.parent, suffix=".partial")
+        partial_path = Path(partial_name)
+        size = 0
+        completed = False
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                for chunk in chunks:
+                    file.write(chunk)
+                    size += len(chunk)
+                    yield chunk
+            # The object may have been replaced since it was looked up, then it is not cached
+            completed = size == stored_object.size
+            if completed:
+                partial_path.replace(path)
+                self.__add(stored_object)
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+            if not completed:
+                partial_path.unlink(missing_ok=True)
+
+    def fill(self, stored_object: StoredObject, chunks: Iterator[bytes]) -> Optional[BinaryIO]:
+        """Cache an object whole, returning its cached file opened for reading."""
+        for _ in self.write_through(stored_object, chunks):
+            pass
+        cached = self.open(stored_object.key, stored_object.etag)
+        return None if cached is None else cached[1]
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+            if self._process_directory is not None:
+                shutil.rmtree(self._process_directory, ignore_errors=True)
+                self._process_directory = None
+
+    def __get_path(self, stored_object: StoredObject) -> Path:
+        # Called with the lock held
+        if self._process_directory is None:
+            Path.mkdir(self.directory, parents=True, exist_ok=True)
+            self._process_directory = Path(tempfile.mkdtemp(prefix=f"{os.getpid()}-", dir=self.directory))
+        name = hashlib.sha256(f"{stored_object.key}|{stored_object.etag}".encode()).hexdigest()
+        return self._process_directory / name
+
+    def __add(self, stored_object: StoredObject) -> None:
+        with self._lock:
+            previous = self._entries.pop(stored_object.key, None)
+            if previous is not None:
+                self.size_bytes -= previous.size
+                if previous.etag != stored_object.etag:
+                    self.__get_path(previous).unlink(missing_ok=True)
+            self._entries[stored_object.key] = stored_object
+            self.size_bytes += stored_object.size
+            while self.size_bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self.__get_path(evicted).unlink(missing_ok=True)
+                self.size_bytes -= evicted.size
+                self.evictions += 1
+
+
+ASSET_DISK_CACHE = AssetDiskCache()
@@ -0,0 +1,107 @@
+import hashlib
+import logging
+import os
+import threading
+import weakref
+from typing import BinaryIO
+from typing import Optional
+from typing import Tuple
+
+from server.model.asset_ref import AssetRef
+from server.model.asset_refs import AssetRefs
+from server.model.stored_object import StoredObject
+from server.storage.storage_backend import StorageBackend
+from server.utilities.constants import STREAM_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Shared by every article, outside of the article prefixes
+ASSETS_FOLDER = "assets"
+ASSET_REFS_NAME = "assets.json"
+
+_refs_locks: "weakref.WeakValueDictionary[str, threading.Lock]" = weakref.WeakValueDictionary()
+_refs_locks_lock = threading.Lock()
+
+
+def get_asset_key(sha256: str) -> str:
+    return f"{ASSETS_FOLDER}/{sha256}"
+
+
+def get_asset_refs_key(article_id: str) -> str:
+    return f"{article_id}/{ASSET_REFS_NAME}"
+
+
+def get_asset_name(file_type: str, filename: str) -> str:
+    return f"{file_type}/{filename}"
+
+
+def is_shared_key(key: str) -> bool:
+    return key.startswith(f"{ASSETS_FOLDER}/")
+
+
+def hash_file(file: BinaryIO) -> Tuple[str, int]:
+    """SHA-256 and size of the rest of a seekable file, which is rewound to where it was."""
+    start = file.tell()
+    digest = hashlib.sha256()
+    size = 0
+    while chunk := file.read(STREAM_CHUNK_SIZE):
+        digest.update(chunk)
+        size += len(chunk)
+    file.seek(start, os.SEEK_SET)
+    return digest.hexdigest(), size
+
+
+def get_stored_asset(storage_backend: StorageBackend, sha256: str) -> Optional[StoredObject]:
+    return storage_backend.stat(get_asset_key(sha256))
+
+
+def read_asset_head(storage_backend: StorageBackend, sha256: str, length: int) -> bytes:
+    chunks = storage_backend.iter_chunks(get_asset_key(sha256), length)
+    try:
+        return next(chunks, b"")
+    finally:
+        chunks.close()
+
+
+def load_asset_refs(storage_backend: StorageBackend, article_id: str) -> AssetRefs:
+    key = get_asset_refs_key(article_id)
+    if not storage_backend.exists(key):
+        return AssetRefs()
+    return AssetRefs.model_validate_json(storage_backend.get(key))
+
+
+def get_refs_lock(article_id: str) -> threading.Lock:
+    """Held while the references of an article are rewritten, so that concurrent uploads do not drop each other."""
+    with _refs_locks_lock:
+        lock = _refs_locks.get(article_id)
+        if lock is None:
+            lock = _refs_locks[article_id] = threading.Lock()
+        return lock
+
+
+def add_asset_ref(
+    storage_backend: StorageBackend, article_id: str, name: str, asset_ref: AssetRef
+) -> Optional[AssetRef]:
+    """Point ``name`` at ``asset_ref`` for the article, returning what it pointed at before if that differs."""
+    with get_refs_lock(article_id):
+        asset_refs = load_asset_refs(storage_backend, article_id)
+        previous = asset_refs.assets.get(name)
+        if previous == asset_ref:
+            return None
+        asset_refs.assets[name] = asset_ref
+        storage_backend.put(get_asset_refs_key(article_id), asset_refs.model_dump_json().encode(), "application/json")
+    if previous is not None:
+        logger.info(f"{name} of {article_id} now refers to {asset_ref.sha256} instead of {previous.sha256}")
+    return previous
+
+
+def store_asset(storage_backend: StorageBackend, file: BinaryIO, content_type: str) -> AssetRef:
+    """Store the content of a seekable file under its hash, unless a file with the same content already is."""
+    sha256, size = hash_file(file)
+    key = get_asset_key(sha256)
+    if storage_backend.exists(key):
+        logger.info(f"{key} is already stored, not uploading it again")
+    else:
+        # Concurrent uploads of the same content write the same bytes, so the last one winning is harmless
+        storage_backend.put_stream(key, file, size, content_type)
+    return AssetRef(sha256=sha256, content_type=content_type, size=size)
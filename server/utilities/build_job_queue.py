@@ -0,0 +1,254 @@
+import asyncio
+import contextlib
+import hashlib
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from collections import deque
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from server.model.build_job import BuildJob
+from server.model.build_job_status import BuildJobStatus
+from server.model.html_output_mode import HtmlOutputMode
+from server.model.ir.article_ir import ArticleIR
+from server.parser import process_pages
+from server.utilities.constants import BUILD_JOB_HISTORY_SIZE
+from server.utilities.constants import BUILD_WORKERS
+from server.utilities.generation_executor import GenerationExecutor
+from server.utilities.metrics import BUILDS_IN_FLIGHT
+from server.utilities.utils import copy_files
+
+logger = logging.getLogger(__name__)
+
+
+class BuildJobQueue:
+    """Runs website builds on a fixed pool of workers.
+
+    Requests for the same article, payload and publish flag share one in-flight job, and builds of the same
+    article never run concurrently, so they cannot race on its objects. Builds of an article wait in line for the
+    previous one without taking a worker, so that they cannot starve the builds of other articles.
+    """
+
+    def __init__(self, worker_count: int = BUILD_WORKERS, history_size: int = BUILD_JOB_HISTORY_SIZE) -> None:
+        self.worker_count = worker_count
+        self.history_size = history_size
+        self.jobs: OrderedDict[str, BuildJob] = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._in_flight: Dict[Tuple[str, str, bool], str] = {}
+        self._articles: Dict[str, Tuple[ArticleIR, HtmlOutputMode]] = {}
+        self._done_events: Dict[str, asyncio.Event] = {}
+        self._exceptions: Dict[str, Exception] = {}
+        self._endpoints: Dict[str, str] = {}
+        # Jobs of each article in submission order, the first one is queued or running unless the article is held
+        self._article_jobs: Dict[str, Deque[str]] = {}
+        # Readers of the objects of each article, which later builds of the article wait for
+        self._holds: Dict[str, int] = {}
+        self._hold_requests: Dict[str, int] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._workers = [asyncio.create_task(self.__work()) for _ in range(self.worker_count)]
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        for worker in self._workers:
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+        self._workers = []
+
+    def submit(self, article: ArticleIR, output_mode: HtmlOutputMode, *, publish: bool, endpoint: str = "") -> BuildJob:
+        payload_hash = hashlib.sha256(f"{output_mode.value}|{article.digest}".encode()).hexdigest()
+        in_flight_key = (article.article_id, payload_hash, publish)
+        job_id = self._in_flight.get(in_flight_key)
+        if job_id is not None:
+            logger.info(f"Joining in-flight build {job_id} of {article.article_id}")
+            return self.jobs[job_id]
+
+        job = BuildJob(
+            job_id=uuid.uuid4().hex,
+            article_id=article.article_id,
+            payload_hash=payload_hash,
+            publish=publish,
+            created_at=time.time(),
+        )
+        self.jobs[job.job_id] = job
+        self._in_flight[in_flight_key] = job.job_id
+        self._articles[job.job_id] = (article, output_mode)
+        self._done_events[job.job_id] = asyncio.Event()
+        self._endpoints[job.job_id] = endpoint
+        BUILDS_IN_FLIGHT.inc(endpoint=endpoint)
+        article_jobs = self._article_jobs.setdefault(job.article_id, deque())
+        article_jobs.append(job.job_id)
+        if len(article_jobs) == 1:
+            self.__schedule(job.article_id)
+        self.__trim_history()
+        return job
+
+    def get(self, job_id: str) -> Optional[BuildJob]:
+        return self.jobs.get(job_id)
+
+    async def wait(self, job_id: str, *, hold: bool = False) -> BuildJob:
+        """
+        Wait for a job to finish, re-raising the exception it failed with. With ``hold``, the next builds of the
+        article only start once ``release`` is called for it, so that what the job built can be read meanwhile.
+        """
+        # Other submissions may trim the finished job from the history before this coroutine resumes
+        job = self.jobs[job_id]
+        done_event = self._done_events.get(job_id)
+        if hold:
+            # Taken as the job finishes, before the next build of the article can start
+            if done_event is not None:
+                self._hold_requests[job_id] = self._hold_requests.get(job_id, 0) + 1
+            else:
+                self._holds[job.article_id] = self._holds.get(job.article_id, 0) + 1
+        if done_event is not None:
+            try:
+                await done_event.wait()
+            except asyncio.CancelledError:
+                if hold:
+                    self.__cancel_hold(job)
+                raise
+        if job.status == BuildJobStatus.FAILED:
+            if hold:
+                self.__release(job.article_id)
+            exception = self._exceptions.get(job_id)
+            if exception is not None:
+                raise exception
+            raise RuntimeError(job.error)
+        return job
+
+    def release(self, article_id: str) -> None:
+        """Release a hold taken by ``wait``, from any thread."""
+        with contextlib.suppress(RuntimeError):
+            # The loop is closed on shutdown, when no build starts anymore
+            self._loop.call_soon_threadsafe(self.__release, article_id)
+
+    def iter_held(self, article_id: str, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        """Yield the chunks read from the objects of a held article, releasing it once they are read or dropped."""
+        return HeldIterator(chunks, lambda: self.release(article_id))
+
+    def __cancel_hold(self, job: BuildJob) -> None:
+        hold_requests = self._hold_requests.get(job.job_id)
+        if hold_requests is None:
+            # Already taken when the job finished
+            self.__release(job.article_id)
+        elif hold_requests == 1:
+            del self._hold_requests[job.job_id]
+        else:
+            self._hold_requests[job.job_id] = hold_requests - 1
+
+    def __release(self, article_id: str) -> None:
+        self._holds[article_id] -= 1
+        if not self._holds[article_id]:
+            del self._holds[article_id]
+            self.__schedule(article_id)
+
+    def __schedule(self, article_id: str) -> None:
+        """Queue the next job of an article, unless it is held."""
+        if article_id in self._holds:
+            return
+        article_jobs = self._article_jobs.get(article_id)
+        if not article_jobs:
+            self._article_jobs.pop(article_id, None)
+            return
+        self._queue.put_nowait(article_jobs[0])
+
+    async def __work(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self.__run(self.jobs[job_id])
+            finally:
+                self._queue.task_done()
+
+    async def __run(self, job: BuildJob) -> None:
+        article, output_mode = self._articles.pop(job.job_id)
+        job.status = BuildJobStatus.RUNNING
+        job.started_at = time.time()
+        try:
+            job.url = await self.__build(article, output_mode, publish=job.publish)
+            job.status = BuildJobStatus.SUCCEEDED
+        except Exception as e:
+            logger.exception(f"Build {job.job_id} of {job.article_id} failed")
+            job.status = BuildJobStatus.FAILED
+            job.error = str(e)
+            self._exceptions[job.job_id] = e
+        finally:
+            job.finished_at = time.time()
+            self._in_flight.pop((job.article_id, job.payload_hash, job.publish), None)
+            self._done_events.pop(job.job_id).set()
+            BUILDS_IN_FLIGHT.dec(endpoint=self._endpoints.pop(job.job_id))
+            self._article_jobs[job.article_id].popleft()
+            hold_requests = self._hold_requests.pop(job.job_id, 0)
+            if hold_requests:
+                self._holds[job.article_id] = self._holds.get(job.article_id, 0) + hold_requests
+            self.__schedule(job.article_id)
+
+    @staticmethod
+    async def __build(article: ArticleIR, output_mode: HtmlOutputMode, *, publish: bool) -> str:
+        # Rendering is CPU-bound and uploads block, keep both off the event loop
+        title = article.title if article.title is not None else "My Animated Website"
+        url = await GenerationExecutor.run(process_pages, article.article_id, article.pages, title, output_mode)
+        if publish:
+            # Copy from private bucket to public bucket
+            url = await run_in_threadpool(copy_files, article.article_id)
+        return url
+
+    def __trim_history(self) -> None:
+        finished = [
+            job_id
+            for job_id, job in self.jobs.items()
+            if job.status in {BuildJobStatus.SUCCEEDED, BuildJobStatus.FAILED}
+        ]
+        for job_id in finished[: max(len(self.jobs) - self.history_size, 0)]:
+            del self.jobs[job_id]
+            self._exceptions.pop(job_id, None)
+
+
+class HeldIterator:
+    """Iterator calling ``release`` once, when it is exhausted, fails, is closed or is garbage collected."""
+
+    def __init__(self, chunks: Iterator[bytes], release: Callable[[], None]) -> None:
+        self.chunks = chunks
+        self.release = release
+        self.released = False
+
+    def __iter__(self) -> "HeldIterator":
+        return self
+
+    def __next__(self) -> bytes:
+        try:
+            return next(self.chunks)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self.released:
+            return
+        self.released = True
+        try:
+            close = getattr(self.chunks, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self.release()
+
+    def __del__(self) -> None:
+        self.close()
+
+
+BUILD_JOB_QUEUE = BuildJobQueue()
@@ -0,0 +1,30 @@
+from typing import Optional
+from typing import Tuple
+
+
+def parse_byte_range(range_header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    First and last byte of a single ``bytes=`` range of an object of ``size`` bytes, or None when the whole object
+    should be sent: no header, another unit, several ranges or a malformed header, all of which RFC 9110 lets a server
+    ignore. Raises ValueError when the range cannot be satisfied.
+    """
+    if not range_header:
+        return None
+    unit, _, byte_range = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in byte_range:
+        return None
+    first, separator, last = (part.strip() for part in byte_range.partition("-"))
+    if not separator or not (first or last) or not all(part.isdigit() for part in (first, last) if part):
+        return None
+    if not first:
+        # Suffix range, the last bytes of the object
+        if int(last) == 0 or size == 0:
+            raise ValueError(f"Unsatisfiable range {range_header}")
+        return max(size - int(last), 0), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if last and start > end:
+        return None
+    if start >= size:
+        raise ValueError(f"Unsatisfiable range {range_header}")
+    return start, min(end, size - 1)
@@ -0,0 +1,16 @@
+from typing import Optional
+
+
+def _strip_weak_prefix(etag: str) -> str:
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def is_not_modified(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches the ETag, using the weak comparison RFC 9110 requires for it."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = _strip_weak_prefix(etag)
+    return any(_strip_weak_prefix(candidate) == opaque_tag for candidate in if_none_match.split(","))
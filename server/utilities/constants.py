@@ -1,9 +1,6 @@
-import boto3
 import os
 from pathlib import Path
 
-from minio import Minio
-
 LOCAL_PARENT_DIR = Path(__file__).parent.parent
 
 BUCKET = os.getenv("BUCKET", "LOCAL")
@@ -20,21 +17,46 @@ MINIO_SECURE = os.getenv("S3_SECURE", "False").lower == "false"
 MINIO_PUBLIC_ARTICLE_BUCKET = "public-articles"
 MINIO_PRIVATE_ARTICLE_BUCKET = "private-articles"
 S3_BUCKET = "t-stg-scrollytelling-s3"
-MINIO_CLIENT = None
-S3_CLIENT = None
-
-if BUCKET == "LOCAL":
-    Path.mkdir(LOCAL_OUTPUT_DIR, parents=True, exist_ok=True)
-elif BUCKET == "MINIO":
-    MINIO_CLIENT = Minio(
-        endpoint=MINIO_API_ENDPOINT,
-        access_key=MINIO_ACCESS_KEY,
-        secret_key=MINIO_SECRET_KEY,
-        secure=MINIO_SECURE,
-    )
-else:
-    S3_CLIENT = boto3.client('s3')
-
+# Size of the connection pool shared by all storage calls, and of the thread pool used for concurrent uploads
+STORAGE_POOL_SIZE = int(os.getenv("STORAGE_POOL_SIZE", "10"))
+STORAGE_TIMEOUT_SECONDS = float(os.getenv("STORAGE_TIMEOUT_SECONDS", "30"))
+STREAM_CHUNK_SIZE = 1024 * 1024
+# Generated files are handed to the storage writer in chunks of about this size while they are rendered
+FRAGMENT_FLUSH_SIZE = 64 * 1024
+# Streams of unknown length are uploaded as multipart uploads with parts of this size (S3/MinIO minimum is 5 MiB)
+MULTIPART_PART_SIZE = int(os.getenv("MULTIPART_PART_SIZE", str(8 * 1024 * 1024)))
+# Largest request body accepted by /upload-file
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", str(256 * 1024 * 1024)))
+# Widths of the resized variants generated for uploaded images, and their formats besides a JPEG/PNG fallback
+IMAGE_VARIANT_WIDTHS = [int(width) for width in os.getenv("IMAGE_VARIANT_WIDTHS", "480,960,1440,2048").split(",")]
+IMAGE_VARIANT_FORMATS = [name.strip() for name in os.getenv("IMAGE_VARIANT_FORMATS", "avif,webp").split(",") if name]
+# Cache-Control of published assets, which are named by their content hash and so never change
+ASSET_CACHE_CONTROL = os.getenv("ASSET_CACHE_CONTROL", "public, max-age=31536000, immutable")
+# Objects served by /s3-assets are kept on local disk up to this total size, 0 disables the cache
+ASSET_DISK_CACHE_DIR = Path(os.getenv("ASSET_DISK_CACHE_DIR", "/tmp/scrolly-asset-cache"))  # noqa: S108
+ASSET_DISK_CACHE_MAX_BYTES = int(os.getenv("ASSET_DISK_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+# Zip export fetches this many objects ahead of the one being written; larger objects are streamed instead
+ZIP_FETCH_CONCURRENCY = int(os.getenv("ZIP_FETCH_CONCURRENCY", "4"))
+ZIP_PREFETCH_MAX_BYTES = 8 * 1024 * 1024
+# Generated index.html, styles.css and animation.js are also written compressed next to them as <name>.gz and
+# <name>.br, at these levels; empty disables it, br needs the optional brotli package
+PRECOMPRESS_ENCODINGS = [name.strip() for name in os.getenv("PRECOMPRESS_ENCODINGS", "br,gzip").split(",") if name]
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "9"))
+BROTLI_LEVEL = int(os.getenv("BROTLI_LEVEL", "11"))
+# "minified" for published builds, "pretty" to debug the generated index.html
+HTML_OUTPUT_MODE = os.getenv("HTML_OUTPUT_MODE", "minified")
+# "compact" emits a JSON table per page driving one shared runtime, "inline" one GSAP timeline per component
+ANIMATION_SCRIPT_MODE = os.getenv("ANIMATION_SCRIPT_MODE", "compact")
+PAGE_FRAGMENT_CACHE_SIZE = int(os.getenv("PAGE_FRAGMENT_CACHE_SIZE", "1024"))
+# "thread" keeps the page fragment cache shared by all requests, "process" spreads rendering across cores
+GENERATION_EXECUTOR = os.getenv("GENERATION_EXECUTOR", "thread")
+GENERATION_WORKERS = int(os.getenv("GENERATION_WORKERS", str(os.cpu_count() or 1)))
+EVENT_LOOP_MONITOR_INTERVAL_SECONDS = 0.5
+BUILD_WORKERS = int(os.getenv("BUILD_WORKERS", "4"))
+# Number of finished build jobs kept for status polling
+BUILD_JOB_HISTORY_SIZE = int(os.getenv("BUILD_JOB_HISTORY_SIZE", "1000"))
+# Total size of the article payloads kept in memory for GET /payload, 0 disables the cache
+PAYLOAD_CACHE_MAX_BYTES = int(os.getenv("PAYLOAD_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
 GSAP_LOCAL_PATH = LOCAL_PARENT_DIR / "templates" / "js" / "gsap.min.js"
 SMOOTH_SCROLLBAR_LOCAL_PATH = LOCAL_PARENT_DIR / "templates" / "js" / "smooth-scrollbar.js"
 SCROLLTRIGGER_LOCAL_PATH = LOCAL_PARENT_DIR / "templates" / "js" / "ScrollTrigger.min.js"
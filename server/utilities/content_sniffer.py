@@ -0,0 +1,51 @@
+import codecs
+from typing import Optional
+from typing import Tuple
+
+# Enough for every signature below and to tell text from binary content
+SNIFF_LENGTH = 512
+
+IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+HTML_PREFIXES = (b"<!doctype html", b"<html", b"<head", b"<body")
+IMAGE_CONTENT_TYPES = frozenset(["image/jpeg", "image/png", "image/gif"])
+
+
+def sniff_content_type(head: bytes) -> Optional[str]:
+    """
+    Content type of a file from its first SNIFF_LENGTH bytes, whatever the client declared: one of the supported
+    images, ``text/html`` for complete documents, ``text/plain`` for other text or None for anything else.
+    """
+    for signature, content_type in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return content_type
+    if b"\x00" in head:
+        return None
+    try:
+        # Unless it is the whole file, the head may end in the middle of a multi-byte character
+        text = codecs.getincrementaldecoder("utf-8")().decode(head, final=len(head) < SNIFF_LENGTH)
+    except UnicodeDecodeError:
+        return None
+    if text.lstrip("\ufeff \t\r\n").encode().lower().startswith(HTML_PREFIXES):
+        return "text/html"
+    return "text/plain"
+
+
+def get_upload_file_type(
+    declared_content_type: Optional[str], sniffed_type: Optional[str]
+) -> Optional[Tuple[str, str]]:
+    """
+    Folder and content type to store an upload with, or None if it is not supported: the declared type picks the
+    kind of file, the content has to agree with it.
+    """
+    if declared_content_type in IMAGE_CONTENT_TYPES and sniffed_type in IMAGE_CONTENT_TYPES:
+        return "images", sniffed_type
+    if declared_content_type == "text/html" and sniffed_type in {"text/html", "text/plain"}:
+        return "html", declared_content_type
+    if declared_content_type == "text/css" and sniffed_type == "text/plain":
+        return "css", declared_content_type
+    return None
@@ -0,0 +1,215 @@
+import re
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from server.model.html_output_mode import HtmlOutputMode
+
+# A rule is (selectors, declarations) for style rules and (None, raw text) for at-rules such as @media
+Declarations = Tuple[Tuple[str, str], ...]
+CssRule = Tuple[Optional[Tuple[str, ...]], Union[Declarations, str]]
+
+CSS_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+SELECTOR_TOKEN_PATTERN = re.compile(r"[#.]-?[_a-zA-Z][\w-]*")
+DOM_ATTRIBUTE_PATTERN = re.compile(r"""\s(id|class)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+))""", re.IGNORECASE)
+
+# Classes added by the vendor scripts at runtime, never present in the generated DOM
+RUNTIME_SELECTOR_TOKENS = frozenset({
+    ".scroll-content",
+    ".scrollbar-track",
+    ".scrollbar-thumb",
+    ".pin-spacer",
+    ".gsap-marker-start",
+})
+
+
+def _collapse(text: str, tight_characters: str) -> str:
+    """Collapse whitespace outside strings and drop it entirely next to ``tight_characters``."""
+    result: List[str] = []
+    quote = ""
+    pending_space = False
+    for character in text:
+        if quote:
+            result.append(character)
+            if character == quote:
+                quote = ""
+            continue
+        if character.isspace():
+            pending_space = True
+            continue
+        if pending_space and result and character not in tight_characters and result[-1] not in tight_characters:
+            result.append(" ")
+        pending_space = False
+        if character in "\"'":
+            quote = character
+        result.append(character)
+    return "".join(result)
+
+
+def _split_top_level(text: str, separator: str) -> List[str]:
+    """Split on ``separator`` outside of strings and parentheses."""
+    parts: List[str] = []
+    depth = 0
+    quote = ""
+    start = 0
+    for index, character in enumerate(text):
+        if quote:
+            if character == quote:
+                quote = ""
+        elif character in "\"'":
+            quote = character
+        elif character == "(":
+            depth += 1
+        elif character == ")":
+            depth -= 1
+        elif character == separator and depth == 0:
+            parts.append(text[start:index])
+            start = index + 1
+    parts.append(text[start:])
+    return parts
+
+
+def _find_block_end(css: str, start: int) -> int:
+    """Index of the ``}`` closing the block opened just before ``start``."""
+    depth = 1
+    quote = ""
+    for index in range(start, len(css)):
+        character = css[index]
+        if quote:
+            if character == quote:
+                quote = ""
+        elif character in "\"'":
+            quote = character
+        elif character == "{":
+            depth += 1
+        elif character == "}":
+            depth -= 1
+            if depth == 0:
+                return index
+    return len(css)
+
+
+def parse_css_rules(css: str) -> List[CssRule]:
+    """Parse a stylesheet into style rules and opaque at-rules."""
+    css = CSS_COMMENT_PATTERN.sub("", css)
+    rules: List[CssRule] = []
+    position = 0
+    while position < len(css):
+        brace = css.find("{", position)
+        semicolon = css.find(";", position)
+        if brace == -1:
+            break
+        prelude = css[position:brace].strip()
+        # Statement at-rules without a block, e.g. @import or @charset
+        if prelude.startswith("@") and -1 < semicolon < brace:
+            rules.append((None, _collapse(css[position : semicolon + 1].strip(), ",;")))
+            position = semicolon + 1
+            continue
+        end = _find_block_end(css, brace + 1)
+        if prelude.startswith("@"):
+            rules.append((None, _collapse(css[position : end + 1].strip(), "{};,")))
+        elif prelude:
+            selectors = tuple(dict.fromkeys(_collapse(selector, ",>+~") for selector in _split_top_level(prelude, ",")))
+            declarations = []
+            for declaration in _split_top_level(css[brace + 1 : end], ";"):
+                property_name, separator, value = declaration.partition(":")
+                if separator and property_name.strip() and value.strip():
+                    declarations.append((property_name.strip(), _collapse(value.strip(), ",")))
+            if declarations:
+                rules.append((selectors, tuple(declarations)))
+        position = end + 1
+    return rules
+
+
+def collect_dom_selector_tokens(html_fragments: Iterable[str]) -> FrozenSet[str]:
+    """``#id`` and ``.class`` tokens of every element in the given HTML."""
+    tokens: Set[str] = set()
+    for html in html_fragments:
+        for match in DOM_ATTRIBUTE_PATTERN.finditer(html):
+            value = match.group(2) or match.group(3) or match.group(4) or ""
+            if match.group(1).lower() == "id":
+                tokens.add(f"#{value.strip()}")
+            else:
+                tokens.update(f".{class_name}" for class_name in value.split())
+    return frozenset(tokens)
+
+
+def _is_selector_live(selector: str, dom_tokens: FrozenSet[str]) -> bool:
+    # Only look outside parentheses so that e.g. :not(.missing) never prunes a selector
+    depth = 0
+    outside = []
+    for character in selector:
+        if character == "(":
+            depth += 1
+        elif character == ")":
+            depth -= 1
+        elif depth == 0:
+            outside.append(character)
+    return all(
+        token in dom_tokens or token in RUNTIME_SELECTOR_TOKENS
+        for token in SELECTOR_TOKEN_PATTERN.findall("".join(outside))
+    )
+
+
+def prune_css_rules(rules: Iterable[CssRule], dom_tokens: FrozenSet[str]) -> List[CssRule]:
+    """Drop selectors that reference an id or class absent from the DOM, and rules left without selectors."""
+    pruned: List[CssRule] = []
+    for selectors, body in rules:
+        if selectors is None:
+            pruned.append((selectors, body))
+            continue
+        live_selectors = tuple(selector for selector in selectors if _is_selector_live(selector, dom_tokens))
+        if live_selectors:
+            pruned.append((live_selectors, body))
+    return pruned
+
+
+def intern_css_rules(rules: Iterable[CssRule]) -> List[CssRule]:
+    """
+    Group selectors sharing an identical declaration block into the first rule with that block.
+
+    A selector is only moved up when no rule in between targets the same selector, so the cascade is
+    unchanged as long as different selectors never match the same element, which holds for the
+    page-scoped ``#page-<id>`` / ``.page-<id>-<position>-component`` rules generated per page.
+    """
+    groups: List[Tuple[Optional[List[str]], Union[Declarations, str]]] = []
+    group_by_block: Dict[Declarations, int] = {}
+    last_group_by_selector: Dict[str, int] = {}
+    for selectors, body in rules:
+        if selectors is None:
+            # Never move a selector across an at-rule, whose content is not inspected
+            groups.append((None, body))
+            group_by_block.clear()
+            continue
+        index = group_by_block.get(body)
+        if index is None or any(last_group_by_selector.get(selector, -1) > index for selector in selectors):
+            index = len(groups)
+            groups.append(([], body))
+            group_by_block[body] = index
+        group_selectors = groups[index][0]
+        for selector in selectors:
+            if selector not in group_selectors:
+                group_selectors.append(selector)
+            last_group_by_selector[selector] = index
+    return [(tuple(selectors) if selectors is not None else None, body) for selectors, body in groups]
+
+
+def serialize_css_rules(rules: Iterable[CssRule], output_mode: HtmlOutputMode) -> Iterator[str]:
+    """Yield the stylesheet one rule at a time, minified or indented for debugging."""
+    minified = output_mode == HtmlOutputMode.MINIFIED
+    for selectors, body in rules:
+        if selectors is None:
+            yield body if minified else f"{body}\n\n"
+        elif minified:
+            declarations = ";".join(f"{property_name}:{value}" for property_name, value in body)
+            yield f"{','.join(selectors)}{{{declarations}}}"
+        else:
+            declarations = "".join(f"    {property_name}: {value};\n" for property_name, value in body)
+            selector_list = ",\n".join(selectors)
+            yield f"{selector_list} {{\n{declarations}}}\n\n"
@@ -0,0 +1,35 @@
+import asyncio
+import time
+from typing import Dict
+
+from server.utilities.constants import EVENT_LOOP_MONITOR_INTERVAL_SECONDS
+
+
+class EventLoopMonitor:
+    """Gauge of how late the event loop wakes up from a fixed sleep, i.e. how long callbacks wait to run."""
+
+    def __init__(self, interval_seconds: float = EVENT_LOOP_MONITOR_INTERVAL_SECONDS) -> None:
+        self.interval_seconds = interval_seconds
+        self.lag_seconds = 0.0
+        self.max_lag_seconds = 0.0
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval_seconds)
+            self.lag_seconds = max(loop.time() - started - self.interval_seconds, 0.0)
+            self.max_lag_seconds = max(self.max_lag_seconds, self.lag_seconds)
+
+    def get_stats(self) -> Dict[str, float]:
+        stats = {
+            "event_loop_lag_seconds": round(self.lag_seconds, 6),
+            "event_loop_max_lag_seconds": round(self.max_lag_seconds, 6),
+            "timestamp": time.time(),
+        }
+        # The maximum is reported since the previous read
+        self.max_lag_seconds = self.lag_seconds
+        return stats
+
+
+EVENT_LOOP_MONITOR = EventLoopMonitor()
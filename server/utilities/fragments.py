@@ -0,0 +1,23 @@
+from typing import Iterable
+from typing import Iterator
+from typing import List
+
+from server.utilities.constants import FRAGMENT_FLUSH_SIZE
+
+
+def encode_fragments(fragments: Iterable[str], flush_size: int = FRAGMENT_FLUSH_SIZE) -> Iterator[bytes]:
+    """Encode text fragments, coalescing them into chunks of roughly ``flush_size`` bytes for the writer."""
+    pending: List[bytes] = []
+    pending_size = 0
+    for fragment in fragments:
+        if not fragment:
+            continue
+        data = fragment.encode()
+        pending.append(data)
+        pending_size += len(data)
+        if pending_size >= flush_size:
+            yield b"".join(pending)
+            pending.clear()
+            pending_size = 0
+    if pending:
+        yield b"".join(pending)
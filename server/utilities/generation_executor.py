@@ -0,0 +1,54 @@
+import asyncio
+import functools
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from server.utilities.constants import GENERATION_EXECUTOR
+from server.utilities.constants import GENERATION_WORKERS
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationExecutor:
+    """Runs CPU-heavy generation off the event loop, in worker threads or in a pool of worker processes."""
+
+    __process_pool: Optional[ProcessPoolExecutor] = None
+
+    @staticmethod
+    async def run(function: Callable[..., Any], *args: Any) -> Any:
+        if GENERATION_EXECUTOR == "process":
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                GenerationExecutor.__get_process_pool(), functools.partial(function, *args)
+            )
+        return await run_in_threadpool(function, *args)
+
+    @staticmethod
+    def start() -> None:
+        if GENERATION_EXECUTOR == "process":
+            GenerationExecutor.__get_process_pool()
+
+    @staticmethod
+    def shutdown() -> None:
+        if GenerationExecutor.__process_pool is not None:
+            GenerationExecutor.__process_pool.shutdown(wait=True, cancel_futures=True)
+            GenerationExecutor.__process_pool = None
+
+    @staticmethod
+    def __get_process_pool() -> ProcessPoolExecutor:
+        if GenerationExecutor.__process_pool is None:
+            logger.warning(
+                "Rendering in worker processes: their stage, storage and cache metrics are not reported by /metrics, "
+                "and each worker has its own page fragment cache, only reused when it renders the same pages again"
+            )
+            # Spawn rather than fork: the parent already runs storage and event loop threads
+            GenerationExecutor.__process_pool = ProcessPoolExecutor(
+                max_workers=GENERATION_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+        return GenerationExecutor.__process_pool
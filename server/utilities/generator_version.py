@@ -0,0 +1,23 @@
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+SERVER_DIR = Path(__file__).parent.parent
+# Everything that decides the generated output: the generator code, the templates and their stylesheets
+GENERATOR_SOURCE_PATTERNS = ["**/*.py", "templates/*.html", "templates/macros/*.html", "templates/css/*.css"]
+
+
+@lru_cache(maxsize=None)
+def get_generator_version() -> str:
+    """
+    Digest of the generator sources, so that page fragments and build state recorded by other code are never reused.
+    Read once per process, on first use, as the sources do not change while it runs.
+    """
+    digest = hashlib.sha256()
+    for pattern in GENERATOR_SOURCE_PATTERNS:
+        for path in sorted(SERVER_DIR.glob(pattern)):
+            if "benchmark" in path.parts:
+                continue
+            digest.update(f"{path.relative_to(SERVER_DIR).as_posix()}|".encode())
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
@@ -0,0 +1,184 @@
+import re
+import time
+from html.parser import HTMLParser
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from server.model.html_output_mode import HtmlOutputMode
+from server.utilities.metrics import STAGE_DURATION
+
+# Content of these tags is written out untouched, like BeautifulSoup's preserve_whitespace_tags
+PRESERVE_WHITESPACE_TAGS = frozenset(["a", "u", "p", "pre", "textarea"])
+RAW_TEXT_TAGS = frozenset(["script", "style"])
+VOID_TAGS = frozenset([
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "link",
+    "meta",
+    "source",
+    "track",
+    "wbr",
+])
+# Whitespace next to these tags never renders, so it can be dropped instead of collapsed to a single space
+BLOCK_TAGS = frozenset(
+    [
+        "html", "head", "body", "title", "meta", "link", "script", "style", "noscript",
+        "div", "section", "article", "header", "footer", "main", "nav", "aside",
+        "figure", "figcaption", "iframe", "p", "ul", "ol", "li", "table", "thead", "tbody", "tr", "td", "th",
+        "h1", "h2", "h3", "h4", "h5", "h6", "hr", "br", "blockquote", "pre", "form",
+    ]
+)  # fmt: skip
+WHITESPACE_PATTERN = re.compile(r"\s+")
+PRETTY_INDENT = " "
+
+
+class HtmlSerializer(HTMLParser):
+    """Streaming HTML re-serializer.
+
+    Markup is fed in chunks with ``feed`` and written out through ``write`` as soon as it is parsed, so the
+    whole document never has to be held in memory. ``MINIFIED`` keeps tags exactly as written and only
+    collapses whitespace; ``PRETTY`` indents one tag per line and is meant for debugging.
+    """
+
+    def __init__(self, write: Callable[[str], None], output_mode: HtmlOutputMode = HtmlOutputMode.MINIFIED) -> None:
+        super().__init__(convert_charrefs=False)
+        self.write = write
+        self.output_mode = HtmlOutputMode(output_mode)
+        self.depth = 0
+        self.open_tags: List[str] = []
+        self.preserve_depth = 0
+        self.raw_text_tag: Optional[str] = None
+        # Text is buffered until the next tag, so runs split by entities are collapsed as a whole
+        self.text_buffer: List[str] = []
+        self.previous_tag: Optional[str] = None
+
+    def handle_decl(self, decl: str) -> None:
+        self.__write_markup(f"<!{decl}>", None, inline=False)
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:  # noqa: ARG002
+        self.__flush_text(tag)
+        self.__write_markup(self.get_starttag_text(), tag, inline=self.__is_verbatim())
+        if tag in VOID_TAGS:
+            return
+        self.open_tags.append(tag)
+        self.depth += 1
+        if tag in PRESERVE_WHITESPACE_TAGS:
+            self.preserve_depth += 1
+        if tag in RAW_TEXT_TAGS:
+            self.raw_text_tag = tag
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:  # noqa: ARG002
+        self.__write_markup(self.get_starttag_text(), tag, inline=self.__is_verbatim())
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in VOID_TAGS:
+            return
+        self.__flush_text(tag)
+        inline = self.__is_verbatim()
+        if tag in self.open_tags:
+            # Close anything left open inside this tag, as a browser would
+            while self.open_tags:
+                open_tag = self.open_tags.pop()
+                self.depth -= 1
+                if open_tag in PRESERVE_WHITESPACE_TAGS:
+                    self.preserve_depth -= 1
+                if open_tag == tag:
+                    break
+        self.raw_text_tag = None
+        self.__write_markup(f"</{tag}>", tag, inline=inline)
+
+    def handle_data(self, data: str) -> None:
+        self.text_buffer.append(data)
+
+    def handle_entityref(self, name: str) -> None:
+        self.text_buffer.append(f"&{name};")
+
+    def handle_charref(self, name: str) -> None:
+        self.text_buffer.append(f"&#{name};")
+
+    def handle_comment(self, data: str) -> None:
+        if self.output_mode == HtmlOutputMode.PRETTY:
+            self.__write_markup(f"<!--{data}-->", None, inline=self.__is_verbatim())
+
+    def close(self) -> None:
+        super().close()
+        self.__flush_text(None)
+        if self.output_mode == HtmlOutputMode.PRETTY:
+            self.write("\n")
+
+    def __is_verbatim(self) -> bool:
+        return self.preserve_depth > 0 or self.raw_text_tag is not None
+
+    def __write_markup(self, markup: str, tag: Optional[str], *, inline: bool) -> None:
+        self.__flush_text(tag)
+        if self.output_mode == HtmlOutputMode.PRETTY and not inline:
+            self.write(f"\n{PRETTY_INDENT * self.depth}{markup}")
+        else:
+            self.write(markup)
+        self.previous_tag = tag
+
+    def __flush_text(self, next_tag: Optional[str]) -> None:
+        if not self.text_buffer:
+            return
+        text = "".join(self.text_buffer)
+        self.text_buffer.clear()
+        if self.__is_verbatim():
+            self.write(text)
+            return
+        text = WHITESPACE_PATTERN.sub(" ", text)
+        if self.output_mode == HtmlOutputMode.PRETTY:
+            text = text.strip()
+            if text:
+                self.write(f"\n{PRETTY_INDENT * self.depth}{text}")
+            return
+        if self.__is_block(self.previous_tag):
+            text = text.lstrip(" ")
+        if self.__is_block(next_tag):
+            text = text.rstrip(" ")
+        self.write(text)
+
+    @staticmethod
+    def __is_block(tag: Optional[str]) -> bool:
+        # None marks the start or end of the document, a doctype or a comment
+        return tag is None or tag in BLOCK_TAGS
+
+
+def serialize_html_fragments(
+    fragments: Iterable[str], output_mode: HtmlOutputMode = HtmlOutputMode.MINIFIED
+) -> Iterator[str]:
+    """Serialize markup arriving in fragments, yielding output as soon as each fragment has been parsed."""
+    string_builder: List[str] = []
+    serializer = HtmlSerializer(string_builder.append, output_mode)
+    leading = True
+    # Only the time spent serializing, not producing the fragments or consuming the output
+    serialize_seconds = 0.0
+    for fragment in fragments:
+        started = time.perf_counter()
+        serializer.feed(fragment)
+        serialize_seconds += time.perf_counter() - started
+        if string_builder:
+            output = "".join(string_builder)
+            string_builder.clear()
+            if leading:
+                output = output.lstrip("\n")
+                leading = not output
+            yield output
+    started = time.perf_counter()
+    serializer.close()
+    STAGE_DURATION.observe(serialize_seconds + time.perf_counter() - started, stage="html_serialize")
+    output = "".join(string_builder)
+    yield output.lstrip("\n") if leading else output
+
+
+def serialize_html(html_content: str, output_mode: HtmlOutputMode = HtmlOutputMode.MINIFIED) -> str:
+    return "".join(serialize_html_fragments([html_content], output_mode))
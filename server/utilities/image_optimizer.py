@@ -0,0 +1,188 @@
+import io
+import logging
+import tempfile
+import threading
+from functools import lru_cache
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from server.model.artifact import Artifact
+from server.model.asset_ref import AssetRef
+from server.model.image_variant import ImageVariant
+from server.model.image_variants import ImageVariants
+from server.storage.storage_backend import StorageBackend
+from server.storage.storage_backend_factory import StorageBackendFactory
+from server.utilities.asset_store import ASSETS_FOLDER
+from server.utilities.asset_store import get_asset_key
+from server.utilities.constants import IMAGE_VARIANT_FORMATS
+from server.utilities.constants import IMAGE_VARIANT_WIDTHS
+from server.utilities.constants import STREAM_CHUNK_SIZE
+from server.utilities.metrics import time_stage
+
+try:
+    from PIL import Image as PillowImage
+    from PIL import ImageOps
+except ImportError:
+    # Optional dependency, images are published as uploaded without it
+    PillowImage = None
+    ImageOps = None
+
+logger = logging.getLogger(__name__)
+
+# Variants are named after the content of their image, so identical uploads share them
+VARIANTS_FOLDER = f"{ASSETS_FOLDER}/variants"
+# Uploads up to this size are decoded from memory, larger ones from a temporary file
+SPOOL_MAX_BYTES = 16 * 1024 * 1024
+# Format name: Pillow format, content type, file extension and encoder options
+FORMATS: Dict[str, Tuple[str, str, str, dict]] = {
+    "avif": ("AVIF", "image/avif", "avif", {"quality": 60}),
+    "webp": ("WEBP", "image/webp", "webp", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", "image/jpeg", "jpg", {"quality": 82, "optimize": True, "progressive": True}),
+    "png": ("PNG", "image/png", "png", {"optimize": True}),
+}
+# EXIF orientations that rotate the image by 90 degrees
+TRANSPOSED_ORIENTATIONS = frozenset([5, 6, 7, 8])
+# Recorded variants never change for a given image, so they are only read from storage once
+VARIANTS_CACHE_SIZE = 4096
+
+_recorded_variants: Dict[str, ImageVariants] = {}
+_recorded_variants_lock = threading.Lock()
+
+
+def get_image_variants_key(sha256: str) -> str:
+    return f"{VARIANTS_FOLDER}/{sha256}.json"
+
+
+@lru_cache(maxsize=None)
+def get_variant_formats() -> Tuple[str, ...]:
+    """The configured formats that the installed Pillow can encode."""
+    if PillowImage is None:
+        return ()
+    variant_formats = []
+    for name in IMAGE_VARIANT_FORMATS:
+        if name not in FORMATS:
+            logger.warning(f"Ignoring unknown image variant format '{name}'")
+            continue
+        try:
+            PillowImage.new("RGB", (1, 1)).save(io.BytesIO(), format=FORMATS[name][0])
+        except (KeyError, OSError):
+            logger.warning(f"Ignoring image variant format '{name}', not supported by the installed Pillow")
+            continue
+        variant_formats.append(name)
+    return tuple(variant_formats)
+
+
+def get_variant_widths(width: int) -> List[int]:
+    """Configured widths below the intrinsic width, plus the intrinsic width capped at the largest of them."""
+    widths = sorted({variant_width for variant_width in IMAGE_VARIANT_WIDTHS if variant_width < width})
+    largest = min(width, max(IMAGE_VARIANT_WIDTHS))
+    if not widths or widths[-1] < largest:
+        widths.append(largest)
+    return widths
+
+
+def generate_image_variants(sha256: str) -> Optional[ImageVariants]:
+    """
+    Resize an uploaded image to every variant width, re-encoded without metadata in each variant format and as a
+    JPEG (PNG with transparency) fallback, then record the variants next to them for the page generation.
+    """
+    if PillowImage is None:
+        logger.info(f"Pillow is not installed, not generating variants of {sha256}")
+        return None
+
+    storage_backend = StorageBackendFactory.get_storage_backend()
+    if storage_backend.exists(get_image_variants_key(sha256)):
+        logger.info(f"Variants of {sha256} have already been generated")
+        return None
+    with time_stage("image_optimization"), tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as file:
+        try:
+            for chunk in storage_backend.iter_chunks(get_asset_key(sha256), STREAM_CHUNK_SIZE):
+                file.write(chunk)
+            file.seek(0)
+            with PillowImage.open(file) as image:
+                image_variants, artifacts = encode_image_variants(image, sha256)
+        except Exception:
+            logger.exception(f"Failed to generate variants of {sha256}")
+            return None
+
+        storage_backend.put_many(artifacts)
+    # Written last, so that pages never reference variants that are still being uploaded
+    storage_backend.put(get_image_variants_key(sha256), image_variants.model_dump_json().encode(), "application/json")
+    logger.info(f"Generated {len(image_variants.variants)} variants of {sha256}")
+    return image_variants
+
+
+def encode_image_variants(image: "PillowImage.Image", sha256: str) -> Tuple[ImageVariants, List[Artifact]]:
+    orientation = image.getexif().get(0x0112, 1)
+    width, height = image.size
+    if orientation in TRANSPOSED_ORIENTATIONS:
+        width, height = height, width
+    # Animations would be lost when resizing, so only their dimensions are recorded
+    if getattr(image, "is_animated", False):
+        return ImageVariants(width=width, height=height), []
+
+    widths = get_variant_widths(width)
+    # JPEGs are decoded straight at a fraction of their size when all variants are much smaller
+    scale = widths[-1] / width
+    image.draft("RGB", (int(image.size[0] * scale) + 1, int(image.size[1] * scale) + 1))
+    image = ImageOps.exif_transpose(image)
+    has_alpha = image.mode in {"RGBA", "LA", "PA"} or (image.mode == "P" and "transparency" in image.info)
+    image = image.convert("RGBA" if has_alpha else "RGB")
+    icc_profile = image.info.get("icc_profile")
+    formats = [*get_variant_formats(), "png" if has_alpha else "jpeg"]
+
+    variants = []
+    artifacts = []
+    for variant_width in widths:
+        variant_height = max(round(height * variant_width / width), 1)
+        if image.size != (variant_width, variant_height):
+            resized = image.resize((variant_width, variant_height), PillowImage.LANCZOS, reducing_gap=3.0)
+        else:
+            resized = image
+        for name in formats:
+            pillow_format, content_type, extension, options = FORMATS[name]
+            output = io.BytesIO()
+            # Only the colour profile is kept, EXIF and other metadata are not written
+            resized.save(output, format=pillow_format, icc_profile=icc_profile, **options)
+            variant_filename = f"{sha256}-{variant_width}w.{extension}"
+            variants.append(
+                ImageVariant(
+                    filename=variant_filename,
+                    content_type=content_type,
+                    width=variant_width,
+                    height=variant_height,
+                    size=output.tell(),
+                )
+            )
+            artifacts.append(
+                Artifact(key=f"{VARIANTS_FOLDER}/{variant_filename}", content_type=content_type, data=output.getvalue())
+            )
+    return ImageVariants(width=width, height=height, variants=variants), artifacts
+
+
+def get_image_variants(storage_backend: StorageBackend, sha256: str) -> Optional[ImageVariants]:
+    """Recorded variants of an image, None until they have been generated."""
+    with _recorded_variants_lock:
+        image_variants = _recorded_variants.get(sha256)
+    if image_variants is not None:
+        return image_variants
+    key = get_image_variants_key(sha256)
+    if not storage_backend.exists(key):
+        return None
+    image_variants = ImageVariants.model_validate_json(storage_backend.get(key))
+    with _recorded_variants_lock:
+        if len(_recorded_variants) >= VARIANTS_CACHE_SIZE:
+            del _recorded_variants[next(iter(_recorded_variants))]
+        _recorded_variants[sha256] = image_variants
+    return image_variants
+
+
+def load_image_variants(storage_backend: StorageBackend, asset_refs: Dict[str, AssetRef]) -> Dict[str, ImageVariants]:
+    """Recorded variants of every referenced image, by uploaded filename."""
+    names = [name for name in asset_refs if name.startswith("images/")]
+    image_variants = storage_backend.get_executor().map(
+        lambda name: get_image_variants(storage_backend, asset_refs[name].sha256), names
+    )
+    return {name.split("/", 1)[1]: variants for name, variants in zip(names, image_variants) if variants is not None}
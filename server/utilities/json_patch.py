@@ -0,0 +1,160 @@
+import copy
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from server.model.json_patch_operation import JsonPatchOperation
+
+Container = Union[dict, list]
+
+
+def parse_pointer(pointer: str) -> List[str]:
+    """Reference tokens of an RFC 6901 JSON pointer, ``""`` being the whole document."""
+    if not pointer:
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer '{pointer}'")
+    return [segment.replace("~1", "/").replace("~0", "~") for segment in pointer[1:].split("/")]
+
+
+def _get_index(container: list, segment: str, pointer: str, *, allow_end: bool = False) -> int:
+    if allow_end and segment == "-":
+        return len(container)
+    if not segment.isdigit() or (len(segment) > 1 and segment[0] == "0"):
+        raise ValueError(f"Invalid array index '{segment}' in '{pointer}'")
+    index = int(segment)
+    if index > len(container) or (index == len(container) and not allow_end):
+        raise ValueError(f"Array index '{segment}' out of range in '{pointer}'")
+    return index
+
+
+def _resolve(document: Any, segments: List[str], pointer: str) -> Any:
+    value = document
+    for segment in segments:
+        if isinstance(value, list):
+            value = value[_get_index(value, segment, pointer)]
+        elif isinstance(value, dict) and segment in value:
+            value = value[segment]
+        else:
+            raise ValueError(f"Path '{pointer}' does not exist")  # noqa: TRY004
+    return value
+
+
+def _resolve_parent(document: Any, pointer: str) -> Tuple[Container, str]:
+    segments = parse_pointer(pointer)
+    parent = _resolve(document, segments[:-1], pointer)
+    if not isinstance(parent, (dict, list)):
+        raise ValueError(f"Path '{pointer}' does not exist")  # noqa: TRY004
+    return parent, segments[-1]
+
+
+def _json_equal(left: Any, right: Any) -> bool:
+    # Unlike Python, JSON does not consider true equal to 1
+    if isinstance(left, bool) or isinstance(right, bool):
+        return isinstance(left, bool) and isinstance(right, bool) and left == right
+    if isinstance(left, dict) and isinstance(right, dict):
+        return left.keys() == right.keys() and all(_json_equal(left[key], right[key]) for key in left)
+    if isinstance(left, list) and isinstance(right, list):
+        return len(left) == len(right) and all(map(_json_equal, left, right))
+    if isinstance(left, (int, float)) and isinstance(right, (int, float)):
+        return left == right
+    return type(left) is type(right) and left == right
+
+
+def _add(document: Any, pointer: str, value: Any) -> Any:
+    if not pointer:
+        return value
+    parent, segment = _resolve_parent(document, pointer)
+    if isinstance(parent, list):
+        parent.insert(_get_index(parent, segment, pointer, allow_end=True), value)
+    else:
+        parent[segment] = value
+    return document
+
+
+def _remove(document: Any, pointer: str) -> Tuple[Any, Any]:
+    """Document without the value at ``pointer``, and that value."""
+    if not pointer:
+        raise ValueError("Cannot remove the whole document")
+    parent, segment = _resolve_parent(document, pointer)
+    if isinstance(parent, list):
+        return document, parent.pop(_get_index(parent, segment, pointer))
+    if segment not in parent:
+        raise ValueError(f"Path '{pointer}' does not exist")
+    return document, parent.pop(segment)
+
+
+def _apply_add(document: Any, operation: JsonPatchOperation) -> Any:
+    return _add(document, operation.path, copy.deepcopy(operation.value))
+
+
+def _apply_remove(document: Any, operation: JsonPatchOperation) -> Any:
+    document, _ = _remove(document, operation.path)
+    return document
+
+
+def _apply_replace(document: Any, operation: JsonPatchOperation) -> Any:
+    if not operation.path:
+        return copy.deepcopy(operation.value)
+    parent, segment = _resolve_parent(document, operation.path)
+    if isinstance(parent, list):
+        segment = _get_index(parent, segment, operation.path)
+    elif segment not in parent:
+        raise ValueError(f"Path '{operation.path}' does not exist")
+    # In place, so that object keys keep their order
+    parent[segment] = copy.deepcopy(operation.value)
+    return document
+
+
+def _apply_move(document: Any, operation: JsonPatchOperation) -> Any:
+    if operation.path.startswith(f"{operation.from_}/"):
+        raise ValueError(f"Cannot move '{operation.from_}' into one of its children")
+    if operation.path == operation.from_:
+        return document
+    document, value = _remove(document, operation.from_)
+    return _add(document, operation.path, value)
+
+
+def _apply_copy(document: Any, operation: JsonPatchOperation) -> Any:
+    value = _resolve(document, parse_pointer(operation.from_), operation.from_)
+    return _add(document, operation.path, copy.deepcopy(value))
+
+
+def _apply_test(document: Any, operation: JsonPatchOperation) -> Any:
+    if not _json_equal(_resolve(document, parse_pointer(operation.path), operation.path), operation.value):
+        raise ValueError(f"'{operation.path}' does not match the tested value")
+    return document
+
+
+OPERATIONS: Dict[str, Callable[[Any, JsonPatchOperation], Any]] = {
+    "add": _apply_add,
+    "remove": _apply_remove,
+    "replace": _apply_replace,
+    "move": _apply_move,
+    "copy": _apply_copy,
+    "test": _apply_test,
+}
+
+
+def apply_json_patch(document: Any, operations: Iterable[JsonPatchOperation]) -> Any:
+    """
+    Apply RFC 6902 operations to a copy of a parsed JSON document and return the patched copy.
+
+    Raises ValueError on the first operation that cannot be applied. The patch is atomic, as RFC 6902 section 5
+    requires: the given document is never modified, whether the patch applies or not.
+    """
+    document = copy.deepcopy(document)
+    for index, operation in enumerate(operations):
+        if operation.op in {"add", "replace", "test"} and "value" not in operation.model_fields_set:
+            raise ValueError(f"Operation {index} ({operation.op}) is missing 'value'")
+        if operation.op in {"move", "copy"} and operation.from_ is None:
+            raise ValueError(f"Operation {index} ({operation.op}) is missing 'from'")
+        try:
+            document = OPERATIONS[operation.op](document, operation)
+        except ValueError as e:
+            raise ValueError(f"Operation {index} ({operation.op}) failed: {e}") from e
+    return document
@@ -0,0 +1,81 @@
+import sys
+import threading
+from collections import deque
+from typing import Deque
+from typing import Generic
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class LazySequence(Generic[T]):
+    """Thread-safe view of an iterator that a fixed number of consumers iterate independently.
+
+    Items are produced on demand by whichever consumer needs them first, and only once. Each item is released as
+    soon as every consumer has read it, so only the items between the slowest and the fastest consumer are held.
+    """
+
+    def __init__(self, source: Iterable[T]) -> None:
+        self._source = iter(source)
+        self._items: Deque[T] = deque()
+        # Index of the first item still held
+        self._offset = 0
+        self._cursors: List[int] = []
+        self._exhausted = False
+        self._lock = threading.Lock()
+        # Serialises production, so that consumers behind the newest item are not blocked while it is produced
+        self._produce_lock = threading.Lock()
+
+    def split(self, count: int) -> List[Iterator[T]]:
+        """Create ``count`` independent iterators, all of which must be consumed for items to be released."""
+        with self._lock:
+            if self._offset or self._items:
+                raise RuntimeError("LazySequence can only be split before it is iterated")
+            consumers = list(range(len(self._cursors), len(self._cursors) + count))
+            self._cursors.extend(0 for _ in consumers)
+        return [self.__iterate(consumer) for consumer in consumers]
+
+    def __iterate(self, consumer: int) -> Iterator[T]:
+        index = 0
+        try:
+            while self.__advance(index):
+                index += 1
+                yield self.__take(consumer, index - 1)
+        finally:
+            # A finished or closed consumer no longer holds any item back
+            self.__take(consumer, sys.maxsize)
+
+    def __take(self, consumer: int, index: int) -> Optional[T]:
+        """Read the item at ``index`` and release everything every consumer has read."""
+        with self._lock:
+            item = self._items[index - self._offset] if index < self._offset + len(self._items) else None
+            self._cursors[consumer] = index + 1
+            while self._items and self._offset < min(self._cursors):
+                self._items.popleft()
+                self._offset += 1
+            return item
+
+    def __advance(self, index: int) -> bool:
+        """Produce items up to ``index``, returning whether it exists."""
+        with self._lock:
+            if index < self._offset + len(self._items):
+                return True
+        with self._produce_lock:
+            while True:
+                with self._lock:
+                    if index < self._offset + len(self._items):
+                        return True
+                    if self._exhausted:
+                        return False
+                try:
+                    item = next(self._source)
+                except StopIteration:
+                    with self._lock:
+                        self._exhausted = True
+                    return False
+                with self._lock:
+                    self._items.append(item)
@@ -0,0 +1,44 @@
+from typing import Optional
+
+from server.model.article_assets import ArticleAssets
+from server.model.manifest import Manifest
+from server.storage.storage_backend import StorageBackend
+from server.utilities.article_assets import get_asset_objects
+from server.utilities.article_assets import load_article_assets
+from server.utilities.asset_store import ASSET_REFS_NAME
+
+MANIFEST_NAME = "manifest.json"
+# Editor state stays private, and the manifest itself is not an artifact
+UNPUBLISHED_NAMES = frozenset([MANIFEST_NAME, "payload.json", ASSET_REFS_NAME])
+
+
+def get_manifest_key(article_id: str) -> str:
+    return f"{article_id}/{MANIFEST_NAME}"
+
+
+def build_manifest(
+    storage_backend: StorageBackend, article_id: str, assets: Optional[ArticleAssets] = None
+) -> Manifest:
+    """Objects under the article prefix and the shared assets it refers to, with their ETags."""
+    if assets is None:
+        assets = load_article_assets(storage_backend, article_id)
+    stored_objects = [
+        *(
+            stored_object
+            for stored_object in storage_backend.list_objects(f"{article_id}/")
+            if stored_object.key.removeprefix(f"{article_id}/") not in UNPUBLISHED_NAMES
+        ),
+        *get_asset_objects(assets),
+    ]
+    return Manifest(objects={stored_object.key: stored_object.etag or "" for stored_object in stored_objects})
+
+
+def read_manifest(storage_backend: StorageBackend, article_id: str) -> Optional[Manifest]:
+    key = get_manifest_key(article_id)
+    if not storage_backend.exists(key):
+        return None
+    return Manifest.model_validate_json(storage_backend.get(key))
+
+
+def write_manifest(storage_backend: StorageBackend, article_id: str, manifest: Manifest) -> None:
+    storage_backend.put(get_manifest_key(article_id), manifest.model_dump_json().encode(), "application/json")
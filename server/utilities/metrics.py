@@ -0,0 +1,197 @@
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+from server.utilities.constants import BUCKET
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _format_labels(label_names: Sequence[str], label_values: Sequence[str]) -> str:
+    if not label_names:
+        return ""
+    pairs = []
+    for label_name, label_value in zip(label_names, label_values):
+        escaped = str(label_value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{label_name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class Metric:
+    """A metric family in the Prometheus text exposition format; every sample is labeled with the backend."""
+
+    type = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = ("backend", *label_names)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return (labels.pop("backend", BUCKET), *(str(labels[label_name]) for label_name in self.label_names[1:]))
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}", *self._render_samples()]
+
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}" for key, value in values]
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, label_names: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(buckets)
+        # Per label set: count per bucket (the last one is +Inf), sum of observations
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[bisect_left(self.buckets, value)] += 1
+            total[0] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            values = [(key, list(counts), total[0]) for key, (counts, total) in self._values.items()]
+        samples = []
+        for key, counts, total in values:
+            cumulative = 0
+            for upper_bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                labels = _format_labels((*self.label_names, "le"), (*key, _format_value(upper_bound)))
+                samples.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, key)
+            samples.extend([
+                f"{self.name}_sum{labels} {_format_value(total)}",
+                f"{self.name}_count{labels} {cumulative}",
+            ])
+        return samples
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self.metrics: List[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+METRICS = MetricsRegistry()
+
+STAGE_DURATION = METRICS.register(
+    Histogram("scrolly_stage_duration_seconds", "Duration of a website generation stage.", ["stage"])
+)
+STORAGE_OPERATION_DURATION = METRICS.register(
+    Histogram("scrolly_storage_operation_duration_seconds", "Duration of a storage operation.", ["operation"])
+)
+BYTES_WRITTEN = METRICS.register(
+    Counter("scrolly_bytes_written_total", "Bytes written to storage per artifact type.", ["artifact_type"])
+)
+HTTP_REQUESTS = METRICS.register(
+    Counter("scrolly_http_requests_total", "Handled HTTP requests.", ["method", "endpoint", "status"])
+)
+HTTP_REQUESTS_IN_FLIGHT = METRICS.register(
+    Gauge("scrolly_http_requests_in_flight", "HTTP requests currently being handled.", ["endpoint"])
+)
+HTTP_REQUEST_DURATION = METRICS.register(
+    Histogram("scrolly_http_request_duration_seconds", "Time until the response starts.", ["method", "endpoint"])
+)
+BUILDS_IN_FLIGHT = METRICS.register(
+    Gauge("scrolly_builds_in_flight", "Queued or running builds per endpoint that submitted them.", ["endpoint"])
+)
+EVENT_LOOP_LAG = METRICS.register(Gauge("scrolly_event_loop_lag_seconds", "Latest measured event loop lag."))
+PAGE_FRAGMENT_CACHE_EVENTS = METRICS.register(
+    Gauge("scrolly_page_fragment_cache", "Page fragment cache entries, hits, misses and evictions.", ["stat"])
+)
+PAYLOAD_CACHE_EVENTS = METRICS.register(
+    Gauge("scrolly_payload_cache", "Payload cache entries, bytes, hits, misses and evictions.", ["stat"])
+)
+ASSET_DISK_CACHE_EVENTS = METRICS.register(
+    Gauge("scrolly_asset_disk_cache", "Asset disk cache entries, bytes, hits, misses and evictions.", ["stat"])
+)
+PRECOMPRESSION_RATIO = METRICS.register(
+    Gauge(
+        "scrolly_precompression_ratio",
+        "Compressed to original size of the latest precompressed artifact.",
+        ["artifact_type", "encoding"],
+    )
+)
+
+
+@contextmanager
+def time_stage(stage: str) -> Iterator[None]:
+    with STAGE_DURATION.time(stage=stage):
+        yield
+
+
+def get_artifact_type(key: str) -> str:
+    suffix = key.rsplit(".", 1)[-1].lower() if "." in key.rsplit("/", 1)[-1] else ""
+    if suffix in {"png", "jpg", "jpeg", "gif", "webp", "avif", "svg"}:
+        return "image"
+    if suffix in {"html", "css", "js", "json", "zip"}:
+        return suffix
+    return "other"
@@ -0,0 +1,73 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict
+from typing import Optional
+
+from server.model.ir.page_ir import PageIR
+from server.model.page_fragment import PageFragment
+from server.utilities.constants import ANIMATION_SCRIPT_MODE
+from server.utilities.constants import BUCKET
+from server.utilities.constants import MINIO_PREVIEW_ENDPOINT
+from server.utilities.constants import MINIO_SCHEME
+from server.utilities.constants import PAGE_FRAGMENT_CACHE_SIZE
+from server.utilities.generator_version import get_generator_version
+
+
+class PageFragmentCache:
+    """Thread-safe LRU cache of rendered page fragments keyed by page fingerprint."""
+
+    def __init__(self, max_entries: int = PAGE_FRAGMENT_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._fragments: OrderedDict[str, PageFragment] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(page: PageIR, article_id: str, assets_version: str = "") -> str:
+        # Anything that changes the rendered output must be part of the key: the article id and storage
+        # settings end up in asset URLs, and the generator version covers changes to the generator code and templates
+        digest = hashlib.sha256()
+        digest.update(f"{get_generator_version()}|{ANIMATION_SCRIPT_MODE}|{BUCKET}|{MINIO_SCHEME}|".encode())
+        digest.update(f"{MINIO_PREVIEW_ENDPOINT}|{article_id}|{assets_version}|".encode())
+        # Digest of the page content, taken once when the request was lowered
+        digest.update(page.digest.encode())
+        return digest.hexdigest()
+
+    def get(self, fingerprint: str) -> Optional[PageFragment]:
+        with self._lock:
+            fragment = self._fragments.get(fingerprint)
+            if fragment is None:
+                self.misses += 1
+                return None
+            self._fragments.move_to_end(fingerprint)
+            self.hits += 1
+            return fragment
+
+    def put(self, fingerprint: str, fragment: PageFragment) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._fragments[fingerprint] = fragment
+            self._fragments.move_to_end(fingerprint)
+            while len(self._fragments) > self.max_entries:
+                self._fragments.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fragments.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._fragments),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+PAGE_FRAGMENT_CACHE = PageFragmentCache()
@@ -0,0 +1,93 @@
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict
+from typing import Optional
+
+from server.model.cached_payload import CachedPayload
+from server.utilities.constants import PAYLOAD_CACHE_MAX_BYTES
+
+
+class PayloadCache:
+    """Thread-safe LRU cache of stored article payloads, bounded by their total size in bytes."""
+
+    def __init__(self, max_bytes: int = PAYLOAD_CACHE_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._payloads: OrderedDict[str, CachedPayload] = OrderedDict()
+        # Bumped on every save, so that a read racing with a save cannot cache the payload it replaced
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._article_locks: weakref.WeakValueDictionary[str, threading.Lock] = weakref.WeakValueDictionary()
+
+    @staticmethod
+    def get_etag(data: bytes) -> str:
+        return f'"{hashlib.sha256(data).hexdigest()}"'
+
+    def get(self, article_id: str) -> Optional[CachedPayload]:
+        with self._lock:
+            payload = self._payloads.get(article_id)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._payloads.move_to_end(article_id)
+            self.hits += 1
+            return payload
+
+    def get_generation(self, article_id: str) -> int:
+        """Read before fetching a payload from storage and pass on to put."""
+        with self._lock:
+            return self._generations.get(article_id, 0)
+
+    def put(self, article_id: str, data: bytes, generation: int) -> CachedPayload:
+        payload = CachedPayload(data=data, etag=PayloadCache.get_etag(data))
+        if len(data) > self.max_bytes:
+            return payload
+        with self._lock:
+            if self._generations.get(article_id, 0) != generation:
+                return payload
+            self.__remove(article_id)
+            self._payloads[article_id] = payload
+            self.size_bytes += len(data)
+            while self.size_bytes > self.max_bytes:
+                _, evicted = self._payloads.popitem(last=False)
+                self.size_bytes -= len(evicted.data)
+                self.evictions += 1
+        return payload
+
+    def get_article_lock(self, article_id: str) -> threading.Lock:
+        """Held while an article's payload is written, so that patches apply to the version they were checked on."""
+        with self._lock:
+            return self._article_locks.setdefault(article_id, threading.Lock())
+
+    def invalidate(self, article_id: str) -> None:
+        with self._lock:
+            self._generations[article_id] = self._generations.get(article_id, 0) + 1
+            self.__remove(article_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._payloads.clear()
+            self.size_bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._payloads),
+                "bytes": self.size_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __remove(self, article_id: str) -> None:
+        payload = self._payloads.pop(article_id, None)
+        if payload is not None:
+            self.size_bytes -= len(payload.data)
+
+
+PAYLOAD_CACHE = PayloadCache()
@@ -0,0 +1,139 @@
+import logging
+import zlib
+from functools import lru_cache
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from server.model.artifact import Artifact
+from server.utilities.constants import BROTLI_LEVEL
+from server.utilities.constants import GZIP_LEVEL
+from server.utilities.constants import PRECOMPRESS_ENCODINGS
+from server.utilities.metrics import PRECOMPRESSION_RATIO
+from server.utilities.metrics import get_artifact_type
+
+try:
+    import brotli
+except ImportError:
+    # Optional dependency, only the gzip copies are written without it
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Content-Encoding: suffix of the precompressed copy, stored next to the original with the same content type
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+# Generated text artifacts that have precompressed copies
+PRECOMPRESSED_SUFFIXES = (".html", ".css", ".js")
+# Window bits of zlib for the gzip format, the header has no file name and a zero mtime so the output is reproducible
+GZIP_WBITS = 31
+
+
+@lru_cache(maxsize=None)
+def get_precompress_encodings() -> Tuple[str, ...]:
+    """The configured encodings that can be written, in order of preference."""
+    encodings = []
+    for encoding in PRECOMPRESS_ENCODINGS:
+        if encoding not in ENCODING_SUFFIXES:
+            logger.warning(f"Ignoring unknown precompression encoding '{encoding}'")
+            continue
+        if encoding == "br" and brotli is None:
+            logger.warning("Ignoring precompression encoding 'br', the brotli package is not installed")
+            continue
+        encodings.append(encoding)
+    return tuple(encodings)
+
+
+def get_precompressed_key(key: str, encoding: str) -> str:
+    return f"{key}{ENCODING_SUFFIXES[encoding]}"
+
+
+def get_precompressed_keys(key: str) -> List[str]:
+    """Keys of the copies of ``key`` in every known encoding, whether or not they are still written."""
+    return [get_precompressed_key(key, encoding) for encoding in ENCODING_SUFFIXES]
+
+
+def get_precompressed_encoding(key: str) -> Optional[str]:
+    """Encoding of a precompressed copy, None for any other key."""
+    for encoding, suffix in ENCODING_SUFFIXES.items():
+        if key.endswith(suffix) and key[: -len(suffix)].endswith(PRECOMPRESSED_SUFFIXES):
+            return encoding
+    return None
+
+
+def create_compressor(encoding: str) -> Tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+    """Functions to compress the next chunk and to finish the stream."""
+    if encoding == "br":
+        compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=BROTLI_LEVEL)
+        return compressor.process, compressor.finish
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, GZIP_WBITS)
+    return compressor.compress, compressor.flush
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    process, finish = create_compressor(encoding)
+    return process(data) + finish()
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.decompress(data)
+    return zlib.decompress(data, GZIP_WBITS)
+
+
+def get_accepted_encodings(accept_encoding: Optional[str]) -> List[str]:
+    """Precompressed encodings acceptable to the client, in order of preference."""
+    if not accept_encoding:
+        return []
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, parameter = item.partition(";")
+        name, _, value = parameter.partition("=")
+        try:
+            quality = float(value) if name.strip().lower() == "q" else 1.0
+        except ValueError:
+            continue
+        if quality > 0:
+            accepted.add(coding.strip().lower())
+    return [encoding for encoding in ENCODING_SUFFIXES if encoding in accepted or "*" in accepted]
+
+
+class Precompressor:
+    """Compresses an artifact in every precompression encoding while its chunks are passed on unchanged."""
+
+    def __init__(self, key: str, content_type: str, encodings: Optional[Iterable[str]] = None) -> None:
+        self.key = key
+        self.content_type = content_type
+        self.size = 0
+        # Compressed size relative to the original size, by encoding, once the artifacts have been built
+        self.ratios: Dict[str, float] = {}
+        encodings = get_precompress_encodings() if encodings is None else encodings
+        self.__compressors = {encoding: create_compressor(encoding) for encoding in encodings}
+        self.__compressed: Dict[str, List[bytes]] = {encoding: [] for encoding in self.__compressors}
+
+    def wrap(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        for chunk in chunks:
+            self.size += len(chunk)
+            for encoding, (process, _) in self.__compressors.items():
+                self.__compressed[encoding].append(process(chunk))
+            yield chunk
+
+    def get_artifacts(self) -> List[Artifact]:
+        """The precompressed copies, once every chunk of the original has been passed on."""
+        artifacts = []
+        for encoding, (_, finish) in self.__compressors.items():
+            data = b"".join([*self.__compressed[encoding], finish()])
+            self.ratios[encoding] = len(data) / self.size if self.size else 1.0
+            artifact_type = get_artifact_type(self.key)
+            PRECOMPRESSION_RATIO.set(self.ratios[encoding], artifact_type=artifact_type, encoding=encoding)
+            artifacts.append(
+                Artifact(key=get_precompressed_key(self.key, encoding), content_type=self.content_type, data=data)
+            )
+        return artifacts
+
+    def describe(self) -> str:
+        ratios = ", ".join(f"{encoding} {ratio:.0%}" for encoding, ratio in self.ratios.items())
+        return f"{self.key.rsplit('/', 1)[-1]} {self.size:,} bytes ({ratios})"
@@ -0,0 +1,57 @@
+from typing import Collection
+
+from fastapi import HTTPException
+from fastapi import status
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+
+class RequestSizeLimitMiddleware:
+    """
+    Rejects request bodies above ``max_bytes`` on the given paths with 413 while they are being received, so that an
+    oversized upload is neither buffered nor spooled to disk in full.
+    """
+
+    def __init__(self, app: ASGIApp, max_bytes: int, paths: Collection[str]) -> None:
+        self.app = app
+        self.max_bytes = max_bytes
+        self.paths = tuple(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].endswith(self.paths):
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_bytes:
+            await self.__reject(send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # Raised while the route reads the body, turned into a response by the exception handlers
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"Request body is larger than {self.max_bytes} bytes",
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    async def __reject(self, send: Send) -> None:
+        body = f'{{"detail":"Request body is larger than {self.max_bytes} bytes"}}'.encode()
+        await send({
+            "type": "http.response.start",
+            "status": status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,48 @@
+from typing import Any
+from typing import Dict
+
+DEFAULT_TITLE = "My Animated Website"
+
+
+def is_editor_payload(document: Dict[str, Any]) -> bool:
+    """Payloads saved by the editor keep component content under ``metadata``, unlike /generate-website bodies."""
+    return any(
+        "metadata" in component
+        for page in document.get("pages") or []
+        for frame in page.get("frames") or []
+        for component in frame.get("components") or []
+    )
+
+
+def to_article_payload(document: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The /generate-website body of a saved payload, built the same way as ``prepareDataForPost`` in the frontend.
+    Bodies that are already in that form are returned unchanged.
+    """
+    if not is_editor_payload(document):
+        return {**document, "title": document.get("title") or DEFAULT_TITLE}
+
+    pages = []
+    for page_index, page in enumerate(document.get("pages") or []):
+        frames = []
+        for frame_index, frame in enumerate(page.get("frames") or []):
+            components = []
+            for component_index, component in enumerate(frame.get("components") or []):
+                metadata = component.get("metadata") or {}
+                component_type = component.get("type")
+                components.append({
+                    **component,
+                    "id": f"{page_index}-{frame_index}-{component_index}",
+                    "image": {
+                        "data": metadata.get("image"),
+                        "isDisplayFullscreen": metadata.get("isDisplayFullscreen"),
+                        "caption": metadata.get("caption"),
+                    }
+                    if component_type == "image"
+                    else None,
+                    "html": {"data": metadata.get("html")} if component_type == "html" else None,
+                    "contentHtml": metadata.get("htmlContent") if component_type == "text" else None,
+                })
+            frames.append({**frame, "components": components, "id": f"{page_index}-{frame_index}"})
+        pages.append({**page, "frames": frames, "id": f"{page_index}"})
+    return {**document, "title": document.get("title") or DEFAULT_TITLE, "pages": pages}
@@ -0,0 +1,53 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable
+from typing import Optional
+from typing import Tuple
+
+from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
+from jinja2 import FileSystemLoader
+from jinja2.bccache import Bucket
+
+from server.utilities.constants import CDN_URL
+
+TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
+TEMPLATE_BYTECODE_CACHE_DIR = os.getenv(
+    "TEMPLATE_BYTECODE_CACHE_DIR", str(Path(tempfile.gettempdir()) / "scrolly-telling-jinja")
+)
+CDN_HOSTS = ["https://cdn.jsdelivr.net", "https://cdnjs.cloudflare.com"]
+
+
+class CdnRewritingLoader(FileSystemLoader):
+    """Loads templates from disk and points the public CDN URLs at ``CDN_URL`` once, at load time."""
+
+    def get_source(self, environment: Environment, template: str) -> Tuple[str, Optional[str], Callable[[], bool]]:
+        source, filename, uptodate = super().get_source(environment, template)
+        if CDN_URL:
+            for cdn_host in CDN_HOSTS:
+                source = source.replace(cdn_host, f"{CDN_URL}/{cdn_host.removeprefix('https://')}")
+        return source, filename, uptodate
+
+
+class LazyFileSystemBytecodeCache(FileSystemBytecodeCache):
+    """Creates its directory when the first template is compiled instead of when the environment is created."""
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        Path.mkdir(Path(self.directory), parents=True, exist_ok=True)
+        super().dump_bytecode(bucket)
+
+
+def create_template_environment() -> Environment:
+    return Environment(
+        loader=CdnRewritingLoader(TEMPLATE_DIR),
+        bytecode_cache=LazyFileSystemBytecodeCache(TEMPLATE_BYTECODE_CACHE_DIR),
+        auto_reload=False,
+        # The templates ship with the package, and the components' rich text and HTML are meant to be inserted as
+        # markup, exactly as the previous Template() rendering did
+        autoescape=False,  # noqa: S701
+    )
+
+
+# Process-wide environment, so every template is loaded, rewritten and compiled only once
+TEMPLATE_ENVIRONMENT = create_template_environment()
@@ -1,28 +1,48 @@
-import io
 import logging
 import os
 import re
-import shutil
 from pathlib import Path
 from typing import Any
+from typing import BinaryIO
+from typing import Iterator
+from typing import List
 
-import boto3
 from jinja2 import Environment
 from jinja2 import FileSystemLoader
-from minio.commonconfig import CopySource
 
-from server.utilities.constants import BUCKET
+from server.model.asset_ref import AssetRef
+from server.model.manifest import Manifest
+from server.model.stored_object import StoredObject
+from server.storage.storage_backend import StorageBackend
+from server.storage.storage_backend_factory import StorageBackendFactory
+from server.utilities.article_assets import get_asset_objects
+from server.utilities.article_assets import load_article_assets
+from server.utilities.asset_store import ASSETS_FOLDER
+from server.utilities.asset_store import ASSET_REFS_NAME
+from server.utilities.asset_store import add_asset_ref
+from server.utilities.asset_store import get_asset_name
+from server.utilities.asset_store import is_shared_key
+from server.utilities.asset_store import store_asset
+from server.utilities.constants import ASSET_CACHE_CONTROL
 from server.utilities.constants import GSAP_LOCAL_PATH
-from server.utilities.constants import LOCAL_OUTPUT_DIR
-from server.utilities.constants import MINIO_CLIENT
 from server.utilities.constants import MINIO_PREVIEW_ENDPOINT
 from server.utilities.constants import MINIO_PRIVATE_ARTICLE_BUCKET
 from server.utilities.constants import MINIO_PUBLIC_ARTICLE_BUCKET
 from server.utilities.constants import MINIO_SCHEME
-from server.utilities.constants import S3_BUCKET
-from server.utilities.constants import S3_CLIENT
 from server.utilities.constants import SCROLLTRIGGER_LOCAL_PATH
 from server.utilities.constants import SMOOTH_SCROLLBAR_LOCAL_PATH
+from server.utilities.manifest import MANIFEST_NAME
+from server.utilities.manifest import build_manifest
+from server.utilities.manifest import read_manifest
+from server.utilities.manifest import write_manifest
+from server.utilities.metrics import time_stage
+from server.utilities.precompression import compress
+from server.utilities.precompression import decompress
+from server.utilities.precompression import get_precompressed_encoding
+from server.utilities.precompression import get_precompressed_key
+from server.utilities.zip_stream import ZipStreamWriter
+from server.utilities.zip_stream import iter_file_chunks
+from server.utilities.zip_stream import iter_prefetched_objects
 
 logger = logging.getLogger(__name__)
 
@@ -46,88 +66,133 @@ def generate_js_function(template_path: Path, output_file: Path, **kwargs: Any)
     logger.info(f"JavaScript function generated in {output_file}")
 
 
-def stage_file(article_id: str, file_content: bytes, filename: str, file_size: int, file_content_type: str, file_type: str) -> None:
-    if BUCKET == "LOCAL":
-        Path.mkdir(LOCAL_OUTPUT_DIR / article_id / f"{file_type}", parents=True, exist_ok=True)
-        # if Path.is_file(LOCAL_OUTPUT_DIR / article_id / "images" / filename):
-        #     raise FileExistsError("An image with the same name exists, please upload with a different name.")
-        Path(LOCAL_OUTPUT_DIR / article_id / f"{file_type}" / filename).write_bytes(file_content.read())
-        return str(LOCAL_OUTPUT_DIR / article_id / f"{file_type}" / filename)
-    if BUCKET == "MINIO":
-        if not MINIO_CLIENT.bucket_exists(MINIO_PRIVATE_ARTICLE_BUCKET):
-            MINIO_CLIENT.make_bucket(MINIO_PRIVATE_ARTICLE_BUCKET)
-
-        MINIO_CLIENT.put_object(
-            MINIO_PRIVATE_ARTICLE_BUCKET,
-            f"{article_id}/{file_type}/{filename}",
-            file_content,
-            length=file_size,
-            content_type=file_content_type,
-        )
-        return f"{MINIO_PREVIEW_ENDPOINT}/{MINIO_PRIVATE_ARTICLE_BUCKET}/{article_id}/{file_type}/{filename}"
-    S3_CLIENT.put_object(
-        Body=file_content,
-        Bucket=S3_BUCKET,
-        ServerSideEncryption="AES256",
-        Key=f"private-articles/{article_id}/{file_type}/{filename}",
-        ContentType=file_content_type,
-    )
-    return f"{MINIO_PREVIEW_ENDPOINT}/{article_id}/{file_type}/{filename}"
-
-
-def copy_files(
-    src_obj: str,
-    src_bucket: str = MINIO_PRIVATE_ARTICLE_BUCKET,
-    dest_bucket: str = MINIO_PUBLIC_ARTICLE_BUCKET,
-) -> str:
-    if BUCKET == "LOCAL":
-        return str(Path(LOCAL_OUTPUT_DIR / src_obj / "index.html"))
-    if BUCKET == "MINIO":
-        objs = MINIO_CLIENT.list_objects(src_bucket, src_obj, True)  # noqa: FBT003
-        for obj in objs:
-            if obj.object_name.endswith("index.html"):
-                Path.mkdir(LOCAL_OUTPUT_DIR / src_obj, parents=True, exist_ok=True)
-                MINIO_CLIENT.fget_object(src_bucket, obj.object_name, str(LOCAL_OUTPUT_DIR / obj.object_name))
-                with Path.open(LOCAL_OUTPUT_DIR / obj.object_name, encoding="utf-8") as file:
-                    html_template = file.read()
-                    html_template = html_template.replace(MINIO_PRIVATE_ARTICLE_BUCKET, MINIO_PUBLIC_ARTICLE_BUCKET)
-                    MINIO_CLIENT.put_object(
-                        MINIO_PUBLIC_ARTICLE_BUCKET,
-                        f"{src_obj}/index.html",
-                        io.BytesIO(html_template.encode()),
-                        length=len(html_template.encode()),
-                        content_type="text/html",
-                    )
-                shutil.rmtree(LOCAL_OUTPUT_DIR / src_obj)
-            else:
-                MINIO_CLIENT.copy_object(dest_bucket, obj.object_name, CopySource(src_bucket, obj.object_name))
-        return f"{MINIO_SCHEME}://{MINIO_PREVIEW_ENDPOINT}/{dest_bucket}/{src_obj}/index.html"
-    return f"{MINIO_SCHEME}://{MINIO_PREVIEW_ENDPOINT}/{src_obj}/index.html"
-
-
-def download_files(src_obj: str, src_bucket: str = MINIO_PRIVATE_ARTICLE_BUCKET) -> str:
-    if BUCKET == "S3":
-        Path.mkdir(LOCAL_OUTPUT_DIR / src_obj, parents=True, exist_ok=True)
-        s3 = boto3.resource("s3")
-        s3_bucket_client = s3.Bucket(S3_BUCKET)
-        objs = list(s3_bucket_client.objects.filter(Prefix=f"private-articles/{src_obj}"))
-        for obj in objs:
-            obj_path = os.path.dirname(obj.key).replace("private-articles", str(LOCAL_OUTPUT_DIR))
-            Path(obj_path).mkdir(parents=True, exist_ok=True)
-            s3_bucket_client.download_file(obj.key, f"{obj_path}/{os.path.basename(obj.key)}")
-    elif BUCKET == "MINIO":
-        Path.mkdir(LOCAL_OUTPUT_DIR / src_obj, parents=True, exist_ok=True)
-        objs = MINIO_CLIENT.list_objects(src_bucket, src_obj, True)  # noqa: FBT003
-        for obj in objs:
-            MINIO_CLIENT.fget_object(src_bucket, obj.object_name, str(LOCAL_OUTPUT_DIR / obj.object_name))
-    tmp = Path(str(LOCAL_OUTPUT_DIR / src_obj / "index.html")).read_text(encoding="utf-8")
-    tmp = tmp.replace(f"{MINIO_SCHEME}://{MINIO_PREVIEW_ENDPOINT}/{MINIO_PRIVATE_ARTICLE_BUCKET}/{src_obj}", ".")
-    shutil.copy(SMOOTH_SCROLLBAR_LOCAL_PATH, LOCAL_OUTPUT_DIR / src_obj / "js" / "smooth-scrollbar.js")
-    shutil.copy(GSAP_LOCAL_PATH, LOCAL_OUTPUT_DIR / src_obj / "js" / "gsap.min.js")
-    shutil.copy(SCROLLTRIGGER_LOCAL_PATH, LOCAL_OUTPUT_DIR / src_obj / "js" / "ScrollTrigger.min.js")
-    js_files = re.findall("https://.*.js", tmp)
+def stage_file(
+    article_id: str, file_content: BinaryIO, filename: str, file_content_type: str, file_type: str
+) -> AssetRef:
+    """Store an upload by content, once across all articles, and refer to it from the article by filename."""
+    storage_backend = StorageBackendFactory.get_storage_backend()
+    asset_ref = store_asset(storage_backend, file_content, file_content_type)
+    add_asset_ref(storage_backend, article_id, get_asset_name(file_type, filename), asset_ref)
+    return asset_ref
+
+
+def copy_files(src_obj: str) -> str:
+    """Publish an article, copying only the objects whose ETag changed since the last publish."""
+    storage_backend = StorageBackendFactory.get_storage_backend()
+    public_storage_backend = StorageBackendFactory.get_public_storage_backend()
+    if public_storage_backend is None:
+        return storage_backend.get_url(f"{src_obj}/index.html")
+
+    with time_stage("publish"):
+        return _publish_changes(storage_backend, public_storage_backend, src_obj)
+
+
+def _publish_changes(storage_backend: StorageBackend, public_storage_backend: StorageBackend, src_obj: str) -> str:
+    manifest = read_manifest(storage_backend, src_obj) or build_manifest(storage_backend, src_obj)
+    published_manifest = read_manifest(public_storage_backend, src_obj) or Manifest()
+    changed_keys = [
+        key for key, etag in manifest.objects.items() if not etag or published_manifest.objects.get(key) != etag
+    ]
+    # Shared assets may still be referenced by other articles, and are immutable anyway
+    removed_keys = [key for key in published_manifest.objects if key not in manifest.objects and not is_shared_key(key)]
+    logger.info(f"Publishing {src_obj}: {len(changed_keys)} changed, {len(removed_keys)} removed")
+
+    futures = [
+        storage_backend.get_executor().submit(_publish_object, storage_backend, public_storage_backend, key)
+        for key in changed_keys
+    ]
+    futures.extend(storage_backend.get_executor().submit(public_storage_backend.delete, key) for key in removed_keys)
+    for future in futures:
+        future.result()
+
+    # Only record the publish once every copy has succeeded, so a failed publish is retried in full next time
+    write_manifest(public_storage_backend, src_obj, manifest)
+    return public_storage_backend.get_url(f"{src_obj}/index.html")
+
+
+def _publish_object(storage_backend: StorageBackend, public_storage_backend: StorageBackend, key: str) -> None:
+    if key.endswith("/index.html"):
+        html_template = storage_backend.get(key).decode("utf-8")
+        html_template = html_template.replace(MINIO_PRIVATE_ARTICLE_BUCKET, MINIO_PUBLIC_ARTICLE_BUCKET)
+        public_storage_backend.put(key, html_template.encode(), "text/html")
+    elif _is_precompressed_index_html(key):
+        # The compressed copies of index.html refer to the private bucket too
+        encoding = get_precompressed_encoding(key)
+        html_template = decompress(storage_backend.get(key), encoding).decode("utf-8")
+        html_template = html_template.replace(MINIO_PRIVATE_ARTICLE_BUCKET, MINIO_PUBLIC_ARTICLE_BUCKET)
+        public_storage_backend.put(key, compress(html_template.encode(), encoding), "text/html")
+    elif is_shared_key(key):
+        # Published by whichever article referred to it first, and cacheable forever as the name is the content
+        if not public_storage_backend.exists(key):
+            storage_backend.copy_to(key, public_storage_backend, "application/octet-stream", ASSET_CACHE_CONTROL)
+    else:
+        storage_backend.copy_to(key, public_storage_backend, "application/octet-stream")
+
+
+def _is_precompressed_index_html(key: str) -> bool:
+    encoding = get_precompressed_encoding(key)
+    return encoding is not None and key.endswith(get_precompressed_key("/index.html", encoding))
+
+
+VENDOR_JS_PATHS = [SMOOTH_SCROLLBAR_LOCAL_PATH, GSAP_LOCAL_PATH, SCROLLTRIGGER_LOCAL_PATH]
+
+
+def rewrite_index_html_for_download(html_template: str, src_obj: str) -> str:
+    # Point assets at the archive instead of the bucket, and CDN scripts at the bundled vendor copies
+    private_bucket_url = f"{MINIO_SCHEME}://{MINIO_PREVIEW_ENDPOINT}/{MINIO_PRIVATE_ARTICLE_BUCKET}"
+    html_template = html_template.replace(f"{private_bucket_url}/{src_obj}", ".")
+    # Shared assets are bundled next to index.html instead of next to the article folder
+    html_template = html_template.replace(f"{private_bucket_url}/{ASSETS_FOLDER}/", f"./{ASSETS_FOLDER}/")
+    html_template = html_template.replace(f"../{ASSETS_FOLDER}/", f"./{ASSETS_FOLDER}/")
+    js_files = re.findall(r"https://[^\"'\s]+\.js", html_template)
     for js_file in js_files:
-        tmp = tmp.replace(js_file, f"js/{Path(js_file).name}")
-    Path(str(LOCAL_OUTPUT_DIR / src_obj / "index.html")).write_text(tmp, encoding="utf-8")
-    shutil.make_archive(LOCAL_OUTPUT_DIR / src_obj, "zip", LOCAL_OUTPUT_DIR / src_obj)
-    return f"{LOCAL_OUTPUT_DIR / src_obj}.zip"
+        html_template = html_template.replace(js_file, f"js/{Path(js_file).name}")
+    return html_template
+
+
+def download_files(src_obj: str) -> Iterator[bytes]:
+    """Return a generator of zip archive bytes for the article, built on the fly from storage."""
+    storage_backend = StorageBackendFactory.get_storage_backend()
+    stored_objects = storage_backend.list_objects(f"{src_obj}/")
+    if not any(stored_object.key == f"{src_obj}/index.html" for stored_object in stored_objects):
+        raise FileNotFoundError(f"Article {src_obj} has not been generated")
+    stored_objects.extend(get_asset_objects(load_article_assets(storage_backend, src_obj)))
+    return _stream_zip_files(storage_backend, stored_objects, src_obj)
+
+
+def _stream_zip_files(
+    storage_backend: StorageBackend, stored_objects: List[StoredObject], src_obj: str
+) -> Iterator[bytes]:
+    # Measured until the archive is fully sent, including the time the client takes to read it
+    with time_stage("zip_export"):
+        yield from _write_zip_entries(storage_backend, stored_objects, src_obj)
+
+
+def _write_zip_entries(
+    storage_backend: StorageBackend, stored_objects: List[StoredObject], src_obj: str
+) -> Iterator[bytes]:
+    zip_writer = ZipStreamWriter()
+    skipped_arcnames = {
+        MANIFEST_NAME,
+        ASSET_REFS_NAME,
+        *(f"js/{vendor_js_path.name}" for vendor_js_path in VENDOR_JS_PATHS),
+    }
+    stored_objects = [
+        stored_object
+        for stored_object in stored_objects
+        if stored_object.key.removeprefix(f"{src_obj}/") not in skipped_arcnames
+    ]
+    for stored_object, chunks in iter_prefetched_objects(storage_backend, stored_objects):
+        arcname = stored_object.key.removeprefix(f"{src_obj}/")
+        if arcname == "index.html":
+            index_html = rewrite_index_html_for_download(b"".join(chunks).decode("utf-8"), src_obj)
+            chunks = [index_html.encode()]  # noqa: PLW2901
+        elif _is_precompressed_index_html(stored_object.key):
+            encoding = get_precompressed_encoding(stored_object.key)
+            index_html = decompress(b"".join(chunks), encoding).decode("utf-8")
+            index_html = rewrite_index_html_for_download(index_html, src_obj)
+            chunks = [compress(index_html.encode(), encoding)]  # noqa: PLW2901
+        yield from zip_writer.write_entry(arcname, chunks)
+    for vendor_js_path in VENDOR_JS_PATHS:
+        yield from zip_writer.write_entry(f"js/{vendor_js_path.name}", iter_file_chunks(vendor_js_path))
+    yield zip_writer.close()
@@ -0,0 +1,109 @@
+import zipfile
+from collections import deque
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Deque
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from server.model.stored_object import StoredObject
+from server.storage.storage_backend import StorageBackend
+from server.utilities.constants import STREAM_CHUNK_SIZE
+from server.utilities.constants import ZIP_FETCH_CONCURRENCY
+from server.utilities.constants import ZIP_PREFETCH_MAX_BYTES
+
+# Already compressed formats are stored as-is instead of being deflated again
+STORED_SUFFIXES = frozenset([".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".zip", ".gz", ".br"])
+
+
+class ZipStreamBuffer:
+    """Write-only sink for ``zipfile.ZipFile``.
+
+    It has no ``tell``/``seek``, so ZipFile writes data descriptors instead of seeking back, and the bytes
+    written so far can be handed to the response and dropped with ``drain``.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ZipStreamWriter:
+    """Builds a zip archive incrementally, yielding the compressed bytes as each chunk is added."""
+
+    def __init__(self) -> None:
+        self._buffer = ZipStreamBuffer()
+        self._zip_file = zipfile.ZipFile(self._buffer, "w", compression=zipfile.ZIP_DEFLATED)
+
+    def write_entry(self, arcname: str, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        zip_info = zipfile.ZipInfo(arcname)
+        zip_info.compress_type = (
+            zipfile.ZIP_STORED if Path(arcname).suffix.lower() in STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+        )
+        with self._zip_file.open(zip_info, "w", force_zip64=True) as entry:
+            for chunk in chunks:
+                entry.write(chunk)
+                data = self._buffer.drain()
+                if data:
+                    yield data
+        yield self._buffer.drain()
+
+    def close(self) -> bytes:
+        self._zip_file.close()
+        return self._buffer.drain()
+
+
+def iter_prefetched_objects(
+    storage_backend: StorageBackend, stored_objects: List[StoredObject]
+) -> Iterator[Tuple[StoredObject, Iterable[bytes]]]:
+    """Pair each object with its content, fetching up to ``ZIP_FETCH_CONCURRENCY`` small objects ahead.
+
+    Objects above ``ZIP_PREFETCH_MAX_BYTES`` are streamed in chunks when their turn comes, so memory stays
+    bounded by the prefetch window rather than by the size of the article.
+    """
+    pending: Deque[Tuple[StoredObject, Optional[Future]]] = deque()
+    remaining = iter(stored_objects)
+
+    def schedule_next() -> None:
+        stored_object = next(remaining, None)
+        if stored_object is None:
+            return
+        future = None
+        if stored_object.size <= ZIP_PREFETCH_MAX_BYTES:
+            future = storage_backend.get_executor().submit(storage_backend.get, stored_object.key)
+        pending.append((stored_object, future))
+
+    for _ in range(max(ZIP_FETCH_CONCURRENCY, 1)):
+        schedule_next()
+    try:
+        while pending:
+            stored_object, future = pending.popleft()
+            schedule_next()
+            if future is None:
+                yield stored_object, storage_backend.iter_chunks(stored_object.key)
+            else:
+                yield stored_object, [future.result()]
+    finally:
+        for _, future in pending:
+            if future is not None:
+                future.cancel()
+
+
+def iter_file_chunks(path: Path, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    with path.open("rb") as file:
+        while chunk := file.read(chunk_size):
+            yield chunk
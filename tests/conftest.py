@@ -0,0 +1,19 @@
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from server.storage.local_storage_backend import LocalStorageBackend
+from server.storage.storage_backend_factory import StorageBackendFactory
+from server.utilities.page_fragment_cache import PAGE_FRAGMENT_CACHE
+
+
+@pytest.fixture
+def storage_backend(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[LocalStorageBackend]:
+    """A LOCAL backend in a scratch directory, used as the process-wide backend for the test."""
+    storage_backend = LocalStorageBackend(tmp_path / "output")
+    storage_backend.bootstrap()
+    monkeypatch.setattr(StorageBackendFactory, "_StorageBackendFactory__storage_backend", storage_backend)
+    PAGE_FRAGMENT_CACHE.clear()
+    yield storage_backend
+    PAGE_FRAGMENT_CACHE.clear()
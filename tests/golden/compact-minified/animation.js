@@ -0,0 +1,106 @@
+
+gsap.registerPlugin(ScrollTrigger);
+let bodyScrollBar = Scrollbar.init(document.body, {
+    damping: 0.1,
+    delegateTo: document,
+});
+ScrollTrigger.scrollerProxy(".scroller", {
+    scrollTop(value) {
+        if (arguments.length) {
+            bodyScrollBar.scrollTop = value;
+        }
+        return bodyScrollBar.scrollTop;
+    },
+});
+bodyScrollBar.addListener(ScrollTrigger.update);
+const scrollyAnimations = {
+    "fade": {
+        visible: function (selector) { gsap.set(selector, {opacity: 1}); },
+        hidden: function (selector) { gsap.set(selector, {opacity: 0}); },
+        enter: function (selector) { gsap.to(selector, {opacity: 1, duration: 0.33, zIndex: 1000}); },
+        exit: function (selector) { gsap.to(selector, {opacity: 0, duration: 0.33, zIndex: 0}); },
+        enterBack: function (selector) { gsap.to(selector, {opacity: 1, duration: 0.33, zIndex: 1000}); },
+        exitBack: function (selector) { gsap.to(selector, {opacity: 0, duration: 0.33, zIndex: 0}); },
+    },
+    "zoom": {
+        visible: function (selector) { gsap.set(selector, {scale: 1}); },
+        hidden: function (selector) { gsap.set(selector, {scale: 0}); },
+        enter: function (selector) { gsap.to(selector, {scale: 1, duration: 0.33}); },
+        exit: function (selector) { gsap.to(selector, {scale: 0, duration: 0.33}); },
+        enterBack: function (selector) { gsap.to(selector, {scale: 1, duration: 0.33}); },
+        exitBack: function (selector) { gsap.to(selector, {scale: 0, duration: 0.33}); },
+    },
+    "fly-in-bottom": {
+        visible: function (selector) { gsap.set(selector, {opacity: 1, y: 0}); },
+        hidden: function (selector) { gsap.set(selector, {opacity: 0, y: 500}); },
+        enter: function (selector) { gsap.to(selector, {opacity: 1, y: 0, duration: 0.33}); },
+        exit: function (selector) { gsap.to(selector, {opacity: 0, y: 500, duration: 0.33}); },
+        enterBack: function (selector) { gsap.to(selector, {opacity: 1, y: 0, duration: 0.33}); },
+        exitBack: function (selector) { gsap.to(selector, {opacity: 0, y: 500, duration: 0.33}); },
+    },
+    "fly-in-left": {
+        visible: function (selector) { gsap.set(selector, {opacity: 1, x: 0}); },
+        hidden: function (selector) { gsap.set(selector, {opacity: 0, x: -500}); },
+        enter: function (selector) { gsap.to(selector, {opacity: 1, x: 0, duration: 0.33}); },
+        exit: function (selector) { gsap.to(selector, {opacity: 0, x: -500, duration: 0.33}); },
+        enterBack: function (selector) { gsap.to(selector, {opacity: 1, x: 0, duration: 0.33}); },
+        exitBack: function (selector) { gsap.to(selector, {opacity: 0, x: -500, duration: 0.33}); },
+    },
+    "fly-in-right": {
+        visible: function (selector) { gsap.set(selector, {opacity: 1, x: 0}); },
+        hidden: function (selector) { gsap.set(selector, {opacity: 0, x: 500}); },
+        enter: function (selector) { gsap.to(selector, {opacity: 1, x: 0, duration: 0.33}); },
+        exit: function (selector) { gsap.to(selector, {opacity: 0, x: 500, duration: 0.33}); },
+        enterBack: function (selector) { gsap.to(selector, {opacity: 1, x: 0, duration: 0.33}); },
+        exitBack: function (selector) { gsap.to(selector, {opacity: 0, x: 500, duration: 0.33}); },
+    },
+    "overlap": {
+        visible: function (selector) { gsap.set(selector, {opacity: 1}); },
+        hidden: function (selector) { gsap.set(selector, {opacity: 0}); },
+        enter: function (selector) { gsap.to(selector, {opacity: 1, duration: -0.33, zIndex: 1000}); },
+        exit: function (selector) {  },
+        enterBack: function (selector) { gsap.to(selector, {opacity: 1, duration: -0.33, zIndex: 1000}); },
+        exitBack: function (selector) { gsap.to(selector, {opacity: 0, duration: 0.33, zIndex: 0}); },
+    }
+};
+function registerScrollyPage(page) {
+    const trigger = "#page-" + page.id;
+    page.components.forEach(function (row) {
+        const selector = "#comp-" + row[0];
+        const animation = scrollyAnimations[row[1]];
+        const startLength = row[2];
+        const endLength = row[3];
+        (row[4] ? animation.visible : animation.hidden)(selector);
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: trigger,
+                start: () => startLength === 0 ? "top+=0% bottom" : "top+=" + startLength * 50 + "% top",
+                end: () => startLength === 0 ? "+=150%" : "+=" + 50 * endLength + "%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => animation.enter(selector),
+                onLeave: () => animation.exit(selector),
+                onEnterBack: () => animation.enterBack(selector),
+                onLeaveBack: () => animation.exitBack(selector),
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+    });
+    ScrollTrigger.create({
+        trigger: trigger,
+        start: "top top",
+        end: () => "+=" + 50 * page.pin + "%",
+        pin: true,
+        pinSpacing: true,
+        scrub: true,
+        scroller: ".scroller",
+    });
+}
+registerScrollyPage({"id":"001","pin":6,"components":[["001-1-1","fly-in-left",0,1,1],["001-1-2","zoom",1,1,1],["001-2-1","overlap",2,1,0],["001-2-2","overlap",3,1,0],["001-3-1","fly-in-left",4,1,0],["001-3-2","fly-in-right",5,1,0]]});
+registerScrollyPage({"id":"002","pin":3,"components":[["002-1-1","fly-in-bottom",0,1,0],["002-2-1","fly-in-left",1,1,0],["002-3-1","overlap",2,1,0],["002-1-2","fly-in-bottom",0,1,0],["002-2-2","fly-in-left",1,1,0],["002-3-2","fade",2,1,0]]});
+registerScrollyPage({"id":"003","pin":3,"components":[["003-1-1","zoom",0,1,0],["003-2-1","fly-in-right",1,1,0],["003-3-1","fly-in-left",2,1,0],["003-1-2","fly-in-left",0,1,0],["003-2-2","fade",1,1,0],["003-3-2","overlap",2,1,0]]});
+registerScrollyPage({"id":"004","pin":3,"components":[["004-1-1","fly-in-bottom",0,1,0],["004-2-1","fly-in-left",1,1,0],["004-3-1","overlap",2,1,0],["004-1-2","fly-in-left",0,1,0],["004-2-2","fly-in-left",1,1,0],["004-3-2","fly-in-right",2,1,0]]});
+registerScrollyPage({"id":"005","pin":6,"components":[["005-1-1","fly-in-bottom",0,1,0],["005-1-2","fly-in-bottom",1,1,0],["005-2-1","fly-in-right",2,1,0],["005-2-2","fade",3,1,0],["005-3-1","fly-in-left",4,1,0],["005-3-2","fade",5,1,0]]});
+registerScrollyPage({"id":"009","pin":3,"components":[["009-1-1","zoom",0,1,0],["009-2-1","fade",1,1,0],["009-3-1","fade",2,1,0],["009-1-2","fly-in-left",0,1,0],["009-2-2","fade",1,1,0],["009-3-2","overlap",2,1,0]]});
+registerScrollyPage({"id":"012","pin":3,"components":[["012-1-1","zoom",0,1,0],["012-2-1","fly-in-right",1,1,0],["012-3-1","fly-in-left",2,1,0],["012-1-2","fly-in-left",0,1,0],["012-2-2","fly-in-right",1,1,0],["012-3-2","fly-in-right",2,1,0]]});
@@ -0,0 +1,1345 @@
+
+gsap.registerPlugin(ScrollTrigger);
+let bodyScrollBar = Scrollbar.init(document.body, {
+    damping: 0.1,
+    delegateTo: document,
+});
+ScrollTrigger.scrollerProxy(".scroller", {
+    scrollTop(value) {
+        if (arguments.length) {
+            bodyScrollBar.scrollTop = value;
+        }
+        return bodyScrollBar.scrollTop;
+    },
+});
+bodyScrollBar.addListener(ScrollTrigger.update);
+        gsap.set("#comp-001-1-1", {opacity: 1, x: 0});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-001",
+                start: () => "top+=0% bottom",
+                end: () => "+=150%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 001-1");
+                    gsap.to("#comp-001-1-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 001-1");
+                    gsap.to("#comp-001-1-1", {opacity: 0, x: -500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 001-1");
+                    gsap.to("#comp-001-1-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 001-1");
+                    gsap.to("#comp-001-1-1", {opacity: 0, x: -500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-001-1-2", {scale: 1});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-001",
+                start: () => "top+=50% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 001-1");
+                    gsap.to("#comp-001-1-2", {scale: 1, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 001-1");
+                    gsap.to("#comp-001-1-2", {scale: 0, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 001-1");
+                    gsap.to("#comp-001-1-2", {scale: 1, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 001-1");
+                    gsap.to("#comp-001-1-2", {scale: 0, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-001-2-1", {opacity: 0});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-001",
+                start: () => "top+=100% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 001-2");
+                    gsap.to("#comp-001-2-1", {opacity: 1, duration: -0.33, zIndex: 1000});
+                },
+                onLeave: () => {
+                    console.log("Leaving 001-2");
+                    
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 001-2");
+                    gsap.to("#comp-001-2-1", {opacity: 1, duration: -0.33, zIndex: 1000});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 001-2");
+                    gsap.to("#comp-001-2-1", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-001-2-2", {opacity: 0});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-001",
+                start: () => "top+=150% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 001-2");
+                    gsap.to("#comp-001-2-2", {opacity: 1, duration: -0.33, zIndex: 1000});
+                },
+                onLeave: () => {
+                    console.log("Leaving 001-2");
+                    
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 001-2");
+                    gsap.to("#comp-001-2-2", {opacity: 1, duration: -0.33, zIndex: 1000});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 001-2");
+                    gsap.to("#comp-001-2-2", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-001-3-1", {opacity: 0, x: -500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-001",
+                start: () => "top+=200% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 001-3");
+                    gsap.to("#comp-001-3-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 001-3");
+                    gsap.to("#comp-001-3-1", {opacity: 0, x: -500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 001-3");
+                    gsap.to("#comp-001-3-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 001-3");
+                    gsap.to("#comp-001-3-1", {opacity: 0, x: -500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-001-3-2", {opacity: 0, x: 500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-001",
+                start: () => "top+=250% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 001-3");
+                    gsap.to("#comp-001-3-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 001-3");
+                    gsap.to("#comp-001-3-2", {opacity: 0, x: 500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 001-3");
+                    gsap.to("#comp-001-3-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 001-3");
+                    gsap.to("#comp-001-3-2", {opacity: 0, x: 500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        ScrollTrigger.create({
+          trigger: '#page-001',
+          start: 'top top',
+          end: () => "+=300%",
+          pin: true,
+          pinSpacing: true,
+          scrub: true,
+          scroller: ".scroller",
+        });
+        
+        gsap.set("#comp-002-1-1", {opacity: 0, y: 500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-002",
+                start: () => "top+=0% bottom",
+                end: () => "+=150%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 002-1");
+                    gsap.to("#comp-002-1-1", {opacity: 1, y: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 002-1");
+                    gsap.to("#comp-002-1-1", {opacity: 0, y: 500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 002-1");
+                    gsap.to("#comp-002-1-1", {opacity: 1, y: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 002-1");
+                    gsap.to("#comp-002-1-1", {opacity: 0, y: 500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-002-2-1", {opacity: 0, x: -500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-002",
+                start: () => "top+=50% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 002-2");
+                    gsap.to("#comp-002-2-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 002-2");
+                    gsap.to("#comp-002-2-1", {opacity: 0, x: -500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 002-2");
+                    gsap.to("#comp-002-2-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 002-2");
+                    gsap.to("#comp-002-2-1", {opacity: 0, x: -500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-002-3-1", {opacity: 0});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-002",
+                start: () => "top+=100% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 002-3");
+                    gsap.to("#comp-002-3-1", {opacity: 1, duration: -0.33, zIndex: 1000});
+                },
+                onLeave: () => {
+                    console.log("Leaving 002-3");
+                    
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 002-3");
+                    gsap.to("#comp-002-3-1", {opacity: 1, duration: -0.33, zIndex: 1000});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 002-3");
+                    gsap.to("#comp-002-3-1", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-002-1-2", {opacity: 0, y: 500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-002",
+                start: () => "top+=0% bottom",
+                end: () => "+=150%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 002-1");
+                    gsap.to("#comp-002-1-2", {opacity: 1, y: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 002-1");
+                    gsap.to("#comp-002-1-2", {opacity: 0, y: 500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 002-1");
+                    gsap.to("#comp-002-1-2", {opacity: 1, y: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 002-1");
+                    gsap.to("#comp-002-1-2", {opacity: 0, y: 500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-002-2-2", {opacity: 0, x: -500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-002",
+                start: () => "top+=50% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 002-2");
+                    gsap.to("#comp-002-2-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 002-2");
+                    gsap.to("#comp-002-2-2", {opacity: 0, x: -500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 002-2");
+                    gsap.to("#comp-002-2-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 002-2");
+                    gsap.to("#comp-002-2-2", {opacity: 0, x: -500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-002-3-2", {opacity: 0});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-002",
+                start: () => "top+=100% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 002-3");
+                    gsap.to("#comp-002-3-2", {opacity: 1, duration: 0.33, zIndex: 1000});
+                },
+                onLeave: () => {
+                    console.log("Leaving 002-3");
+                    gsap.to("#comp-002-3-2", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 002-3");
+                    gsap.to("#comp-002-3-2", {opacity: 1, duration: 0.33, zIndex: 1000});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 002-3");
+                    gsap.to("#comp-002-3-2", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        ScrollTrigger.create({
+          trigger: '#page-002',
+          start: 'top top',
+          end: () => "+=150%",
+          pin: true,
+          pinSpacing: true,
+          scrub: true,
+          scroller: ".scroller",
+        });
+        
+        gsap.set("#comp-003-1-1", {scale: 0});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-003",
+                start: () => "top+=0% bottom",
+                end: () => "+=150%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 003-1");
+                    gsap.to("#comp-003-1-1", {scale: 1, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 003-1");
+                    gsap.to("#comp-003-1-1", {scale: 0, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 003-1");
+                    gsap.to("#comp-003-1-1", {scale: 1, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 003-1");
+                    gsap.to("#comp-003-1-1", {scale: 0, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-003-2-1", {opacity: 0, x: 500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-003",
+                start: () => "top+=50% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 003-2");
+                    gsap.to("#comp-003-2-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 003-2");
+                    gsap.to("#comp-003-2-1", {opacity: 0, x: 500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 003-2");
+                    gsap.to("#comp-003-2-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 003-2");
+                    gsap.to("#comp-003-2-1", {opacity: 0, x: 500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-003-3-1", {opacity: 0, x: -500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-003",
+                start: () => "top+=100% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 003-3");
+                    gsap.to("#comp-003-3-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 003-3");
+                    gsap.to("#comp-003-3-1", {opacity: 0, x: -500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 003-3");
+                    gsap.to("#comp-003-3-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 003-3");
+                    gsap.to("#comp-003-3-1", {opacity: 0, x: -500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-003-1-2", {opacity: 0, x: -500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-003",
+                start: () => "top+=0% bottom",
+                end: () => "+=150%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 003-1");
+                    gsap.to("#comp-003-1-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 003-1");
+                    gsap.to("#comp-003-1-2", {opacity: 0, x: -500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 003-1");
+                    gsap.to("#comp-003-1-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 003-1");
+                    gsap.to("#comp-003-1-2", {opacity: 0, x: -500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-003-2-2", {opacity: 0});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-003",
+                start: () => "top+=50% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 003-2");
+                    gsap.to("#comp-003-2-2", {opacity: 1, duration: 0.33, zIndex: 1000});
+                },
+                onLeave: () => {
+                    console.log("Leaving 003-2");
+                    gsap.to("#comp-003-2-2", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 003-2");
+                    gsap.to("#comp-003-2-2", {opacity: 1, duration: 0.33, zIndex: 1000});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 003-2");
+                    gsap.to("#comp-003-2-2", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-003-3-2", {opacity: 0});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-003",
+                start: () => "top+=100% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 003-3");
+                    gsap.to("#comp-003-3-2", {opacity: 1, duration: -0.33, zIndex: 1000});
+                },
+                onLeave: () => {
+                    console.log("Leaving 003-3");
+                    
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 003-3");
+                    gsap.to("#comp-003-3-2", {opacity: 1, duration: -0.33, zIndex: 1000});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 003-3");
+                    gsap.to("#comp-003-3-2", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        ScrollTrigger.create({
+          trigger: '#page-003',
+          start: 'top top',
+          end: () => "+=150%",
+          pin: true,
+          pinSpacing: true,
+          scrub: true,
+          scroller: ".scroller",
+        });
+        
+        gsap.set("#comp-004-1-1", {opacity: 0, y: 500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-004",
+                start: () => "top+=0% bottom",
+                end: () => "+=150%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 004-1");
+                    gsap.to("#comp-004-1-1", {opacity: 1, y: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 004-1");
+                    gsap.to("#comp-004-1-1", {opacity: 0, y: 500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 004-1");
+                    gsap.to("#comp-004-1-1", {opacity: 1, y: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 004-1");
+                    gsap.to("#comp-004-1-1", {opacity: 0, y: 500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-004-2-1", {opacity: 0, x: -500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-004",
+                start: () => "top+=50% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 004-2");
+                    gsap.to("#comp-004-2-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 004-2");
+                    gsap.to("#comp-004-2-1", {opacity: 0, x: -500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 004-2");
+                    gsap.to("#comp-004-2-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 004-2");
+                    gsap.to("#comp-004-2-1", {opacity: 0, x: -500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-004-3-1", {opacity: 0});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-004",
+                start: () => "top+=100% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 004-3");
+                    gsap.to("#comp-004-3-1", {opacity: 1, duration: -0.33, zIndex: 1000});
+                },
+                onLeave: () => {
+                    console.log("Leaving 004-3");
+                    
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 004-3");
+                    gsap.to("#comp-004-3-1", {opacity: 1, duration: -0.33, zIndex: 1000});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 004-3");
+                    gsap.to("#comp-004-3-1", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-004-1-2", {opacity: 0, x: -500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-004",
+                start: () => "top+=0% bottom",
+                end: () => "+=150%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 004-1");
+                    gsap.to("#comp-004-1-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 004-1");
+                    gsap.to("#comp-004-1-2", {opacity: 0, x: -500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 004-1");
+                    gsap.to("#comp-004-1-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 004-1");
+                    gsap.to("#comp-004-1-2", {opacity: 0, x: -500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-004-2-2", {opacity: 0, x: -500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-004",
+                start: () => "top+=50% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 004-2");
+                    gsap.to("#comp-004-2-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 004-2");
+                    gsap.to("#comp-004-2-2", {opacity: 0, x: -500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 004-2");
+                    gsap.to("#comp-004-2-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 004-2");
+                    gsap.to("#comp-004-2-2", {opacity: 0, x: -500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-004-3-2", {opacity: 0, x: 500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-004",
+                start: () => "top+=100% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 004-3");
+                    gsap.to("#comp-004-3-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 004-3");
+                    gsap.to("#comp-004-3-2", {opacity: 0, x: 500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 004-3");
+                    gsap.to("#comp-004-3-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 004-3");
+                    gsap.to("#comp-004-3-2", {opacity: 0, x: 500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        ScrollTrigger.create({
+          trigger: '#page-004',
+          start: 'top top',
+          end: () => "+=150%",
+          pin: true,
+          pinSpacing: true,
+          scrub: true,
+          scroller: ".scroller",
+        });
+        
+        gsap.set("#comp-005-1-1", {opacity: 0, y: 500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-005",
+                start: () => "top+=0% bottom",
+                end: () => "+=150%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 005-1");
+                    gsap.to("#comp-005-1-1", {opacity: 1, y: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 005-1");
+                    gsap.to("#comp-005-1-1", {opacity: 0, y: 500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 005-1");
+                    gsap.to("#comp-005-1-1", {opacity: 1, y: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 005-1");
+                    gsap.to("#comp-005-1-1", {opacity: 0, y: 500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-005-1-2", {opacity: 0, y: 500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-005",
+                start: () => "top+=50% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 005-1");
+                    gsap.to("#comp-005-1-2", {opacity: 1, y: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 005-1");
+                    gsap.to("#comp-005-1-2", {opacity: 0, y: 500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 005-1");
+                    gsap.to("#comp-005-1-2", {opacity: 1, y: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 005-1");
+                    gsap.to("#comp-005-1-2", {opacity: 0, y: 500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-005-2-1", {opacity: 0, x: 500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-005",
+                start: () => "top+=100% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 005-2");
+                    gsap.to("#comp-005-2-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 005-2");
+                    gsap.to("#comp-005-2-1", {opacity: 0, x: 500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 005-2");
+                    gsap.to("#comp-005-2-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 005-2");
+                    gsap.to("#comp-005-2-1", {opacity: 0, x: 500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-005-2-2", {opacity: 0});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-005",
+                start: () => "top+=150% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 005-2");
+                    gsap.to("#comp-005-2-2", {opacity: 1, duration: 0.33, zIndex: 1000});
+                },
+                onLeave: () => {
+                    console.log("Leaving 005-2");
+                    gsap.to("#comp-005-2-2", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 005-2");
+                    gsap.to("#comp-005-2-2", {opacity: 1, duration: 0.33, zIndex: 1000});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 005-2");
+                    gsap.to("#comp-005-2-2", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-005-3-1", {opacity: 0, x: -500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-005",
+                start: () => "top+=200% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 005-3");
+                    gsap.to("#comp-005-3-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 005-3");
+                    gsap.to("#comp-005-3-1", {opacity: 0, x: -500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 005-3");
+                    gsap.to("#comp-005-3-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 005-3");
+                    gsap.to("#comp-005-3-1", {opacity: 0, x: -500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-005-3-2", {opacity: 0});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-005",
+                start: () => "top+=250% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 005-3");
+                    gsap.to("#comp-005-3-2", {opacity: 1, duration: 0.33, zIndex: 1000});
+                },
+                onLeave: () => {
+                    console.log("Leaving 005-3");
+                    gsap.to("#comp-005-3-2", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 005-3");
+                    gsap.to("#comp-005-3-2", {opacity: 1, duration: 0.33, zIndex: 1000});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 005-3");
+                    gsap.to("#comp-005-3-2", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        ScrollTrigger.create({
+          trigger: '#page-005',
+          start: 'top top',
+          end: () => "+=300%",
+          pin: true,
+          pinSpacing: true,
+          scrub: true,
+          scroller: ".scroller",
+        });
+        
+        gsap.set("#comp-009-1-1", {scale: 0});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-009",
+                start: () => "top+=0% bottom",
+                end: () => "+=150%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 009-1");
+                    gsap.to("#comp-009-1-1", {scale: 1, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 009-1");
+                    gsap.to("#comp-009-1-1", {scale: 0, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 009-1");
+                    gsap.to("#comp-009-1-1", {scale: 1, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 009-1");
+                    gsap.to("#comp-009-1-1", {scale: 0, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-009-2-1", {opacity: 0});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-009",
+                start: () => "top+=50% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 009-2");
+                    gsap.to("#comp-009-2-1", {opacity: 1, duration: 0.33, zIndex: 1000});
+                },
+                onLeave: () => {
+                    console.log("Leaving 009-2");
+                    gsap.to("#comp-009-2-1", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 009-2");
+                    gsap.to("#comp-009-2-1", {opacity: 1, duration: 0.33, zIndex: 1000});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 009-2");
+                    gsap.to("#comp-009-2-1", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-009-3-1", {opacity: 0});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-009",
+                start: () => "top+=100% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 009-3");
+                    gsap.to("#comp-009-3-1", {opacity: 1, duration: 0.33, zIndex: 1000});
+                },
+                onLeave: () => {
+                    console.log("Leaving 009-3");
+                    gsap.to("#comp-009-3-1", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 009-3");
+                    gsap.to("#comp-009-3-1", {opacity: 1, duration: 0.33, zIndex: 1000});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 009-3");
+                    gsap.to("#comp-009-3-1", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-009-1-2", {opacity: 0, x: -500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-009",
+                start: () => "top+=0% bottom",
+                end: () => "+=150%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 009-1");
+                    gsap.to("#comp-009-1-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 009-1");
+                    gsap.to("#comp-009-1-2", {opacity: 0, x: -500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 009-1");
+                    gsap.to("#comp-009-1-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 009-1");
+                    gsap.to("#comp-009-1-2", {opacity: 0, x: -500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-009-2-2", {opacity: 0});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-009",
+                start: () => "top+=50% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 009-2");
+                    gsap.to("#comp-009-2-2", {opacity: 1, duration: 0.33, zIndex: 1000});
+                },
+                onLeave: () => {
+                    console.log("Leaving 009-2");
+                    gsap.to("#comp-009-2-2", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 009-2");
+                    gsap.to("#comp-009-2-2", {opacity: 1, duration: 0.33, zIndex: 1000});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 009-2");
+                    gsap.to("#comp-009-2-2", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-009-3-2", {opacity: 0});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-009",
+                start: () => "top+=100% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 009-3");
+                    gsap.to("#comp-009-3-2", {opacity: 1, duration: -0.33, zIndex: 1000});
+                },
+                onLeave: () => {
+                    console.log("Leaving 009-3");
+                    
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 009-3");
+                    gsap.to("#comp-009-3-2", {opacity: 1, duration: -0.33, zIndex: 1000});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 009-3");
+                    gsap.to("#comp-009-3-2", {opacity: 0, duration: 0.33, zIndex: 0});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        ScrollTrigger.create({
+          trigger: '#page-009',
+          start: 'top top',
+          end: () => "+=150%",
+          pin: true,
+          pinSpacing: true,
+          scrub: true,
+          scroller: ".scroller",
+        });
+        
+        gsap.set("#comp-012-1-1", {scale: 0});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-012",
+                start: () => "top+=0% bottom",
+                end: () => "+=150%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 012-1");
+                    gsap.to("#comp-012-1-1", {scale: 1, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 012-1");
+                    gsap.to("#comp-012-1-1", {scale: 0, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 012-1");
+                    gsap.to("#comp-012-1-1", {scale: 1, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 012-1");
+                    gsap.to("#comp-012-1-1", {scale: 0, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-012-2-1", {opacity: 0, x: 500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-012",
+                start: () => "top+=50% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 012-2");
+                    gsap.to("#comp-012-2-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 012-2");
+                    gsap.to("#comp-012-2-1", {opacity: 0, x: 500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 012-2");
+                    gsap.to("#comp-012-2-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 012-2");
+                    gsap.to("#comp-012-2-1", {opacity: 0, x: 500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-012-3-1", {opacity: 0, x: -500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-012",
+                start: () => "top+=100% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 012-3");
+                    gsap.to("#comp-012-3-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 012-3");
+                    gsap.to("#comp-012-3-1", {opacity: 0, x: -500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 012-3");
+                    gsap.to("#comp-012-3-1", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 012-3");
+                    gsap.to("#comp-012-3-1", {opacity: 0, x: -500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-012-1-2", {opacity: 0, x: -500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-012",
+                start: () => "top+=0% bottom",
+                end: () => "+=150%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 012-1");
+                    gsap.to("#comp-012-1-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 012-1");
+                    gsap.to("#comp-012-1-2", {opacity: 0, x: -500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 012-1");
+                    gsap.to("#comp-012-1-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 012-1");
+                    gsap.to("#comp-012-1-2", {opacity: 0, x: -500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-012-2-2", {opacity: 0, x: 500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-012",
+                start: () => "top+=50% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 012-2");
+                    gsap.to("#comp-012-2-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 012-2");
+                    gsap.to("#comp-012-2-2", {opacity: 0, x: 500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 012-2");
+                    gsap.to("#comp-012-2-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 012-2");
+                    gsap.to("#comp-012-2-2", {opacity: 0, x: 500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        gsap.set("#comp-012-3-2", {opacity: 0, x: 500});
+        gsap.timeline({
+            scrollTrigger: {
+                trigger: "#page-012",
+                start: () => "top+=100% top",
+                end: () => "+=50%",
+                scrub: true,
+                scroller: ".scroller",
+                onEnter: () => {
+                    console.log("Entering 012-3");
+                    gsap.to("#comp-012-3-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeave: () => {
+                    console.log("Leaving 012-3");
+                    gsap.to("#comp-012-3-2", {opacity: 0, x: 500, duration: 0.33});
+                },
+                onEnterBack: () => {
+                    console.log("Entering back 012-3");
+                    gsap.to("#comp-012-3-2", {opacity: 1, x: 0, duration: 0.33});
+                },
+                onLeaveBack: () => {
+                    console.log("Leaving back 012-3");
+                    gsap.to("#comp-012-3-2", {opacity: 0, x: 500, duration: 0.33});
+                },
+                toggleActions: "play none reverse none",
+                invalidateOnRefresh: true,
+            }
+        });
+
+        
+        ScrollTrigger.create({
+          trigger: '#page-012',
+          start: 'top top',
+          end: () => "+=150%",
+          pin: true,
+          pinSpacing: true,
+          scrub: true,
+          scroller: ".scroller",
+        });
+        
\ No newline at end of file
@@ -0,0 +1,37 @@
+import pytest
+
+from server.model.script.animation.animation_script_registry import AnimationScriptRegistry
+from server.model.script.animation.animation_scripts.animation_script import AnimationScript
+from server.model.script.animation.animation_scripts.animation_script_templates import COMPONENT_ID_PLACEHOLDER
+from server.model.script.animation.animation_scripts.fade_animation_script import FadeAnimationScript
+
+
+class SpinAnimationScript(AnimationScript):
+    def __init__(self, start_as_visible: bool) -> None:  # noqa: FBT001
+        super().__init__(start_as_visible)
+        self.turns = 2
+
+    def get_enter_js(self, component_id: str) -> str:
+        return f'gsap.to("#{component_id}", {{rotation: {360 * self.turns}}});'
+
+
+def test_scripts_are_shared_per_animation_and_visibility() -> None:
+    registry = AnimationScriptRegistry()
+    script = registry.get_script("fade", start_as_visible=False)
+    assert isinstance(script, FadeAnimationScript)
+    assert registry.get_script("fade", start_as_visible=False) is script
+    assert registry.get_script("fade", start_as_visible=True) is not script
+
+
+def test_shared_scripts_are_frozen() -> None:
+    script = AnimationScriptRegistry().get_script("fade", start_as_visible=True)
+    with pytest.raises(AttributeError):
+        script.start_as_visible = False
+
+
+def test_subclasses_can_set_attributes_in_init() -> None:
+    script = SpinAnimationScript(start_as_visible=True)
+    script.freeze()
+    assert script.get_templates().enter == f'gsap.to("#{COMPONENT_ID_PLACEHOLDER}", {{rotation: 720}});'
+    with pytest.raises(AttributeError):
+        script.turns = 3
@@ -0,0 +1,37 @@
+import json
+
+from server.utilities.article_lowering import parse_article_json
+
+
+def create_component(component_id: str, position: str) -> dict:
+    return {"id": component_id, "type": "text", "position": position, "animation": "fade", "contentHtml": "<p>Text</p>"}
+
+
+def test_duplicated_ids_take_the_place_found_first_in_group_order() -> None:
+    frames = [
+        [create_component("002-1-a", "left"), create_component("002-1-x", "right")],
+        [create_component("002-1-x", "left")],
+        [create_component("002-3-c", "left")],
+    ]
+    page = {
+        "id": "002",
+        "pinnable": True,
+        "layout": {"template": "left-right"},
+        "frames": [{"id": str(index + 1), "components": components} for index, components in enumerate(frames)],
+    }
+    article = parse_article_json(json.dumps({"articleId": "article", "title": "Title", "pages": [page]}))
+
+    (page_ir,) = article.pages
+    assert [(position, [component.id for component in group]) for position, group in page_ir.groups] == [
+        ("left", ["002-1-a", "002-1-x", "002-3-c"]),
+        ("right", ["002-1-x"]),
+    ]
+    # The left group is searched first, where the id is not the last of its group, although it first appears on the
+    # right, where it is the last of a group shorter than the pin
+    assert [(component.id, component.end_length) for component in page_ir.components] == [
+        ("002-1-a", 1),
+        ("002-1-x", 1),
+        ("002-1-x", 1),
+        ("002-3-c", 1),
+    ]
+    assert page_ir.pin_length == 3
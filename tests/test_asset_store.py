@@ -0,0 +1,24 @@
+import io
+
+import pytest
+
+from server.storage.local_storage_backend import LocalStorageBackend
+from server.utilities.asset_store import get_asset_key
+from server.utilities.asset_store import get_stored_asset
+from server.utilities.asset_store import store_asset
+
+
+def test_stored_asset_is_found_by_key(storage_backend: LocalStorageBackend, monkeypatch: pytest.MonkeyPatch) -> None:
+    asset_ref = store_asset(storage_backend, io.BytesIO(b"content"), "image/png")
+    # An asset whose hash starts like the stored one, which a prefix listing would also find
+    storage_backend.put(get_asset_key(f"{asset_ref.sha256}0"), b"other", "image/png")
+
+    def list_objects(prefix: str) -> None:
+        raise AssertionError(f"Listed {prefix} to find a single asset")
+
+    monkeypatch.setattr(storage_backend, "list_objects", list_objects)
+    stored_object = get_stored_asset(storage_backend, asset_ref.sha256)
+    assert stored_object is not None
+    assert stored_object.key == get_asset_key(asset_ref.sha256)
+    assert stored_object.size == len(b"content")
+    assert get_stored_asset(storage_backend, "0" * 64) is None
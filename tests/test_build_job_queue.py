@@ -0,0 +1,108 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Dict
+from typing import List
+
+import pytest
+
+from server.model.html_output_mode import HtmlOutputMode
+from server.utilities.build_job_queue import BuildJobQueue
+
+MODE = HtmlOutputMode.MINIFIED
+
+
+class FakeBuilds:
+    """Builds that run until the test finishes them, recording the order they start in."""
+
+    def __init__(self) -> None:
+        self.started: List[str] = []
+        self.finish_events: Dict[str, asyncio.Event] = {}
+
+    async def build(self, article: SimpleNamespace, output_mode: HtmlOutputMode, *, publish: bool) -> str:  # noqa: ARG002
+        self.started.append(article.name)
+        self.finish_events[article.name] = asyncio.Event()
+        await self.finish_events[article.name].wait()
+        return article.name
+
+    def finish(self, name: str) -> None:
+        self.finish_events[name].set()
+
+
+@pytest.fixture
+def fake_builds(monkeypatch: pytest.MonkeyPatch) -> FakeBuilds:
+    fake_builds = FakeBuilds()
+    monkeypatch.setattr(BuildJobQueue, "_BuildJobQueue__build", staticmethod(fake_builds.build))
+    return fake_builds
+
+
+def create_article(article_id: str, version: int) -> SimpleNamespace:
+    return SimpleNamespace(article_id=article_id, digest=str(version), name=f"{article_id}{version}")
+
+
+async def settle() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def test_builds_of_an_article_wait_without_taking_a_worker(fake_builds: FakeBuilds) -> None:
+    async def run() -> None:
+        queue = BuildJobQueue(worker_count=2)
+        await queue.start()
+        jobs = [queue.submit(create_article("a", version), MODE, publish=False) for version in range(3)]
+        other_job = queue.submit(create_article("b", 0), MODE, publish=False)
+        await settle()
+        # The second worker builds the other article instead of waiting for the first build of "a"
+        assert fake_builds.started == ["a0", "b0"]
+
+        fake_builds.finish("a0")
+        await settle()
+        assert fake_builds.started == ["a0", "b0", "a1"]
+        fake_builds.finish("a1")
+        await settle()
+        fake_builds.finish("a2")
+        fake_builds.finish("b0")
+        assert [(await queue.wait(job.job_id)).url for job in [*jobs, other_job]] == ["a0", "a1", "a2", "b0"]
+        await queue.stop()
+
+    asyncio.run(run())
+
+
+def test_held_article_is_not_built_again_until_released(fake_builds: FakeBuilds) -> None:
+    async def run() -> None:
+        queue = BuildJobQueue(worker_count=2)
+        await queue.start()
+        job = queue.submit(create_article("a", 0), MODE, publish=False)
+        waiter = asyncio.create_task(queue.wait(job.job_id, hold=True))
+        await settle()
+        queue.submit(create_article("a", 1), MODE, publish=False)
+        fake_builds.finish("a0")
+        await waiter
+
+        chunks = queue.iter_held("a", iter([b"zip"]))
+        await settle()
+        assert fake_builds.started == ["a0"]
+        assert list(chunks) == [b"zip"]
+        await settle()
+        assert fake_builds.started == ["a0", "a1"]
+        fake_builds.finish("a1")
+        await queue.stop()
+
+    asyncio.run(run())
+
+
+def test_cancelled_wait_does_not_hold_the_article(fake_builds: FakeBuilds) -> None:
+    async def run() -> None:
+        queue = BuildJobQueue(worker_count=1)
+        await queue.start()
+        job = queue.submit(create_article("a", 0), MODE, publish=False)
+        waiter = asyncio.create_task(queue.wait(job.job_id, hold=True))
+        await settle()
+        waiter.cancel()
+        queue.submit(create_article("a", 1), MODE, publish=False)
+        fake_builds.finish("a0")
+        await settle()
+        assert fake_builds.started == ["a0", "a1"]
+        fake_builds.finish("a1")
+        await queue.stop()
+
+    asyncio.run(run())
@@ -0,0 +1,37 @@
+from typing import Optional
+from typing import Tuple
+
+import pytest
+
+from server.utilities.byte_range import parse_byte_range
+
+
+@pytest.mark.parametrize(
+    ("range_header", "expected"),
+    [
+        ("bytes=0-99", (0, 99)),
+        ("bytes=10-19", (10, 19)),
+        ("bytes=990-", (990, 999)),
+        ("bytes=990-5000", (990, 999)),
+        ("bytes=-10", (990, 999)),
+        ("bytes=-5000", (0, 999)),
+        ("BYTES = 0-0", (0, 0)),
+        # Ignored, the whole object is sent
+        (None, None),
+        ("", None),
+        ("items=0-10", None),
+        ("bytes=0-10,20-30", None),
+        ("bytes=10-5", None),
+        ("bytes=-", None),
+        ("bytes=a-b", None),
+        ("bytes=0", None),
+    ],
+)
+def test_parse_byte_range(range_header: Optional[str], expected: Optional[Tuple[int, int]]) -> None:
+    assert parse_byte_range(range_header, 1000) == expected
+
+
+@pytest.mark.parametrize(("range_header", "size"), [("bytes=1000-", 1000), ("bytes=-0", 1000), ("bytes=-10", 0)])
+def test_unsatisfiable_ranges_raise(range_header: str, size: int) -> None:
+    with pytest.raises(ValueError, match="Unsatisfiable"):
+        parse_byte_range(range_header, size)
@@ -0,0 +1,117 @@
+from typing import Iterator
+from typing import Optional
+
+import pytest
+
+from server.model.ir.component_ir import ComponentIR
+from server.model.ir.layout_ir import LayoutIR
+from server.model.ir.page_ir import PageIR
+from server.model.script import script_processor
+from server.model.script.animation import animation_script_factory
+from server.model.script.animation.animation_runtime_builder import AnimationRuntimeBuilder
+from server.model.script.animation.animation_script_registry import AnimationScriptRegistry
+from server.model.script.animation.animation_script_registry import BUILT_IN_ANIMATIONS
+from server.model.script.animation.animation_scripts.animation_script import AnimationScript
+from server.model.script.animation.util.component_selector_rewriter import ComponentSelectorRewriter
+from server.model.script.animation_script_mode import AnimationScriptMode
+
+
+@pytest.mark.parametrize(
+    ("js", "expected"),
+    [
+        ('gsap.to("#__component__", {opacity: 1});', "gsap.to(selector, {opacity: 1});"),
+        ("gsap.to('#__component__', {opacity: 1});", "gsap.to(selector, {opacity: 1});"),
+        (
+            'document.getElementById("__component__").classList.add("on");',
+            'document.getElementById(selector.slice(1)).classList.add("on");',
+        ),
+        ('gsap.to("#__component__ img", {scale: 2});', 'gsap.to((selector + " img"), {scale: 2});'),
+        ("gsap.to(`#__component__ img`, {scale: 2});", "gsap.to(`#${selector.slice(1)} img`, {scale: 2});"),
+        # Quotes in comments do not start string literals
+        (
+            'gsap.to("#__component__", {x: "-100%"}); // don\'t move "#__other__"',
+            'gsap.to(selector, {x: "-100%"}); // don\'t move "#__other__"',
+        ),
+        ('gsap.to(".page", {opacity: 1});', 'gsap.to(".page", {opacity: 1});'),
+        # The placeholder as code cannot be rewritten
+        ("const __component__Timeline = gsap.timeline();", None),
+        ("gsap.to(`#${'__component__'}`, {opacity: 1});", None),
+        ('gsap.to("#__component__, {opacity: 1});', None),
+    ],
+)
+def test_rewrite(js: str, expected: Optional[str]) -> None:
+    assert ComponentSelectorRewriter.rewrite(js) == expected
+
+
+class BlinkAnimationScript(AnimationScript):
+    def get_enter_js(self, component_id: str) -> str:
+        return f'document.getElementById("{component_id}").classList.add("blink");'
+
+
+class CountAnimationScript(AnimationScript):
+    def get_enter_js(self, component_id: str) -> str:
+        return f"{component_id}_count += 1;"
+
+
+@pytest.fixture
+def plugin_animations(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setitem(BUILT_IN_ANIMATIONS, "blink", BlinkAnimationScript)
+    monkeypatch.setitem(BUILT_IN_ANIMATIONS, "count", CountAnimationScript)
+    monkeypatch.setattr(animation_script_factory, "ANIMATION_SCRIPT_REGISTRY", AnimationScriptRegistry())
+    AnimationRuntimeBuilder._AnimationRuntimeBuilder__get_animations_js.cache_clear()  # noqa: SLF001
+    AnimationRuntimeBuilder.build_runtime_js.cache_clear()
+    yield
+    AnimationRuntimeBuilder._AnimationRuntimeBuilder__get_animations_js.cache_clear()  # noqa: SLF001
+    AnimationRuntimeBuilder.build_runtime_js.cache_clear()
+
+
+def create_page(animation: str) -> PageIR:
+    component = ComponentIR(
+        id="1-1-1",
+        type="text",
+        position="center",
+        animation=animation,
+        content_html="<p>Text</p>",
+        image_data=None,
+        image_caption=None,
+        is_display_fullscreen=False,
+        html_data=None,
+        page_id="1",
+        frame_id="1",
+        frame_index=0,
+        is_first_frame=True,
+        starts_visible=False,
+        group_index=0,
+        end_length=1,
+    )
+    layout = LayoutIR(template="single", height_top=None, width_left=None, height_bottom=None, width_right=None)
+    return PageIR(
+        id="1",
+        pinnable=True,
+        layout=layout,
+        components=(component,),
+        groups=(("center", (component,)),),
+        first_frame_components=(component,),
+        pin_length=1,
+        asset_names=(),
+        digest="",
+    )
+
+
+@pytest.mark.usefixtures("plugin_animations")
+def test_runtime_substitutes_the_bare_component_id() -> None:
+    runtime_js = AnimationRuntimeBuilder.build_runtime_js()
+    assert 'document.getElementById(selector.slice(1)).classList.add("blink");' in runtime_js
+    assert "__component__" not in runtime_js
+
+
+@pytest.mark.usefixtures("plugin_animations")
+def test_pages_with_animations_missing_from_the_runtime_get_inline_scripts() -> None:
+    assert not AnimationRuntimeBuilder.supports("count")
+    assert "__component__" not in AnimationRuntimeBuilder.build_runtime_js()
+
+    string_builder = []
+    script_processor.ScriptProcessor(string_builder, AnimationScriptMode.COMPACT).process_page(create_page("count"))
+    page_js = "".join(string_builder)
+    assert "comp-1-1-1_count += 1;" in page_js
+    assert "registerScrollyPage" not in page_js
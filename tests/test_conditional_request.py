@@ -0,0 +1,24 @@
+from typing import Optional
+
+import pytest
+
+from server.utilities.conditional_request import is_not_modified
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "etag", "expected"),
+    [
+        ('"abc"', '"abc"', True),
+        ('"xyz", "abc"', '"abc"', True),
+        ("*", '"abc"', True),
+        # Weak comparison, as RFC 9110 requires for If-None-Match
+        ('W/"abc"', '"abc"', True),
+        ('"abc"', 'W/"abc"', True),
+        ('"abd"', '"abc"', False),
+        ('"abc-gzip"', '"abc"', False),
+        (None, '"abc"', False),
+        ("", '"abc"', False),
+    ],
+)
+def test_is_not_modified(if_none_match: Optional[str], etag: str, *, expected: bool) -> None:
+    assert is_not_modified(if_none_match, etag) is expected
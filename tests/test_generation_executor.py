@@ -0,0 +1,38 @@
+import logging
+
+import pytest
+
+from server.utilities import generation_executor
+from server.utilities.generation_executor import GenerationExecutor
+
+
+class FakeProcessPool:
+    def __init__(self, **_: object) -> None:
+        self.is_shut_down = False
+
+    def shutdown(self, **_: object) -> None:
+        self.is_shut_down = True
+
+
+def test_process_mode_warns_about_the_worker_local_metrics_and_cache(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setattr(generation_executor, "GENERATION_EXECUTOR", "process")
+    monkeypatch.setattr(generation_executor, "ProcessPoolExecutor", FakeProcessPool)
+    with caplog.at_level(logging.WARNING, logger=generation_executor.__name__):
+        GenerationExecutor.start()
+        GenerationExecutor.start()
+    GenerationExecutor.shutdown()
+
+    (record,) = caplog.records
+    assert "/metrics" in record.message
+    assert "page fragment cache" in record.message
+
+
+def test_thread_mode_starts_no_pool(monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+    monkeypatch.setattr(generation_executor, "GENERATION_EXECUTOR", "thread")
+    monkeypatch.setattr(generation_executor, "ProcessPoolExecutor", FakeProcessPool)
+    with caplog.at_level(logging.WARNING, logger=generation_executor.__name__):
+        GenerationExecutor.start()
+
+    assert not caplog.records
@@ -0,0 +1,48 @@
+import functools
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from server.benchmark.synthetic_article import generate_article_payload
+from server.model.html_output_mode import HtmlOutputMode
+from server.model.script.animation_script_mode import AnimationScriptMode
+from server.model.script.script_generator import ScriptGenerator
+from server.parser import process_pages
+from server.storage.local_storage_backend import LocalStorageBackend
+from server.utilities.article_lowering import parse_article_json
+
+# Generated before articles were lowered into the IR, so that any change to the output shows up here.
+# Run with UPDATE_GOLDEN=1 to record the output again after an intended change.
+GOLDEN_DIR = Path(__file__).parent / "golden"
+GOLDEN_FILES = {"index.html": "index.html", "styles.css": "css/styles.css", "animation.js": "js/animation.js"}
+
+
+@pytest.mark.parametrize("output_mode", list(HtmlOutputMode))
+@pytest.mark.parametrize("animation_mode", list(AnimationScriptMode))
+def test_process_pages_matches_golden_output(
+    storage_backend: LocalStorageBackend,
+    monkeypatch: pytest.MonkeyPatch,
+    animation_mode: AnimationScriptMode,
+    output_mode: HtmlOutputMode,
+) -> None:
+    monkeypatch.setattr(
+        ScriptGenerator, "generate_init", staticmethod(functools.partial(ScriptGenerator.generate_init, animation_mode))
+    )
+    monkeypatch.setattr(
+        ScriptGenerator,
+        "generate_page",
+        staticmethod(functools.partial(ScriptGenerator.generate_page, mode=animation_mode)),
+    )
+    payload = generate_article_payload(seed=0, pages=12, frames=3, components=2, pinnable_ratio=0.7)
+    article = parse_article_json(json.dumps(payload))
+    process_pages(article.article_id, article.pages, article.title, output_mode)
+
+    golden_dir = GOLDEN_DIR / f"{animation_mode.value}-{output_mode.value}"
+    for golden_name, key in GOLDEN_FILES.items():
+        output = storage_backend.get(f"{article.article_id}/{key}")
+        if os.getenv("UPDATE_GOLDEN"):
+            golden_dir.mkdir(parents=True, exist_ok=True)
+            (golden_dir / golden_name).write_bytes(output)
+        assert output == (golden_dir / golden_name).read_bytes(), f"{golden_dir.name}/{golden_name} changed"
@@ -0,0 +1,66 @@
+from typing import List
+
+import pytest
+
+from server.model.html_output_mode import HtmlOutputMode
+from server.utilities.html_serializer import serialize_html
+from server.utilities.html_serializer import serialize_html_fragments
+
+DOCUMENT = (
+    "<!DOCTYPE html><html><head><style> a  >  b { color: red } </style>"
+    "<script>if (a < b &amp;&amp; c) {\n  x();\n}</script></head><body>\n"
+    '  <div class="x">  Fish &amp; chips &lt;3 &#39;q&#39; &nbsp; </div>\n'
+    "<pre>  keep\n   this  </pre><textarea>  a\n b </textarea>"
+    "<p>  spaced   <b> bold </b>  text </p><span> a </span>  <span>b</span>"
+    '<img src="x.png"><br/></body></html>'
+)
+
+
+def split_every(text: str, size: int) -> List[str]:
+    return [text[index : index + size] for index in range(0, len(text), size)]
+
+
+def test_minified_output_collapses_whitespace_only_where_it_does_not_render() -> None:
+    assert serialize_html(DOCUMENT) == (
+        "<!DOCTYPE html><html><head><style> a  >  b { color: red } </style>"
+        "<script>if (a < b &amp;&amp; c) {\n  x();\n}</script></head><body>"
+        '<div class="x">Fish &amp; chips &lt;3 &#39;q&#39; &nbsp;</div>'
+        "<pre>  keep\n   this  </pre><textarea>  a\n b </textarea>"
+        "<p>  spaced   <b> bold </b>  text </p><span> a </span> <span>b</span>"
+        '<img src="x.png"><br/></body></html>'
+    )
+
+
+@pytest.mark.parametrize(
+    "markup",
+    [
+        "<p>Fish &amp; chips &lt;3 &#39;q&#39; &#x27;hex&#x27; &nbsp;&copy;</p>",
+        '<p title="a &amp; b &quot;c&quot;">x</p>',
+        "<pre>\n  line one\n\tline two  \n</pre>",
+        "<textarea>  keep  \n  me  </textarea>",
+        "<script>if (a < b && b > c) { document.write('</p>'); }</script>",
+        "<style>a > b , c ~ d { content: '  x  '; }</style>",
+        '<a href="#">  linked   text  </a>',
+    ],
+)
+@pytest.mark.parametrize("output_mode", list(HtmlOutputMode))
+def test_entities_and_whitespace_sensitive_content_are_kept_verbatim(markup: str, output_mode: HtmlOutputMode) -> None:
+    assert serialize_html(markup, output_mode).strip() == markup
+
+
+@pytest.mark.parametrize("output_mode", list(HtmlOutputMode))
+def test_output_does_not_depend_on_how_the_markup_is_split(output_mode: HtmlOutputMode) -> None:
+    expected = serialize_html(DOCUMENT, output_mode)
+    for size in (1, 7, 64):
+        assert "".join(serialize_html_fragments(split_every(DOCUMENT, size), output_mode)) == expected
+
+
+def test_minified_output_is_stable() -> None:
+    minified = serialize_html(DOCUMENT)
+    assert serialize_html(minified) == minified
+
+
+def test_pretty_output_indents_one_tag_per_line() -> None:
+    assert serialize_html("<div><span> a </span><pre> b </pre></div>", HtmlOutputMode.PRETTY) == (
+        "<div>\n <span>\n  a\n </span>\n <pre> b </pre>\n</div>\n"
+    )
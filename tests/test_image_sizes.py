@@ -0,0 +1,60 @@
+from typing import Optional
+
+import pytest
+
+from server.content_generator import get_image_sizes
+from server.model.ir.component_ir import ComponentIR
+from server.model.ir.layout_ir import LayoutIR
+
+
+def create_component(position: str, is_display_fullscreen: bool = False) -> ComponentIR:  # noqa: FBT001, FBT002
+    return ComponentIR(
+        id="1",
+        type="image",
+        position=position,
+        animation=None,
+        content_html=None,
+        image_data="image.png",
+        image_caption=None,
+        is_display_fullscreen=is_display_fullscreen,
+        html_data=None,
+        page_id="1",
+        frame_id="1",
+        frame_index=0,
+        is_first_frame=True,
+        starts_visible=False,
+        group_index=0,
+        end_length=0,
+    )
+
+
+def create_layout(template: str, width_left: Optional[str] = None, width_right: Optional[str] = None) -> LayoutIR:
+    return LayoutIR(
+        template=template, height_top=None, width_left=width_left, height_bottom=None, width_right=width_right
+    )
+
+
+@pytest.mark.parametrize(
+    ("position", "width_left", "width_right", "expected"),
+    [
+        ("left", None, None, "30vw"),
+        ("right", None, None, "30vw"),
+        ("left", "40%", "60%", "24vw"),
+        ("right", "40%", "60%", "36vw"),
+        ("left", "400px", None, "30vw"),
+    ],
+)
+def test_left_right_images_take_their_section_of_the_page(
+    position: str, width_left: Optional[str], width_right: Optional[str], expected: str
+) -> None:
+    layout = create_layout("left-right", width_left, width_right)
+    assert get_image_sizes(create_component(position), layout) == expected
+
+
+def test_centered_images_take_the_page_width() -> None:
+    assert get_image_sizes(create_component("center"), create_layout("single")) == "60vw"
+
+
+def test_fullscreen_images_take_the_viewport_width() -> None:
+    layout = create_layout("left-right")
+    assert get_image_sizes(create_component("left", is_display_fullscreen=True), layout) == "100vw"
@@ -0,0 +1,151 @@
+import copy
+from typing import Any
+from typing import Dict
+from typing import List
+
+import pytest
+
+from server.model.json_patch_operation import JsonPatchOperation
+from server.utilities.json_patch import apply_json_patch
+
+
+def patch(document: Any, operations: List[Dict[str, Any]]) -> Any:
+    return apply_json_patch(document, [JsonPatchOperation.model_validate(operation) for operation in operations])
+
+
+# RFC 6902 appendix A, all but A.13 which is not valid JSON
+@pytest.mark.parametrize(
+    ("document", "operations", "expected"),
+    [
+        pytest.param(
+            {"foo": "bar"},
+            [{"op": "add", "path": "/baz", "value": "qux"}],
+            {"baz": "qux", "foo": "bar"},
+            id="A.1 adding an object member",
+        ),
+        pytest.param(
+            {"foo": ["bar", "baz"]},
+            [{"op": "add", "path": "/foo/1", "value": "qux"}],
+            {"foo": ["bar", "qux", "baz"]},
+            id="A.2 adding an array element",
+        ),
+        pytest.param(
+            {"baz": "qux", "foo": "bar"},
+            [{"op": "remove", "path": "/baz"}],
+            {"foo": "bar"},
+            id="A.3 removing an object member",
+        ),
+        pytest.param(
+            {"foo": ["bar", "qux", "baz"]},
+            [{"op": "remove", "path": "/foo/1"}],
+            {"foo": ["bar", "baz"]},
+            id="A.4 removing an array element",
+        ),
+        pytest.param(
+            {"baz": "qux", "foo": "bar"},
+            [{"op": "replace", "path": "/baz", "value": "boo"}],
+            {"baz": "boo", "foo": "bar"},
+            id="A.5 replacing a value",
+        ),
+        pytest.param(
+            {"foo": {"bar": "baz", "waldo": "fred"}, "qux": {"corge": "grault"}},
+            [{"op": "move", "from": "/foo/waldo", "path": "/qux/thud"}],
+            {"foo": {"bar": "baz"}, "qux": {"corge": "grault", "thud": "fred"}},
+            id="A.6 moving a value",
+        ),
+        pytest.param(
+            {"foo": ["all", "grass", "cows", "eat"]},
+            [{"op": "move", "from": "/foo/1", "path": "/foo/3"}],
+            {"foo": ["all", "cows", "eat", "grass"]},
+            id="A.7 moving an array element",
+        ),
+        pytest.param(
+            {"baz": "qux", "foo": ["a", 2, "c"]},
+            [{"op": "test", "path": "/baz", "value": "qux"}, {"op": "test", "path": "/foo/1", "value": 2}],
+            {"baz": "qux", "foo": ["a", 2, "c"]},
+            id="A.8 testing a value: success",
+        ),
+        pytest.param(
+            {"foo": "bar"},
+            [{"op": "add", "path": "/child", "value": {"grandchild": {}}}],
+            {"foo": "bar", "child": {"grandchild": {}}},
+            id="A.10 adding a nested member object",
+        ),
+        pytest.param(
+            {"foo": "bar"},
+            [{"op": "add", "path": "/baz", "value": "qux", "xyz": 123}],
+            {"foo": "bar", "baz": "qux"},
+            id="A.11 ignoring unrecognized elements",
+        ),
+        pytest.param(
+            {"/": 9, "~1": 10},
+            [{"op": "test", "path": "/~01", "value": 10}],
+            {"/": 9, "~1": 10},
+            id="A.14 ~ escape ordering",
+        ),
+        pytest.param(
+            {"foo": ["bar"]},
+            [{"op": "add", "path": "/foo/-", "value": ["abc", "def"]}],
+            {"foo": ["bar", ["abc", "def"]]},
+            id="A.16 adding an array value",
+        ),
+    ],
+)
+def test_rfc_6902_examples(document: Any, operations: List[Dict[str, Any]], expected: Any) -> None:
+    assert patch(document, operations) == expected
+
+
+@pytest.mark.parametrize(
+    ("document", "operations"),
+    [
+        pytest.param(
+            {"baz": "qux"},
+            [{"op": "test", "path": "/baz", "value": "bar"}],
+            id="A.9 testing a value: error",
+        ),
+        pytest.param(
+            {"foo": "bar"},
+            [{"op": "add", "path": "/baz/bat", "value": "qux"}],
+            id="A.12 adding to a nonexistent target",
+        ),
+        pytest.param(
+            {"/": 9, "~1": 10},
+            [{"op": "test", "path": "/~01", "value": "10"}],
+            id="A.15 comparing strings and numbers",
+        ),
+        pytest.param({"foo": "bar"}, [{"op": "remove", "path": "/missing"}], id="removing a missing member"),
+        pytest.param({"foo": [1]}, [{"op": "replace", "path": "/foo/1", "value": 2}], id="replacing past the end"),
+        pytest.param({"foo": {}}, [{"op": "move", "from": "/foo", "path": "/foo/bar"}], id="moving into a child"),
+        pytest.param({"foo": 1}, [{"op": "add", "path": "/bar"}], id="missing value"),
+        pytest.param({"flag": True}, [{"op": "test", "path": "/flag", "value": 1}], id="true is not 1"),
+    ],
+)
+def test_invalid_patches_are_rejected(document: Any, operations: List[Dict[str, Any]]) -> None:
+    with pytest.raises(ValueError, match=r"Operation \d"):
+        patch(document, operations)
+
+
+def test_a_failed_patch_leaves_the_document_unchanged() -> None:
+    document = {"title": "before", "pages": [{"id": "1"}, {"id": "2"}]}
+    original = copy.deepcopy(document)
+    with pytest.raises(ValueError, match="does not match"):
+        patch(
+            document,
+            [
+                {"op": "replace", "path": "/title", "value": "after"},
+                {"op": "remove", "path": "/pages/0"},
+                {"op": "add", "path": "/pages/-", "value": {"id": "3"}},
+                {"op": "test", "path": "/title", "value": "before"},
+            ],
+        )
+    assert document == original
+
+
+def test_a_successful_patch_returns_a_copy() -> None:
+    document = {"title": "before"}
+    assert patch(document, [{"op": "replace", "path": "/title", "value": "after"}]) == {"title": "after"}
+    assert document == {"title": "before"}
+
+
+def test_replacing_the_whole_document() -> None:
+    assert patch({"foo": 1}, [{"op": "replace", "path": "", "value": [1, 2]}]) == [1, 2]
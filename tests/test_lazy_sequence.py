@@ -0,0 +1,93 @@
+import gc
+import threading
+import weakref
+from typing import Iterator
+from typing import List
+
+import pytest
+
+from server.utilities.lazy_sequence import LazySequence
+
+
+class Item:
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+
+def produce(count: int, produced: List[int]) -> Iterator[Item]:
+    for value in range(count):
+        produced.append(value)
+        yield Item(value)
+
+
+def test_every_consumer_reads_every_item_once_produced() -> None:
+    produced: List[int] = []
+    first, second, third = LazySequence(produce(5, produced)).split(3)
+    assert [item.value for item in first] == [0, 1, 2, 3, 4]
+    assert [item.value for item in second] == [0, 1, 2, 3, 4]
+    assert [item.value for item in third] == [0, 1, 2, 3, 4]
+    assert produced == [0, 1, 2, 3, 4]
+
+
+def test_items_are_produced_on_demand() -> None:
+    produced: List[int] = []
+    first, _ = LazySequence(produce(5, produced)).split(2)
+    next(first)
+    next(first)
+    assert produced == [0, 1]
+
+
+def test_items_are_released_once_every_consumer_has_read_them() -> None:
+    sequence = LazySequence(Item(value) for value in range(4))
+    first, second = sequence.split(2)
+    references = []
+    for item in first:
+        references.append(weakref.ref(item))
+    del item
+    gc.collect()
+    # Still waiting for the second consumer
+    assert all(reference() is not None for reference in references)
+
+    next(second)
+    next(second)
+    gc.collect()
+    assert [reference() is None for reference in references] == [True, True, False, False]
+
+
+def test_closed_consumer_releases_its_items() -> None:
+    sequence = LazySequence(Item(value) for value in range(3))
+    first, second = sequence.split(2)
+    next(first)
+    reference = weakref.ref(next(first))
+    next(second)
+    gc.collect()
+    assert reference() is not None
+
+    second.close()
+    gc.collect()
+    assert reference() is None
+
+
+def test_split_after_iteration_is_rejected() -> None:
+    sequence = LazySequence(iter(range(3)))
+    (first,) = sequence.split(1)
+    next(first)
+    with pytest.raises(RuntimeError):
+        sequence.split(1)
+
+
+def test_concurrent_consumers_read_every_item_in_order() -> None:
+    produced: List[int] = []
+    consumers = LazySequence(produce(1000, produced)).split(4)
+    results: List[List[int]] = [[] for _ in consumers]
+
+    def consume(index: int) -> None:
+        results[index].extend(item.value for item in consumers[index])
+
+    threads = [threading.Thread(target=consume, args=(index,)) for index in range(len(consumers))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(result == list(range(1000)) for result in results)
+    assert produced == list(range(1000))
@@ -0,0 +1,62 @@
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from server.storage.local_storage_backend import LocalStorageBackend
+
+CONTENT = [bytes([value]) * 4096 for value in range(16)]
+WRITERS = 4
+
+
+def test_concurrent_writes_of_the_same_key_do_not_interfere(tmp_path: Path) -> None:
+    storage_backend = LocalStorageBackend(tmp_path)
+    barrier = threading.Barrier(WRITERS)
+
+    def fragments() -> Iterator[bytes]:
+        for index, fragment in enumerate(CONTENT):
+            yield fragment
+            # Every writer has its file open and partly written before any of them finishes
+            if index == 0:
+                barrier.wait()
+
+    def write(index: int) -> None:
+        if index % 2:
+            storage_backend.put_fragments("assets/key", fragments(), "image/png")
+        else:
+            barrier.wait()
+            storage_backend.put_stream("assets/key", io.BytesIO(b"".join(CONTENT)), len(CONTENT) * 4096, "image/png")
+
+    with ThreadPoolExecutor(WRITERS) as executor:
+        list(executor.map(write, range(WRITERS)))
+
+    assert storage_backend.get("assets/key") == b"".join(CONTENT)
+    assert list((tmp_path / "assets").glob("*.partial")) == []
+
+
+def test_failed_write_leaves_no_partial_file(tmp_path: Path) -> None:
+    storage_backend = LocalStorageBackend(tmp_path)
+
+    def fragments() -> Iterator[bytes]:
+        yield b"partial"
+        raise RuntimeError("Generation failed")
+
+    with pytest.raises(RuntimeError):
+        storage_backend.put_fragments("assets/key", fragments(), "image/png")
+    assert list((tmp_path / "assets").iterdir()) == []
+
+
+def test_content_type_is_kept_for_keys_without_extension(tmp_path: Path) -> None:
+    storage_backend = LocalStorageBackend(tmp_path)
+    storage_backend.put_stream("assets/0123", io.BytesIO(b"\x89PNG"), 4, "image/png")
+    storage_backend.put_fragments("article/css/styles.css", [b"p {}"], "text/css")
+
+    assert storage_backend.stat("assets/0123").content_type == "image/png"
+    assert storage_backend.stat("article/css/styles.css").content_type == "text/css"
+    assert [stored_object.key for stored_object in storage_backend.list_objects("assets/")] == ["assets/0123"]
+
+    storage_backend.delete("assets/0123")
+    assert list((tmp_path / "assets").iterdir()) == []
@@ -0,0 +1,91 @@
+import json
+import threading
+import time
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+import pytest
+
+from server import parser
+from server.benchmark.synthetic_article import generate_article_payload
+from server.model.ir.page_ir import PageIR
+from server.model.page_fragment import PageFragment
+from server.storage.local_storage_backend import LocalStorageBackend
+from server.utilities.article_lowering import parse_article_json
+from server.utilities.precompression import decompress
+from server.utilities.precompression import get_precompress_encodings
+from server.utilities.precompression import get_precompressed_key
+from server.utilities.precompression import get_precompressed_keys
+
+
+class RecordingStorageBackend(LocalStorageBackend):
+    """Records when each streamed file sends its first chunk, and when files are deleted."""
+
+    def __init__(self, events: List[Tuple[str, str]], **kwargs: object) -> None:
+        super().__init__(**kwargs)
+        self.events = events
+        self.lock = threading.Lock()
+
+    def put_fragments(self, key: str, fragments: Iterable[bytes], content_type: str) -> None:
+        super().put_fragments(key, self.__record(key, fragments), content_type)
+
+    def delete(self, key: str) -> None:
+        super().delete(key)
+        with self.lock:
+            self.events.append(("delete", key))
+
+    def __record(self, key: str, fragments: Iterable[bytes]) -> Iterator[bytes]:
+        for index, fragment in enumerate(fragments):
+            if index == 0:
+                with self.lock:
+                    self.events.append(("upload", key))
+            yield fragment
+
+
+def test_uploads_start_before_the_last_page_is_rendered(
+    storage_backend: LocalStorageBackend, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    events: List[Tuple[str, str]] = []
+    recording_backend = RecordingStorageBackend(events, root_dir=storage_backend.root_dir)
+    monkeypatch.setattr(parser.StorageBackendFactory, "get_storage_backend", lambda: recording_backend)
+    render_page = parser.render_page
+
+    def record_render(page: PageIR, *args: object) -> PageFragment:
+        # Rendering dominates on real articles, the streams keep up with it instead of racing ahead
+        time.sleep(0.005)
+        fragment = render_page(page, *args)
+        with recording_backend.lock:
+            events.append(("render", page.id))
+        return fragment
+
+    monkeypatch.setattr(parser, "render_page", record_render)
+    article = parse_article_json(json.dumps(generate_article_payload(seed=3, pages=60, frames=3)))
+    parser.process_pages(article.article_id, article.pages, article.title)
+
+    renders = [index for index, (event, _) in enumerate(events) if event == "render"]
+    uploads = [index for index, (event, _) in enumerate(events) if event == "upload"]
+    assert len(renders) == len(article.pages)
+    # index.html and animation.js are sent while later pages render, only styles.css waits for every page
+    assert uploads[0] < renders[-1]
+
+
+def test_compressed_copies_of_the_previous_build_are_removed_before_the_originals_change(
+    storage_backend: LocalStorageBackend, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    events: List[Tuple[str, str]] = []
+    recording_backend = RecordingStorageBackend(events, root_dir=storage_backend.root_dir)
+    monkeypatch.setattr(parser.StorageBackendFactory, "get_storage_backend", lambda: recording_backend)
+    article = parse_article_json(json.dumps(generate_article_payload(seed=1, pages=3, frames=2)))
+    key = f"{article.article_id}/index.html"
+    for stale_key in get_precompressed_keys(key):
+        recording_backend.put(stale_key, b"previous build", "text/html")
+
+    parser.process_pages(article.article_id, article.pages, article.title)
+
+    first_upload = events.index(("upload", key))
+    assert all(events.index(("delete", stale_key)) < first_upload for stale_key in get_precompressed_keys(key))
+    original = recording_backend.get(key)
+    for encoding in get_precompress_encodings():
+        assert decompress(recording_backend.get(get_precompressed_key(key, encoding)), encoding) == original